@@ -5,6 +5,7 @@ Usage:
     python scripts/convert_meeting.py 121
     python scripts/convert_meeting.py 121 --no-transcript
     python scripts/convert_meeting.py 121 --parallel 4
+    python scripts/convert_meeting.py 121 --inline-materials --blob-store ~/.cache/ietf2vcon/blobs
 """
 
 import argparse
@@ -16,31 +17,28 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from ietf2vcon.blob_store import DEFAULT_BLOB_STORE_TTL
 from ietf2vcon.converter import ConversionOptions, IETFSessionConverter
-from ietf2vcon.datatracker import DataTrackerClient
+from ietf2vcon.datatracker import BULK_PREFETCH_MIN_GROUPS, DataTrackerClient
+from ietf2vcon.file_links import LINK_STRATEGIES
 
 console = Console()
 
 
-def get_all_groups(meeting_number: int) -> list[str]:
+def get_all_groups(client: DataTrackerClient, meeting_number: int) -> list[str]:
     """Get all unique working group acronyms for a meeting."""
-    client = DataTrackerClient()
-    try:
-        sessions = client.get_meeting_sessions(meeting_number)
-        groups = sorted(set(s.group_acronym for s in sessions))
-        return groups
-    finally:
-        client.close()
+    sessions = client.get_meeting_sessions(meeting_number)
+    groups = sorted(set(s.group_acronym for s in sessions))
+    return groups
 
 
 def convert_group(
+    converter: IETFSessionConverter,
     meeting_number: int,
     group: str,
-    options: ConversionOptions,
 ) -> tuple[str, bool, str]:
     """Convert a single group's session. Returns (group, success, message)."""
     try:
-        converter = IETFSessionConverter(options)
         result = converter.convert_session(meeting_number, group)
 
         if result.errors:
@@ -73,6 +71,35 @@ def main():
         action="store_true",
         help="Skip video",
     )
+    parser.add_argument(
+        "--inline-materials",
+        action="store_true",
+        help="Download and embed materials inline",
+    )
+    parser.add_argument(
+        "--rsync-mirror",
+        type=Path,
+        help="Local rsync mirror root (checked before HTTP for materials)",
+    )
+    parser.add_argument(
+        "--mirror-link",
+        choices=sorted(LINK_STRATEGIES),
+        default="auto",
+        help="How mirror and blob store files are placed in the output directory "
+             "(default: auto)",
+    )
+    parser.add_argument(
+        "--blob-store",
+        type=Path,
+        help="Content-addressed material store shared across meetings and runs",
+    )
+    parser.add_argument(
+        "--blob-store-ttl",
+        type=float,
+        default=DEFAULT_BLOB_STORE_TTL,
+        help="Seconds a stored material fetched by a revision-less URL is reused "
+             f"(default: {DEFAULT_BLOB_STORE_TTL:.0f})",
+    )
     parser.add_argument(
         "--parallel",
         type=int,
@@ -89,60 +116,76 @@ def main():
 
     console.print(f"\n[bold]Converting IETF {args.meeting} to vCon[/bold]\n")
 
-    # Get groups to convert
-    if args.groups:
-        groups = args.groups
-        console.print(f"Converting {len(groups)} specified groups")
-    else:
-        console.print("Fetching session list...")
-        groups = get_all_groups(args.meeting)
-        console.print(f"Found [cyan]{len(groups)}[/cyan] working groups\n")
-
-    # Configure options
-    options = ConversionOptions(
-        include_video=not args.no_video,
-        include_transcript=not args.no_transcript,
-        include_chat=False,  # Skip chat by default for batch
-        output_dir=args.output_dir,
-    )
-
-    # Convert sessions
-    results = []
-
-    if args.parallel > 1:
-        # Parallel conversion
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Converting...", total=len(groups))
-
-            with ThreadPoolExecutor(max_workers=args.parallel) as executor:
-                futures = {
-                    executor.submit(convert_group, args.meeting, g, options): g
-                    for g in groups
-                }
-
-                for future in as_completed(futures):
-                    group = futures[future]
-                    result = future.result()
-                    results.append(result)
-                    progress.update(task, advance=1, description=f"Converted {group}")
-    else:
-        # Sequential conversion
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Converting...", total=len(groups))
-
-            for group in groups:
-                progress.update(task, description=f"Converting {group}...")
-                result = convert_group(args.meeting, group, options)
-                results.append(result)
-                progress.update(task, advance=1)
+    # One client (and connection pool) shared by every conversion
+    client = DataTrackerClient(max_connections=max(20, args.parallel * 4))
+    try:
+        # Get groups to convert
+        if args.groups:
+            groups = args.groups
+            console.print(f"Converting {len(groups)} specified groups")
+        else:
+            console.print("Fetching session list...")
+            groups = get_all_groups(client, args.meeting)
+            console.print(f"Found [cyan]{len(groups)}[/cyan] working groups\n")
+
+        # Load every group's materials and chairs in bulk before converting,
+        # unless only a few --groups are converted
+        if groups and (not args.groups or len(groups) >= BULK_PREFETCH_MIN_GROUPS):
+            client.get_meeting_materials(args.meeting)
+            client.prefetch_group_chairs()
+
+        # Configure options
+        options = ConversionOptions(
+            include_video=not args.no_video,
+            include_transcript=not args.no_transcript,
+            inline_materials=args.inline_materials,
+            include_chat=False,  # Skip chat by default for batch
+            output_dir=args.output_dir,
+            rsync_mirror_dir=args.rsync_mirror,
+            mirror_link_strategy=args.mirror_link,
+            blob_store_dir=args.blob_store,
+            blob_store_ttl=args.blob_store_ttl,
+        )
+        with IETFSessionConverter(options, datatracker=client) as converter:
+            # Convert sessions
+            results = []
+
+            if args.parallel > 1:
+                # Parallel conversion
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                ) as progress:
+                    task = progress.add_task("Converting...", total=len(groups))
+
+                    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+                        futures = {
+                            executor.submit(convert_group, converter, args.meeting, g): g
+                            for g in groups
+                        }
+
+                        for future in as_completed(futures):
+                            group = futures[future]
+                            result = future.result()
+                            results.append(result)
+                            progress.update(task, advance=1, description=f"Converted {group}")
+            else:
+                # Sequential conversion
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                ) as progress:
+                    task = progress.add_task("Converting...", total=len(groups))
+
+                    for group in groups:
+                        progress.update(task, description=f"Converting {group}...")
+                        result = convert_group(converter, args.meeting, group)
+                        results.append(result)
+                        progress.update(task, advance=1)
+    finally:
+        client.close()
 
     # Display results
     console.print("\n")
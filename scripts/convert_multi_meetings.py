@@ -5,6 +5,7 @@ Usage:
     python scripts/convert_multi_meetings.py 110 124
     python scripts/convert_multi_meetings.py 110 124 --parallel 4
     python scripts/convert_multi_meetings.py 110 124 --no-transcript
+    python scripts/convert_multi_meetings.py 110 124 --inline-materials --blob-store ./blobs
 """
 
 import argparse
@@ -24,15 +25,38 @@ def convert_meeting(
     output_dir: Path,
     parallel: int,
     include_transcript: bool,
+    **material_options,
 ) -> tuple[int, int, int, list[str]]:
-    """Convert a single meeting. Returns (success, failed, skipped, errors)."""
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    """Convert a single meeting. Returns (success, failed, skipped, errors).
 
-    from ietf2vcon.converter import ConversionOptions, IETFSessionConverter
+    ``material_options`` are passed on to ConversionOptions (inline
+    materials, rsync mirror, blob store); one blob store shared by every
+    meeting keeps each material downloaded once for the whole backfill.
+    """
     from ietf2vcon.datatracker import DataTrackerClient
 
+    # One client (and connection pool) shared by every group of the meeting
+    client = DataTrackerClient(max_connections=max(20, parallel * 4))
+    try:
+        return _convert_groups(
+            client, meeting_number, output_dir, parallel, include_transcript, **material_options
+        )
+    finally:
+        client.close()
+
+
+def _convert_groups(
+    client,
+    meeting_number: int,
+    output_dir: Path,
+    parallel: int,
+    include_transcript: bool,
+    **material_options,
+) -> tuple[int, int, int, list[str]]:
+    """Convert every group of a meeting using a shared Datatracker client."""
+    from ietf2vcon.converter import ConversionOptions, IETFSessionConverter
+
     # Get all groups for this meeting
-    client = DataTrackerClient()
     try:
         sessions = client.get_meeting_sessions(meeting_number)
         if not sessions:
@@ -40,8 +64,11 @@ def convert_meeting(
         groups = sorted(set(s.group_acronym for s in sessions))
     except Exception as e:
         return 0, 0, 0, [f"Failed to fetch sessions: {e}"]
-    finally:
-        client.close()
+
+    # Load every group's materials and chairs in bulk before converting;
+    # the chair roster is cached process-wide, so later meetings reuse it
+    client.get_meeting_materials(meeting_number)
+    client.prefetch_group_chairs()
 
     # Configure options
     meeting_output_dir = output_dir / f"ietf{meeting_number}"
@@ -52,12 +79,25 @@ def convert_meeting(
         include_transcript=include_transcript,
         include_chat=False,
         output_dir=meeting_output_dir,
+        **material_options,
     )
 
+    with IETFSessionConverter(options, datatracker=client) as converter:
+        return _run_groups(converter, meeting_number, groups, parallel)
+
+
+def _run_groups(
+    converter,
+    meeting_number: int,
+    groups: list[str],
+    parallel: int,
+) -> tuple[int, int, int, list[str]]:
+    """Convert the given groups with one converter."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     def convert_group(group: str) -> tuple[str, bool, str]:
         """Convert a single group's session."""
         try:
-            converter = IETFSessionConverter(options)
             result = converter.convert_session(meeting_number, group)
             if result.errors:
                 return (group, False, result.errors[0])
@@ -98,6 +138,9 @@ def convert_meeting(
 
 
 def main():
+    from ietf2vcon.blob_store import DEFAULT_BLOB_STORE_TTL
+    from ietf2vcon.file_links import LINK_STRATEGIES
+
     parser = argparse.ArgumentParser(
         description="Convert multiple IETF meetings to vCon format"
     )
@@ -133,6 +176,35 @@ def main():
         type=int,
         help="Resume from this meeting number (skip earlier ones)",
     )
+    parser.add_argument(
+        "--inline-materials",
+        action="store_true",
+        help="Download and embed materials inline",
+    )
+    parser.add_argument(
+        "--rsync-mirror",
+        type=Path,
+        help="Local rsync mirror root (checked before HTTP for materials)",
+    )
+    parser.add_argument(
+        "--mirror-link",
+        choices=sorted(LINK_STRATEGIES),
+        default="auto",
+        help="How mirror and blob store files are placed in the output directory "
+             "(default: auto)",
+    )
+    parser.add_argument(
+        "--blob-store",
+        type=Path,
+        help="Content-addressed material store shared across meetings and runs",
+    )
+    parser.add_argument(
+        "--blob-store-ttl",
+        type=float,
+        default=DEFAULT_BLOB_STORE_TTL,
+        help="Seconds a stored material fetched by a revision-less URL is reused "
+             f"(default: {DEFAULT_BLOB_STORE_TTL:.0f})",
+    )
     args = parser.parse_args()
 
     meetings = list(range(args.start_meeting, args.end_meeting + 1))
@@ -165,6 +237,11 @@ def main():
             args.output_dir,
             args.parallel,
             not args.no_transcript,
+            inline_materials=args.inline_materials,
+            rsync_mirror_dir=args.rsync_mirror,
+            mirror_link_strategy=args.mirror_link,
+            blob_store_dir=args.blob_store,
+            blob_store_ttl=args.blob_store_ttl,
         )
         meeting_time = time.time() - meeting_start
 
@@ -0,0 +1,416 @@
+"""Async IETF Datatracker API client.
+
+Mirrors the method surface of :class:`~ietf2vcon.datatracker.DataTrackerClient`
+on top of ``httpx.AsyncClient``, so one process can resolve metadata for a
+whole meeting's sessions concurrently instead of running one thread per
+group. Requests are bounded by a semaphore and share a single connection
+pool, using HTTP/2 when the optional ``h2`` package is installed.
+"""
+
+import asyncio
+import importlib.util
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from .datatracker import BASE_URL, PAGE_SIZE, _DataTrackerBase, _resource_memo
+from .http_cache import ResourceMemo, ResponseCache
+from .models import IETFMaterial, IETFMeeting, IETFPerson, IETFSession
+from .ratelimit import async_rate_limit_hooks
+from .retry import http_retry
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDataTrackerClient(_DataTrackerBase):
+    """Async client for the IETF Datatracker API.
+
+    Args:
+        timeout: HTTP timeout in seconds
+        max_concurrency: Maximum number of requests in flight at once
+        http2: Use HTTP/2 if the ``h2`` package is available
+        cache: Optional on-disk response cache used by every API request
+        memo: In-process memo for resource URIs (defaults to the
+            process-wide memo shared with DataTrackerClient)
+        transport: Optional custom httpx transport (e.g. for testing)
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_concurrency: int = 10,
+        http2: bool = True,
+        cache: ResponseCache | None = None,
+        memo: ResourceMemo | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.debug(
+                "h2 not installed, using HTTP/1.1. "
+                "Install with: pip install ietf2vcon[http2]"
+            )
+            http2 = False
+
+        self.cache = cache
+        self.memo = memo if memo is not None else _resource_memo
+        self.client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            follow_redirects=True,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            transport=transport,
+            event_hooks=async_rate_limit_hooks(),
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._schedules: dict[int, dict[str, dict[str, Any]]] = {}
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def _single_flight(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory once for concurrent callers awaiting the same key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await task
+
+    async def _get(self, url: str, params: dict | None = None) -> dict[str, Any]:
+        """Make a GET request, answering from the response cache if possible."""
+        if self.cache is None:
+            return (await self._fetch(url, params)).json()
+
+        body, cached = self._lookup_cache(url, params)
+        if body is not None:
+            return body
+
+        headers = self.cache.conditional_headers(cached) if cached else None
+        response = await self._fetch(url, params, headers=headers)
+        return self._update_cache(url, params, response, cached)
+
+    @http_retry()
+    async def _fetch(
+        self, url: str, params: dict | None = None, headers: dict | None = None
+    ) -> httpx.Response:
+        """Make a GET request bounded by the semaphore, retrying transient failures."""
+        async with self._semaphore:
+            response = await self.client.get(url, params=params, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    async def _get_paginated(
+        self, url: str, params: dict | None = None
+    ) -> list[dict[str, Any]]:
+        """Get all results from a paginated API endpoint.
+
+        The first page reports ``total_count``; the remaining pages are then
+        requested concurrently by offset and returned in order. Responses
+        without a total are followed serially via ``meta.next``.
+        """
+        params = dict(params or {})
+        params["limit"] = PAGE_SIZE
+
+        first = await self._get(url, params)
+        results = list(first.get("objects", []))
+        meta = first.get("meta", {})
+        next_url = meta.get("next")
+        total = meta.get("total_count")
+        page_size = meta.get("limit") or PAGE_SIZE
+
+        if next_url and total is None:
+            while next_url:
+                page = await self._get(next_url)  # params are in the URL now
+                results.extend(page.get("objects", []))
+                next_url = page.get("meta", {}).get("next")
+        elif next_url and total > len(results):
+            pages = await asyncio.gather(
+                *(
+                    self._get(url, {**params, "offset": offset})
+                    for offset in range(len(results), total, page_size)
+                )
+            )
+            for page in pages:
+                results.extend(page.get("objects", []))
+
+        return results
+
+    async def _get_resource(self, uri: str) -> dict[str, Any]:
+        """Dereference a resource URI through the shared memo."""
+        path = uri.removeprefix(BASE_URL)
+        cached = self.memo.get(path)
+        if cached is not None:
+            return cached
+
+        async def load():
+            data = await self._get(path)
+            self.memo.put(path, data)
+            return data
+
+        return await self._single_flight(path, load)
+
+    async def _get_resources(
+        self,
+        list_url: str,
+        uris: list[str],
+        key_field: str = "id",
+        chunk_size: int = 100,
+    ) -> dict[str, dict[str, Any]]:
+        """Dereference many resource URIs of one type in concurrent batched queries."""
+        resources: dict[str, dict[str, Any]] = {}
+        missing: dict[str, str] = {}
+        for uri in dict.fromkeys(u.removeprefix(BASE_URL) for u in uris if u):
+            cached = self.memo.get(uri)
+            if cached is not None:
+                resources[uri] = cached
+            elif key := self._uri_id(uri):
+                missing[key] = uri
+
+        keys = list(missing)
+        chunks = await asyncio.gather(
+            *(
+                self._get_paginated(
+                    list_url, {f"{key_field}__in": ",".join(keys[i:i + chunk_size])}
+                )
+                for i in range(0, len(keys), chunk_size)
+            )
+        )
+        for objects in chunks:
+            for obj in objects:
+                uri = obj.get("resource_uri") or missing.get(str(obj.get(key_field)))
+                if not uri:
+                    continue
+                self.memo.put(uri, obj)
+                resources[uri] = obj
+
+        return resources
+
+    async def _get_meeting_data(self, meeting_number: int) -> dict[str, Any] | None:
+        """Get the raw meeting resource for a meeting number."""
+        data = await self._get("/api/v1/meeting/meeting/", {"number": meeting_number})
+        objects = data.get("objects", [])
+        return objects[0] if objects else None
+
+    async def get_meeting(self, meeting_number: int) -> IETFMeeting | None:
+        """Get metadata for an IETF meeting by number."""
+        try:
+            meeting = await self._get_meeting_data(meeting_number)
+            if not meeting:
+                return None
+            return self._build_meeting(meeting_number, meeting)
+        except Exception as e:
+            logger.error(f"Failed to get meeting {meeting_number}: {e}")
+            return None
+
+    async def get_meeting_schedule(self, meeting_number: int) -> dict[str, dict[str, Any]]:
+        """Get the scheduled time and room of every session at a meeting.
+
+        Assignments, timeslots and rooms are fetched concurrently and joined
+        in memory. Concurrent callers share one load, and the result is
+        cached on the client.
+        """
+        if meeting_number in self._schedules:
+            return self._schedules[meeting_number]
+
+        async def load():
+            meeting = await self._get_meeting_data(meeting_number)
+            assignments, timeslots, rooms = await asyncio.gather(
+                self._get_paginated(
+                    "/api/v1/meeting/schedtimesessassignment/",
+                    self._assignment_params(meeting_number, meeting),
+                ),
+                self._get_paginated(
+                    "/api/v1/meeting/timeslot/", {"meeting__number": meeting_number}
+                ),
+                self._get_paginated(
+                    "/api/v1/meeting/room/", {"meeting__number": meeting_number}
+                ),
+            )
+            schedule = self._join_schedule(assignments, timeslots, rooms)
+            self._schedules[meeting_number] = schedule
+            return schedule
+
+        try:
+            return await self._single_flight(f"schedule:{meeting_number}", load)
+        except Exception as e:
+            logger.error(f"Failed to get schedule for meeting {meeting_number}: {e}")
+            return {}
+
+    async def get_group_sessions(
+        self, meeting_number: int, group_acronym: str
+    ) -> list[IETFSession]:
+        """Get sessions for a specific working group at a meeting."""
+        sessions = []
+        try:
+            data = await self._get_paginated(
+                "/api/v1/meeting/session/",
+                {
+                    "meeting__number": meeting_number,
+                    "group__acronym": group_acronym,
+                },
+            )
+            if not data:
+                return []
+
+            group_uri = data[0].get("group")
+            schedule, group = await asyncio.gather(
+                self.get_meeting_schedule(meeting_number),
+                self._get_resource(group_uri) if group_uri else asyncio.sleep(0, {}),
+                return_exceptions=True,
+            )
+            if isinstance(schedule, BaseException):
+                schedule = {}
+            group_name = group.get("name") if isinstance(group, dict) else None
+
+            for session_data in data:
+                sessions.append(
+                    self._build_session(
+                        meeting_number, group_acronym, session_data, schedule, group_name
+                    )
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to get sessions for {group_acronym} at {meeting_number}: {e}")
+
+        return sessions
+
+    async def get_sessions_for_groups(
+        self, meeting_number: int, group_acronyms: list[str]
+    ) -> dict[str, list[IETFSession]]:
+        """Resolve the sessions of many groups at a meeting concurrently.
+
+        Args:
+            meeting_number: IETF meeting number
+            group_acronyms: Working group acronyms to resolve
+
+        Returns:
+            Dictionary mapping group acronym to its sessions
+        """
+        results = await asyncio.gather(
+            *(self.get_group_sessions(meeting_number, g) for g in group_acronyms)
+        )
+        return dict(zip(group_acronyms, results))
+
+    async def get_meeting_sessions(self, meeting_number: int) -> list[IETFSession]:
+        """Get all sessions for an IETF meeting."""
+        sessions = []
+        try:
+            all_sessions = await self._get_paginated(
+                "/api/v1/meeting/session/", {"meeting__number": meeting_number}
+            )
+            schedule, groups = await asyncio.gather(
+                self.get_meeting_schedule(meeting_number),
+                self._get_resources(
+                    "/api/v1/group/group/",
+                    [s.get("group") for s in all_sessions if s.get("group")],
+                ),
+            )
+
+            for session_data in all_sessions:
+                group_uri = session_data.get("group")
+                group_data = groups.get(group_uri, {}) if group_uri else {}
+                sessions.append(
+                    self._build_session(
+                        meeting_number,
+                        group_data.get("acronym", "unknown"),
+                        session_data,
+                        schedule,
+                        group_data.get("name"),
+                    )
+                )
+
+        except Exception as e:
+            logger.error(f"Failed to get sessions for meeting {meeting_number}: {e}")
+
+        return sessions
+
+    async def get_session_materials(
+        self, meeting_number: int, group_acronym: str
+    ) -> list[IETFMaterial]:
+        """Get all materials (slides, agendas, etc.) for a session."""
+        materials = []
+        try:
+            data = await self._get_paginated(
+                "/api/v1/meeting/sessionpresentation/",
+                {
+                    "session__meeting__number": meeting_number,
+                    "session__group__acronym": group_acronym,
+                },
+            )
+            documents = await self._get_resources(
+                "/api/v1/doc/document/",
+                [p.get("document") for p in data if p.get("document")],
+                key_field="name",
+            )
+            for item in data:
+                doc_data = documents.get(item.get("document"))
+                if doc_data:
+                    materials.append(
+                        self._build_material(meeting_number, doc_data, item.get("order"))
+                    )
+
+        except Exception as e:
+            logger.error(f"Failed to get materials for {group_acronym} at {meeting_number}: {e}")
+
+        return materials + self._session_page_materials(meeting_number, group_acronym)
+
+    async def get_group_chairs(self, group_acronym: str) -> list[IETFPerson]:
+        """Get current chairs for a working group.
+
+        Person and email records for all chairs are fetched concurrently.
+        """
+        chairs = []
+        seen_names = set()
+
+        try:
+            data = await self._get(
+                "/api/v1/group/role/",
+                {
+                    "group__acronym": group_acronym,
+                    "name__slug": "chair",
+                    "limit": 10,
+                },
+            )
+            roles = [r for r in data.get("objects", []) if r.get("person")]
+
+            async def resolve(role: dict[str, Any]) -> tuple[str | None, str | None]:
+                try:
+                    person = await self._get_resource(role["person"])
+                except Exception as e:
+                    logger.debug(f"Could not fetch person data: {e}")
+                    return None, None
+                email = None
+                if role.get("email"):
+                    try:
+                        email = (await self._get_resource(role["email"])).get("address")
+                    except Exception:
+                        pass
+                return person.get("name", "Unknown"), email
+
+            for name, email in await asyncio.gather(*(resolve(r) for r in roles)):
+                # Avoid duplicates
+                if name is None or name in seen_names:
+                    continue
+                seen_names.add(name)
+                chairs.append(IETFPerson(name=name, email=email, role="chair"))
+
+        except Exception as e:
+            logger.error(f"Failed to get chairs for {group_acronym}: {e}")
+
+        return chairs
@@ -0,0 +1,155 @@
+"""Content-addressed store for downloaded materials.
+
+The same agenda templates, chair slides and Note Well decks turn up in many
+sessions and meetings. ``BlobStore`` keeps one copy of each file, named by
+its SHA-256 digest, plus an index from source URL to digest. The materials
+downloader consults the index before any mirror or HTTP lookup and
+hardlinks the blob into the requested download directory, so repeated
+backfills into different output directories cost neither bandwidth nor
+extra disk space.
+
+A URL naming a document revision (``slides-121-vcon-intro-01``) always
+serves the same bytes, so its index entry never expires. Revision-less
+URLs (``slides-121-vcon-intro``) serve the latest revision and are trusted
+only for ``ttl`` seconds, after which the material is downloaded again.
+
+Layout:
+    {root}/blobs/{sha256[:2]}/{sha256}
+    {root}/index.sqlite     urls(url PRIMARY KEY, sha256, sha512, size,
+                                 filename, stored_at)
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .file_links import link_file
+
+logger = logging.getLogger(__name__)
+
+# Revision-less material URLs change when slides are revised
+DEFAULT_BLOB_STORE_TTL = 24 * 3600.0
+
+# Last path segment ending in a two-digit revision (optionally with extension)
+_REVISIONED_URL = re.compile(r"-\d{2}(\.\w+)?/?$")
+
+
+@dataclass
+class BlobEntry:
+    """A stored blob, the digests recorded for it and its original filename."""
+
+    path: Path
+    size: int
+    sha256: str
+    sha512: str
+    filename: str
+
+
+class BlobStore:
+    """Digest-keyed file store with a URL index, shared between runs.
+
+    Safe to share between threads; several processes may also use the same
+    root.
+
+    Args:
+        root: Directory holding the blobs and the index
+        ttl: Seconds the recorded digest of a revision-less URL is trusted
+            (None means forever); URLs naming a revision never expire
+    """
+
+    def __init__(self, root: Path, ttl: float | None = DEFAULT_BLOB_STORE_TTL):
+        self.root = root
+        self.ttl = ttl
+        self.hits = 0
+        self._lock = threading.Lock()
+
+        (root / "blobs").mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(root / "index.sqlite"),
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=30.0,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "url TEXT PRIMARY KEY, sha256 TEXT NOT NULL, sha512 TEXT NOT NULL, "
+            "size INTEGER NOT NULL, filename TEXT NOT NULL, stored_at REAL NOT NULL)"
+        )
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return where the blob with this digest is (or would be) stored."""
+        return self.root / "blobs" / sha256[:2] / sha256
+
+    def lookup(self, url: str) -> BlobEntry | None:
+        """Find the stored blob for a URL, if it is indexed and present."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, sha512, size, filename, stored_at FROM urls WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        sha256, sha512, size, filename, stored_at = row
+        if (
+            self.ttl is not None
+            and not _REVISIONED_URL.search(url.split("?")[0])
+            and time.time() - stored_at > self.ttl
+        ):
+            return None
+        path = self.blob_path(sha256)
+        if not path.exists():
+            logger.debug(f"Blob for {url} is indexed but missing: {path}")
+            return None
+
+        self.hits += 1
+        return BlobEntry(
+            path=path, size=size, sha256=sha256, sha512=sha512, filename=filename
+        )
+
+    def add(self, url: str, path: Path, sha256: str, sha512: str, size: int) -> BlobEntry:
+        """Store a downloaded file under its digest and index it by URL.
+
+        The file is hardlinked into the store (copied across filesystems);
+        an identical blob already stored is reused.
+
+        Args:
+            url: Source URL of the file
+            path: The downloaded file (its name is kept for later hits)
+            sha256: SHA-256 of the file
+            sha512: SHA-512 of the file
+            size: Size of the file in bytes
+
+        Returns:
+            The stored blob
+        """
+        blob = self.blob_path(sha256)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            link_file(path, blob, strategy="hardlink")
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO urls "
+                "(url, sha256, sha512, size, filename, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, sha256, sha512, size, path.name, time.time()),
+            )
+        return BlobEntry(
+            path=blob, size=size, sha256=sha256, sha512=sha512, filename=path.name
+        )
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -5,7 +5,9 @@ Convert IETF meeting sessions to vCon format.
 
 import logging
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 
 import click
 from rich.console import Console
@@ -13,8 +15,16 @@ from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.table import Table
 
+from .blob_store import DEFAULT_BLOB_STORE_TTL
 from .converter import ConversionOptions, IETFSessionConverter
-from .rsync_mirror import sync_proceedings
+from .file_links import LINK_STRATEGIES
+from .http_cache import DEFAULT_TTL, ResponseCache
+from .incremental import RefreshStateStore
+from .negative_cache import DEFAULT_NEGATIVE_TTL
+from .ratelimit import DEFAULT_RATE, configure_host
+from .retry import DEFAULT_RETRY_BUDGET, retry_budget
+from .rsync_mirror import MATERIAL_SUBDIRS, sync_meetings
+from .snapshot import MeetingSnapshot, create_snapshot
 
 console = Console()
 
@@ -201,6 +211,86 @@ def main():
     help="Local rsync mirror root (checked before HTTP for materials). "
          "Use 'ietf2vcon sync' to populate it.",
 )
+@click.option(
+    "--mirror-link",
+    type=click.Choice(sorted(LINK_STRATEGIES)),
+    default="auto",
+    show_default=True,
+    help="How mirror files are placed in the output directory; 'auto' tries "
+         "reflink, hardlink and symlink before copying",
+)
+@click.option(
+    "--blob-store",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="IETF2VCON_BLOB_STORE",
+    help="Content-addressed material store shared across runs and output "
+         "directories (checked before the mirror and HTTP)",
+)
+@click.option(
+    "--blob-store-ttl",
+    type=float,
+    default=DEFAULT_BLOB_STORE_TTL,
+    show_default=True,
+    help="Seconds a stored material fetched by a revision-less URL (latest "
+         "revision) is reused before it is downloaded again",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path),
+    envvar="IETF2VCON_CACHE_DIR",
+    help="Cache Datatracker API responses on disk in this directory "
+         "(or set IETF2VCON_CACHE_DIR env var)",
+)
+@click.option(
+    "--cache-ttl",
+    type=float,
+    default=DEFAULT_TTL,
+    show_default=True,
+    help="Seconds before cached Datatracker responses are revalidated",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Answer Datatracker queries from --cache-dir only (no network)",
+)
+@click.option(
+    "--snapshot",
+    "snapshot_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Answer Datatracker queries from a meeting snapshot "
+         "(see 'ietf2vcon snapshot')",
+)
+@click.option(
+    "--agenda-data",
+    is_flag=True,
+    help="Build sessions from the meeting's agenda-data document "
+         "(one request) instead of per-resource API queries",
+)
+@click.option(
+    "--ytdlp-command",
+    is_flag=True,
+    help="Start the yt-dlp command for every YouTube call instead of using "
+         "its Python API in-process",
+)
+@click.option(
+    "--youtube-search",
+    is_flag=True,
+    help="Search YouTube for each session's video instead of matching it in "
+         "the meeting's cached playlist",
+)
+@click.option(
+    "--missing-ttl",
+    type=float,
+    default=DEFAULT_NEGATIVE_TTL,
+    show_default=True,
+    help="Seconds to skip probes that found nothing on an earlier run "
+         "(missing Zulip streams, captions, notes pages)",
+)
+@click.option(
+    "--recheck-missing",
+    is_flag=True,
+    help="Probe again for resources recorded as missing",
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
@@ -231,6 +321,18 @@ def convert(
     zulip_email: str | None,
     zulip_api_key: str | None,
     rsync_mirror: Path | None,
+    mirror_link: str,
+    blob_store: Path | None,
+    blob_store_ttl: float,
+    cache_dir: Path | None,
+    cache_ttl: float,
+    offline: bool,
+    snapshot_path: Path | None,
+    agenda_data: bool,
+    ytdlp_command: bool,
+    youtube_search: bool,
+    missing_ttl: float,
+    recheck_missing: bool,
     verbose: bool,
 ):
     """Convert an IETF session to vCon format.
@@ -239,6 +341,9 @@ def convert(
     Use --no-transcript to skip, or --transcript-source to select a backend.
     Use --export-srt or --export-webvtt to generate subtitle files.
     """
+    if offline and not cache_dir:
+        raise click.UsageError("--offline requires --cache-dir")
+
     setup_logging(verbose)
 
     console.print(Panel(
@@ -268,17 +373,28 @@ def convert(
         zulip_api_key=zulip_api_key,
         output_dir=output_dir,
         rsync_mirror_dir=rsync_mirror,
+        mirror_link_strategy=mirror_link,
+        blob_store_dir=blob_store,
+        blob_store_ttl=blob_store_ttl,
+        http_cache_dir=cache_dir,
+        http_cache_ttl=cache_ttl,
+        offline=offline,
+        snapshot_path=snapshot_path,
+        agenda_data=agenda_data,
+        ytdlp_in_process=not ytdlp_command,
+        use_playlist_index=not youtube_search,
+        negative_cache_ttl=missing_ttl,
+        recheck_missing=recheck_missing,
     )
 
     # Run conversion
-    converter = IETFSessionConverter(options)
-
     try:
-        with console.status("Converting session..."):
-            result = converter.convert_session(meeting, group, session)
+        with IETFSessionConverter(options) as converter:
+            with console.status("Converting session..."):
+                result = converter.convert_session(meeting, group, session)
 
-        # Save output
-        output_path = converter.save_vcon(result, output)
+            # Save output
+            output_path = converter.save_vcon(result, output)
 
         # Display results
         _display_results(result, output_path)
@@ -444,6 +560,41 @@ def list_materials(meeting: int, group: str):
     is_flag=True,
     help="Skip video references",
 )
+@click.option(
+    "--inline-materials",
+    is_flag=True,
+    help="Download and embed materials inline",
+)
+@click.option(
+    "--rsync-mirror",
+    type=click.Path(path_type=Path),
+    envvar="IETF_RSYNC_MIRROR",
+    help="Local rsync mirror root (checked before HTTP for materials). "
+         "Use 'ietf2vcon sync' to populate it.",
+)
+@click.option(
+    "--mirror-link",
+    type=click.Choice(sorted(LINK_STRATEGIES)),
+    default="auto",
+    show_default=True,
+    help="How mirror files are placed in the output directory; 'auto' tries "
+         "reflink, hardlink and symlink before copying",
+)
+@click.option(
+    "--blob-store",
+    type=click.Path(file_okay=False, path_type=Path),
+    envvar="IETF2VCON_BLOB_STORE",
+    help="Content-addressed material store shared across runs and output "
+         "directories (checked before the mirror and HTTP)",
+)
+@click.option(
+    "--blob-store-ttl",
+    type=float,
+    default=DEFAULT_BLOB_STORE_TTL,
+    show_default=True,
+    help="Seconds a stored material fetched by a revision-less URL (latest "
+         "revision) is reused before it is downloaded again",
+)
 @click.option(
     "--parallel",
     type=int,
@@ -456,6 +607,85 @@ def list_materials(meeting: int, group: str):
     multiple=True,
     help="Only convert specific groups (can specify multiple times)",
 )
+@click.option(
+    "--datatracker-rate",
+    type=float,
+    default=DEFAULT_RATE,
+    show_default=True,
+    help="Maximum Datatracker requests per second, shared by all workers "
+         "(lowered automatically when throttled)",
+)
+@click.option(
+    "--retry-budget",
+    "retry_budget_size",
+    type=int,
+    default=DEFAULT_RETRY_BUDGET,
+    show_default=True,
+    help="Total retries of transient HTTP failures allowed for the whole run",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path),
+    envvar="IETF2VCON_CACHE_DIR",
+    help="Cache Datatracker API responses on disk in this directory "
+         "(or set IETF2VCON_CACHE_DIR env var)",
+)
+@click.option(
+    "--cache-ttl",
+    type=float,
+    default=DEFAULT_TTL,
+    show_default=True,
+    help="Seconds before cached Datatracker responses are revalidated",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Answer Datatracker queries from --cache-dir only (no network)",
+)
+@click.option(
+    "--snapshot",
+    "snapshot_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Answer Datatracker queries from a meeting snapshot "
+         "(see 'ietf2vcon snapshot')",
+)
+@click.option(
+    "--agenda-data",
+    is_flag=True,
+    help="Build sessions from the meeting's agenda-data document "
+         "(one request) instead of per-resource API queries",
+)
+@click.option(
+    "--ytdlp-command",
+    is_flag=True,
+    help="Start the yt-dlp command for every YouTube call instead of using "
+         "its Python API in-process",
+)
+@click.option(
+    "--youtube-search",
+    is_flag=True,
+    help="Search YouTube for each session's video instead of matching it in "
+         "the meeting's cached playlist",
+)
+@click.option(
+    "--missing-ttl",
+    type=float,
+    default=DEFAULT_NEGATIVE_TTL,
+    show_default=True,
+    help="Seconds to skip probes that found nothing on an earlier run "
+         "(missing Zulip streams, captions, notes pages)",
+)
+@click.option(
+    "--recheck-missing",
+    is_flag=True,
+    help="Probe again for resources recorded as missing",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reconvert only groups whose sessions or materials changed since "
+         "the last incremental run (state kept in OUTPUT_DIR/refresh)",
+)
 @click.option(
     "-v", "--verbose",
     is_flag=True,
@@ -470,8 +700,25 @@ def convert_all(
     wtf_server_url: str | None,
     wtf_server_provider: str | None,
     no_video: bool,
+    inline_materials: bool,
+    rsync_mirror: Path | None,
+    mirror_link: str,
+    blob_store: Path | None,
+    blob_store_ttl: float,
     parallel: int,
     groups: tuple[str, ...],
+    datatracker_rate: float,
+    retry_budget_size: int,
+    cache_dir: Path | None,
+    cache_ttl: float,
+    offline: bool,
+    snapshot_path: Path | None,
+    agenda_data: bool,
+    ytdlp_command: bool,
+    youtube_search: bool,
+    missing_ttl: float,
+    recheck_missing: bool,
+    incremental: bool,
     verbose: bool,
 ):
     """Convert all sessions from an IETF meeting to vCon format.
@@ -495,83 +742,157 @@ def convert_all(
         # Convert in parallel
         ietf2vcon convert-all --meeting 121 --parallel 4
 
+        # Embed materials, sharing stored copies with other meetings' runs
+        ietf2vcon convert-all --meeting 121 --inline-materials \\
+            --blob-store ~/.cache/ietf2vcon/blobs
+
         # Convert only specific groups
         ietf2vcon convert-all --meeting 121 --groups vcon --groups httpbis
+
+        # Re-run during the meeting week, reconverting only what changed
+        ietf2vcon convert-all --meeting 121 --incremental
     """
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
     from rich.progress import Progress, SpinnerColumn, TextColumn
 
-    from .datatracker import DataTrackerClient
+    from .datatracker import BASE_URL, BULK_PREFETCH_MIN_GROUPS, DataTrackerClient
+
+    if offline and not cache_dir:
+        raise click.UsageError("--offline requires --cache-dir")
 
     setup_logging(verbose)
 
     console.print(f"\n[bold]Converting IETF {meeting} to vCon[/bold]\n")
 
-    # Get groups to convert
-    if groups:
-        group_list = list(groups)
-        console.print(f"Converting {len(group_list)} specified groups")
-    else:
-        console.print("Fetching session list...")
-        client = DataTrackerClient()
-        try:
+    configure_host(urlparse(BASE_URL).hostname, datatracker_rate)
+    retry_budget.reset(retry_budget_size)
+
+    # One client (and connection pool) shared by every worker for the run
+    cache = ResponseCache(cache_dir, ttl=cache_ttl, offline=offline) if cache_dir else None
+    snapshot = MeetingSnapshot(snapshot_path) if snapshot_path else None
+    client = DataTrackerClient(
+        cache=cache,
+        snapshot=snapshot,
+        max_connections=max(20, parallel * 4),
+        agenda_data=agenda_data,
+    )
+    refresh = RefreshStateStore(output_dir / "refresh") if incremental else None
+    started_at = datetime.now(timezone.utc)
+
+    try:
+        # Get groups to convert
+        group_list = None
+        full_run = False
+        if refresh:
+            state = refresh.load(meeting)
+            if state.high_water:
+                try:
+                    changed = client.get_changed_groups(meeting, state.high_water)
+                    group_list = sorted(changed | set(state.pending))
+                    if groups:
+                        group_list = [g for g in group_list if g in groups]
+                    console.print(
+                        f"[cyan]{len(group_list)}[/cyan] groups changed since "
+                        f"{state.high_water:%Y-%m-%d %H:%M} UTC\n"
+                    )
+                except Exception as e:
+                    console.print(
+                        f"[yellow]Could not query changes ({e}); "
+                        f"converting everything[/yellow]"
+                    )
+
+        if group_list is None and groups:
+            group_list = list(groups)
+            console.print(f"Converting {len(group_list)} specified groups")
+        elif group_list is None:
+            console.print("Fetching session list...")
             sessions = client.get_meeting_sessions(meeting)
             group_list = sorted(set(s.group_acronym for s in sessions))
-        finally:
-            client.close()
-        console.print(f"Found [cyan]{len(group_list)}[/cyan] working groups\n")
+            console.print(f"Found [cyan]{len(group_list)}[/cyan] working groups\n")
+            full_run = True
+
+        # Load every group's materials and chairs in bulk before the workers
+        # start, unless only a few groups (--groups, an incremental refresh)
+        # are converted
+        if group_list and (full_run or len(group_list) >= BULK_PREFETCH_MIN_GROUPS):
+            client.get_meeting_materials(meeting)
+            client.prefetch_group_chairs()
+
+        # Configure options
+        options = ConversionOptions(
+            include_video=not no_video,
+            include_transcript=not no_transcript,
+            transcription_source=transcript_source,
+            mlx_whisper_url=mlx_whisper_url,
+            wtf_server_url=wtf_server_url,
+            wtf_server_provider=wtf_server_provider,
+            inline_materials=inline_materials,
+            include_chat=False,
+            output_dir=output_dir,
+            rsync_mirror_dir=rsync_mirror,
+            mirror_link_strategy=mirror_link,
+            blob_store_dir=blob_store,
+            blob_store_ttl=blob_store_ttl,
+            http_cache_dir=cache_dir,
+            http_cache_ttl=cache_ttl,
+            offline=offline,
+            snapshot_path=snapshot_path,
+            agenda_data=agenda_data,
+            ytdlp_in_process=not ytdlp_command,
+            use_playlist_index=not youtube_search,
+            negative_cache_ttl=missing_ttl,
+            recheck_missing=recheck_missing,
+        )
+        with IETFSessionConverter(options, datatracker=client) as converter:
+            def convert_group(group: str) -> tuple[str, bool, str]:
+                """Convert a single group's session."""
+                try:
+                    result = converter.convert_session(meeting, group)
+                    if result.errors:
+                        return (group, False, result.errors[0])
+                    output_path = converter.save_vcon(result)
+                    return (group, True, str(output_path))
+                except Exception as e:
+                    return (group, False, str(e))
+
+            # Convert sessions
+            results = []
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Converting...", total=len(group_list))
+
+                if parallel > 1:
+                    with ThreadPoolExecutor(max_workers=parallel) as executor:
+                        futures = {
+                            executor.submit(convert_group, g): g for g in group_list
+                        }
+                        for future in as_completed(futures):
+                            group = futures[future]
+                            result = future.result()
+                            results.append(result)
+                            progress.update(task, advance=1, description=f"Converted {group}")
+                else:
+                    for group in group_list:
+                        progress.update(task, description=f"Converting {group}...")
+                        result = convert_group(group)
+                        results.append(result)
+                        progress.update(task, advance=1)
+
+        # Groups outside --groups were not looked at, so only a full run
+        # may move the high-water mark
+        if refresh and not groups:
+            failed = [group for group, success, _ in results if not success]
+            refresh.save(meeting, started_at, pending=failed)
 
-    # Configure options
-    options = ConversionOptions(
-        include_video=not no_video,
-        include_transcript=not no_transcript,
-        transcription_source=transcript_source,
-        mlx_whisper_url=mlx_whisper_url,
-        wtf_server_url=wtf_server_url,
-        wtf_server_provider=wtf_server_provider,
-        include_chat=False,
-        output_dir=output_dir,
-    )
-
-    def convert_group(group: str) -> tuple[str, bool, str]:
-        """Convert a single group's session."""
-        try:
-            converter = IETFSessionConverter(options)
-            result = converter.convert_session(meeting, group)
-            if result.errors:
-                return (group, False, result.errors[0])
-            output_path = converter.save_vcon(result)
-            return (group, True, str(output_path))
-        except Exception as e:
-            return (group, False, str(e))
-
-    # Convert sessions
-    results = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Converting...", total=len(group_list))
-
-        if parallel > 1:
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                futures = {
-                    executor.submit(convert_group, g): g for g in group_list
-                }
-                for future in as_completed(futures):
-                    group = futures[future]
-                    result = future.result()
-                    results.append(result)
-                    progress.update(task, advance=1, description=f"Converted {group}")
-        else:
-            for group in group_list:
-                progress.update(task, description=f"Converting {group}...")
-                result = convert_group(group)
-                results.append(result)
-                progress.update(task, advance=1)
+    finally:
+        client.close()
+        if snapshot:
+            snapshot.close()
 
     # Display results
     console.print("\n")
@@ -591,6 +912,11 @@ def convert_all(
 
     console.print(table)
     console.print(f"\n[bold]Summary:[/bold] {success_count}/{len(results)} successful")
+    console.print(f"[bold]HTTP retries:[/bold] {retry_budget.summary()}")
+    if negative_cache and negative_cache.skipped:
+        console.print(
+            f"[bold]Known-missing probes skipped:[/bold] {negative_cache.skipped}"
+        )
 
     if success_count < len(results):
         sys.exit(1)
@@ -643,7 +969,94 @@ def info(vcon_file: Path):
     "-m", "--meeting",
     type=int,
     required=True,
-    help="IETF meeting number to sync (e.g., 125)",
+    help="IETF meeting number",
+)
+@click.option(
+    "-o", "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Snapshot file (default: ./snapshots/ietf<meeting>.sqlite)",
+)
+@click.option(
+    "-v", "--verbose",
+    is_flag=True,
+    help="Enable verbose output",
+)
+def snapshot(meeting: int, output: Path | None, verbose: bool):
+    """Save a meeting's Datatracker data to a local SQLite snapshot.
+
+    Sessions, schedule, rooms, groups, roles, and session materials are
+    fetched in bulk once. Conversions run with --snapshot then answer every
+    Datatracker query from the file, without network access.
+
+    Examples:
+
+        # Snapshot IETF 121
+        ietf2vcon snapshot --meeting 121
+
+        # Convert the whole meeting from the snapshot
+        ietf2vcon convert-all --meeting 121 --snapshot snapshots/ietf121.sqlite
+    """
+    from .datatracker import DataTrackerClient
+
+    setup_logging(verbose)
+
+    output = output or Path("./snapshots") / f"ietf{meeting}.sqlite"
+    console.print(f"Snapshotting IETF {meeting} → {output}")
+
+    client = DataTrackerClient()
+    try:
+        with console.status("Fetching meeting data..."):
+            counts = create_snapshot(client, meeting, output)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    finally:
+        client.close()
+
+    table = Table(title=f"IETF {meeting} Snapshot")
+    table.add_column("Resource", style="cyan")
+    table.add_column("Count", justify="right")
+    for collection, count in counts.items():
+        table.add_row(collection.removeprefix("/api/v1/").rstrip("/"), str(count))
+    console.print(table)
+    console.print(f"[green]✓[/green] Snapshot saved: {output}")
+
+
+def _parse_meetings(values: tuple[str, ...]) -> list[int]:
+    """Expand meeting arguments such as "118-121,125" into meeting numbers."""
+    meetings = []
+    for value in values:
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            start, sep, end = part.partition("-")
+            try:
+                if sep:
+                    first, last = int(start), int(end)
+                    if first > last:
+                        raise ValueError
+                    numbers = range(first, last + 1)
+                else:
+                    numbers = [int(part)]
+            except ValueError:
+                raise click.BadParameter(
+                    f"{part!r} is not a meeting number or range (e.g. 125 or 118-121)",
+                    param_hint="'-m' / '--meeting'",
+                ) from None
+            meetings += [n for n in numbers if n not in meetings]
+    return meetings
+
+
+@main.command()
+@click.option(
+    "-m", "--meeting",
+    "meetings",
+    type=str,
+    multiple=True,
+    required=True,
+    help="IETF meeting number(s) to sync: 125, a range such as 118-121, or a "
+         "comma-separated list (can specify multiple times)",
 )
 @click.option(
     "--mirror-dir",
@@ -652,12 +1065,39 @@ def info(vcon_file: Path):
     default=Path("./downloads"),
     help="Local mirror root directory (default: ./downloads)",
 )
+@click.option(
+    "--parallel",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of meetings synced at the same time",
+)
+@click.option(
+    "--types",
+    "material_types",
+    type=click.Choice(MATERIAL_SUBDIRS),
+    multiple=True,
+    help="Only sync these material types (can specify multiple times)",
+)
+@click.option(
+    "--groups",
+    type=str,
+    multiple=True,
+    help="Only sync materials of these groups (can specify multiple times)",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
     help="Show what would be synced without transferring files",
 )
-def sync(meeting: int, mirror_dir: Path, dry_run: bool):
+def sync(
+    meetings: tuple[str, ...],
+    mirror_dir: Path,
+    parallel: int,
+    material_types: tuple[str, ...],
+    groups: tuple[str, ...],
+    dry_run: bool,
+):
     """Sync IETF meeting proceedings from rsync.ietf.org.
 
     Downloads slides, agendas, minutes, chatlogs, and bluesheets to a local
@@ -669,6 +1109,13 @@ def sync(meeting: int, mirror_dir: Path, dry_run: bool):
         # Sync IETF 125 proceedings locally
         ietf2vcon sync --meeting 125
 
+        # Backfill several meetings, four rsync processes at a time
+        ietf2vcon sync --meeting 118-125 --parallel 4
+
+        # Only slides and minutes of two groups
+        ietf2vcon sync --meeting 125 --types slides --types minutes \\
+            --groups vcon --groups httpbis
+
         # Sync to a custom directory
         ietf2vcon sync --meeting 125 --mirror-dir /mnt/T9/ietf
 
@@ -677,17 +1124,49 @@ def sync(meeting: int, mirror_dir: Path, dry_run: bool):
     """
     setup_logging(False)
 
-    dest = mirror_dir / "proceedings" / str(meeting)
-    console.print(f"Syncing IETF {meeting} proceedings → {dest}")
+    meeting_numbers = _parse_meetings(meetings)
+    console.print(
+        f"Syncing {len(meeting_numbers)} meeting(s) → {mirror_dir / 'proceedings'}"
+    )
     if dry_run:
         console.print("[yellow]Dry run — no files will be written[/yellow]")
 
-    ok = sync_proceedings(meeting, mirror_dir, dry_run=dry_run)
-    if ok:
-        console.print(f"[green]✓[/green] Sync complete: {dest}")
-    else:
-        console.print("[red]✗[/red] Sync failed — check rsync is installed and network is available")
+    results = sync_meetings(
+        meeting_numbers,
+        mirror_dir,
+        parallel=parallel,
+        dry_run=dry_run,
+        material_types=list(material_types) or None,
+        groups=[g.lower() for g in groups] or None,
+    )
+
+    table = Table(title="Sync Results")
+    table.add_column("Meeting", style="cyan")
+    table.add_column("Status")
+    table.add_column("Files", justify="right")
+    table.add_column("Hashed", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Seconds", justify="right")
+    for result in results:
+        status = "[green]✓[/green]" if result.ok else f"[red]✗ {result.error}[/red]"
+        table.add_row(
+            str(result.meeting_number),
+            status,
+            str(result.files_transferred),
+            str(result.files_hashed),
+            f"{result.bytes_received:,}",
+            f"{result.seconds:.1f}",
+        )
+    console.print(table)
+
+    failed = [r.meeting_number for r in results if not r.ok]
+    if failed:
+        console.print(
+            f"[red]✗[/red] Sync failed for {', '.join(map(str, failed))} — "
+            "check rsync is installed and network is available"
+        )
         raise SystemExit(1)
+    console.print(f"[green]✓[/green] Sync complete: {mirror_dir / 'proceedings'}")
 
 
 def _display_results(result, output_path: Path):
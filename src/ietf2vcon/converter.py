@@ -5,16 +5,28 @@ into a complete vCon document.
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import httpx
 from vcon import Vcon
 
+from .blob_store import DEFAULT_BLOB_STORE_TTL, BlobStore
 from .datatracker import DataTrackerClient
+from .http_cache import DEFAULT_TTL, ResponseCache
 from .materials import MaterialsDownloader, organize_materials_by_type
 from .models import IETFMeeting, IETFSession
+from .negative_cache import (
+    DEFAULT_NEGATIVE_TTL,
+    YOUTUBE_CAPTIONS,
+    ZULIP_STREAM,
+    NegativeCache,
+)
+from .snapshot import MeetingSnapshot
 from .transcription import (
     MeetechoTranscriptLoader,
     MlxWhisperTranscriber,
@@ -27,7 +39,8 @@ from .transcription import (
     transcript_to_webvtt,
 )
 from .vcon_builder import VConBuilder
-from .youtube import VideoMetadata, YouTubeResolver
+from .youtube import NoCaptionsError, VideoMetadata, YouTubeResolver
+from .youtube_playlist import DEFAULT_PLAYLIST_TTL, PlaylistIndex
 from .zulip_client import ZulipClient
 
 logger = logging.getLogger(__name__)
@@ -72,6 +85,39 @@ class ConversionOptions:
 
     # Local rsync mirror directory (checked before HTTP for materials)
     rsync_mirror_dir: Path | None = None
+    mirror_link_strategy: str = "auto"  # auto, reflink, hardlink, symlink or copy
+
+    # Content-addressed material store shared across runs (checked first)
+    blob_store_dir: Path | None = None
+    blob_store_ttl: float | None = DEFAULT_BLOB_STORE_TTL  # For revision-less URLs
+
+    # On-disk Datatracker response cache (disabled when None)
+    http_cache_dir: Path | None = None
+    http_cache_ttl: float | None = DEFAULT_TTL
+    offline: bool = False  # Answer Datatracker queries from the cache only
+
+    # Meeting snapshot from 'ietf2vcon snapshot' (answers all Datatracker queries)
+    snapshot_path: Path | None = None
+
+    # Build sessions from the meeting's agenda-data document (one request)
+    agenda_data: bool = False
+
+    # Match session videos in the meeting's cached YouTube playlist instead
+    # of searching YouTube once per session
+    use_playlist_index: bool = True
+    playlist_cache_dir: Path | None = None  # Default: {output_dir}/youtube_playlists
+    playlist_cache_ttl: float | None = DEFAULT_PLAYLIST_TTL
+
+    # Run yt-dlp through its Python API (reused instances) rather than
+    # starting the yt-dlp command for every call
+    ytdlp_in_process: bool = True
+
+    # Record of probes that found nothing (no Zulip stream, captions or notes
+    # page), skipped on later runs until they expire
+    use_negative_cache: bool = True
+    negative_cache_path: Path | None = None  # Default: {output_dir}/negative_cache.sqlite
+    negative_cache_ttl: float | None = DEFAULT_NEGATIVE_TTL
+    recheck_missing: bool = False  # Probe again even if recorded as missing
 
     # Authentication (for Zulip)
     zulip_email: str | None = None
@@ -94,12 +140,62 @@ class ConversionResult:
     warnings: list[str] = field(default_factory=list)
 
 
+def _local_time(start_time: datetime | None, time_zone: str | None) -> datetime | None:
+    """Return a session start in the meeting's time zone (unchanged if unknown)."""
+    if start_time is None or not time_zone:
+        return start_time
+    try:
+        zone = ZoneInfo(time_zone)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown meeting time zone {time_zone!r}")
+        return start_time
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    return start_time.astimezone(zone)
+
+
 class IETFSessionConverter:
-    """Convert IETF sessions to vCon format."""
+    """Convert IETF sessions to vCon format.
+
+    By default each conversion opens and closes its own clients. For batch
+    runs, pass long-lived clients instead: they are shared by every
+    ``convert_session`` call (including from several threads) so connections
+    stay warm, and the caller remains responsible for closing them.
+
+    Args:
+        options: Conversion options
+        datatracker: Shared Datatracker client to use for every conversion
+        downloader: Shared materials downloader used for inline materials
+    """
 
-    def __init__(self, options: ConversionOptions | None = None):
+    def __init__(
+        self,
+        options: ConversionOptions | None = None,
+        datatracker: DataTrackerClient | None = None,
+        downloader: MaterialsDownloader | None = None,
+    ):
         self.options = options or ConversionOptions()
         self.options.output_dir.mkdir(parents=True, exist_ok=True)
+        self.datatracker = datatracker
+        self.downloader = downloader
+        self._snapshot: MeetingSnapshot | None = None
+        self._negative_cache: NegativeCache | None = None
+        self._blob_store: BlobStore | None = None
+        self._playlist_index: PlaylistIndex | None = None
+        self._open_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the snapshot and stores this converter opened."""
+        for resource in (self._snapshot, self._negative_cache, self._blob_store):
+            if resource is not None:
+                resource.close()
+        self._snapshot = self._negative_cache = self._blob_store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def convert_session(
         self,
@@ -126,7 +222,11 @@ class IETFSessionConverter:
         )
 
         # Initialize clients
-        datatracker = DataTrackerClient()
+        datatracker = self.datatracker or DataTrackerClient(
+            cache=self._make_response_cache(),
+            snapshot=self._get_snapshot(),
+            agenda_data=self.options.agenda_data,
+        )
 
         try:
             # Get meeting info
@@ -200,7 +300,13 @@ class IETFSessionConverter:
             video_dialog_index = -1
             if self.options.include_video:
                 video_url, video_dialog_index = self._process_video(
-                    builder, session, errors, warnings, recording_url=recording_url
+                    builder,
+                    session,
+                    errors,
+                    warnings,
+                    recording_url=recording_url,
+                    playlist_url=datatracker.get_youtube_playlist_url(meeting_number),
+                    time_zone=meeting.time_zone,
                 )
 
             # Process materials (excluding recordings which are now dialogs)
@@ -241,7 +347,65 @@ class IETFSessionConverter:
             )
 
         finally:
-            datatracker.close()
+            if datatracker is not self.datatracker:
+                datatracker.close()
+
+    def _make_response_cache(self) -> ResponseCache | None:
+        """Create the Datatracker response cache configured in the options."""
+        if not self.options.http_cache_dir:
+            return None
+        return ResponseCache(
+            self.options.http_cache_dir,
+            ttl=self.options.http_cache_ttl,
+            offline=self.options.offline,
+        )
+
+    def _get_snapshot(self) -> MeetingSnapshot | None:
+        """Open the meeting snapshot configured in the options (once)."""
+        if not self.options.snapshot_path:
+            return None
+        if self._snapshot is None:
+            self._snapshot = MeetingSnapshot(self.options.snapshot_path)
+        return self._snapshot
+
+    def _get_blob_store(self) -> BlobStore | None:
+        """Open the material blob store configured in the options (once)."""
+        if not self.options.blob_store_dir:
+            return None
+        with self._open_lock:
+            if self._blob_store is None:
+                self._blob_store = BlobStore(
+                    self.options.blob_store_dir, ttl=self.options.blob_store_ttl
+                )
+        return self._blob_store
+
+    def _get_playlist_index(self) -> PlaylistIndex | None:
+        """Create the YouTube playlist index configured in the options (once)."""
+        if not self.options.use_playlist_index:
+            return None
+        with self._open_lock:
+            if self._playlist_index is None:
+                self._playlist_index = PlaylistIndex(
+                    self.options.playlist_cache_dir
+                    or self.options.output_dir / "youtube_playlists",
+                    ttl=self.options.playlist_cache_ttl,
+                    use_subprocess=not self.options.ytdlp_in_process,
+                )
+        return self._playlist_index
+
+    def get_negative_cache(self) -> NegativeCache | None:
+        """Open the known-missing probe cache configured in the options (once)."""
+        if not self.options.use_negative_cache:
+            return None
+        with self._open_lock:
+            if self._negative_cache is None:
+                self._negative_cache = NegativeCache(
+                    self.options.negative_cache_path
+                    or self.options.output_dir / "negative_cache.sqlite",
+                    ttl=self.options.negative_cache_ttl,
+                    recheck=self.options.recheck_missing,
+                )
+        return self._negative_cache
 
     def _process_video(
         self,
@@ -250,24 +414,29 @@ class IETFSessionConverter:
         errors: list[str],
         warnings: list[str],
         recording_url: str | None = None,
+        playlist_url: str | None = None,
+        time_zone: str | None = None,
     ) -> tuple[str | None, int]:
         """Process video recording."""
         video_url = None
         dialog_index = -1
 
-        youtube = YouTubeResolver(download_dir=self.options.output_dir / "videos")
+        youtube = YouTubeResolver(
+            download_dir=self.options.output_dir / "videos",
+            playlist_index=self._get_playlist_index(),
+            use_subprocess=not self.options.ytdlp_in_process,
+        )
 
         try:
             if self.options.video_source in ("youtube", "both"):
-                session_date = (
-                    session.start_time.strftime("%Y-%m-%d")
-                    if session.start_time
-                    else None
-                )
+                # Recording titles carry the meeting's local date and time
+                start = _local_time(session.start_time, time_zone)
                 video = youtube.search_session_video(
                     session.meeting_number,
                     session.group_acronym,
-                    session_date,
+                    start.strftime("%Y-%m-%d") if start else None,
+                    playlist_url=playlist_url,
+                    session_time=start.strftime("%H%M") if start else None,
                 )
 
                 if video:
@@ -340,7 +509,9 @@ class IETFSessionConverter:
 
         audio_dir.mkdir(parents=True, exist_ok=True)
 
-        youtube = YouTubeResolver(download_dir=audio_dir)
+        youtube = YouTubeResolver(
+            download_dir=audio_dir, use_subprocess=not self.options.ytdlp_in_process
+        )
         try:
             logger.info("Downloading audio for transcription: %s", video_url)
             downloaded = youtube.download_audio(
@@ -372,16 +543,20 @@ class IETFSessionConverter:
             non_recording_materials = [m for m in materials if m.type != "recording"]
 
             if self.options.inline_materials:
-                downloader = MaterialsDownloader(
+                downloader = self.downloader or MaterialsDownloader(
                     download_dir=self.options.output_dir / "materials",
                     mirror_dir=self.options.rsync_mirror_dir,
+                    negative_cache=self.get_negative_cache(),
+                    blob_store=self._get_blob_store(),
+                    link_strategy=self.options.mirror_link_strategy,
                 )
                 try:
                     builder.add_materials(
                         non_recording_materials, inline=True, downloader=downloader
                     )
                 finally:
-                    downloader.close()
+                    if downloader is not self.downloader:
+                        downloader.close()
             else:
                 builder.add_materials(non_recording_materials, inline=False)
 
@@ -480,12 +655,29 @@ class IETFSessionConverter:
         if not video_url or "youtube.com" not in video_url:
             return None
 
-        youtube = YouTubeResolver(download_dir=self.options.output_dir / "videos")
-        logger.info("Fetching YouTube captions...")
-        caption_path = youtube.download_captions(
-            video_url,
-            output_filename=f"ietf{session.meeting_number}_{session.group_acronym}",
+        negative_cache = self.get_negative_cache()
+        if negative_cache and negative_cache.is_absent(YOUTUBE_CAPTIONS, video_url):
+            logger.info("Skipping YouTube captions (none found on a previous run)")
+            return None
+
+        youtube = YouTubeResolver(
+            download_dir=self.options.output_dir / "videos",
+            use_subprocess=not self.options.ytdlp_in_process,
         )
+        logger.info("Fetching YouTube captions...")
+        try:
+            caption_path = youtube.download_captions(
+                video_url,
+                output_filename=f"ietf{session.meeting_number}_{session.group_acronym}",
+                missing_ok=False,
+            )
+        except NoCaptionsError as e:
+            # Only a definitive "no caption track" is remembered; failed
+            # downloads (timeouts, throttling) are retried on the next run
+            logger.info("No YouTube captions: %s", e)
+            if negative_cache:
+                negative_cache.mark_absent(YOUTUBE_CAPTIONS, video_url, "no caption track")
+            return None
 
         if not caption_path:
             return None
@@ -622,6 +814,12 @@ class IETFSessionConverter:
             )
             return 0
 
+        stream_name = session.group_acronym.lower()
+        negative_cache = self.get_negative_cache()
+        if negative_cache and negative_cache.is_absent(ZULIP_STREAM, stream_name):
+            warnings.append(f"Zulip stream '{stream_name}' not found on a previous run")
+            return 0
+
         try:
             zulip = ZulipClient(
                 email=self.options.zulip_email,
@@ -636,12 +834,21 @@ class IETFSessionConverter:
                         seconds=session.duration_seconds
                     )
 
-                messages = zulip.get_session_messages(
-                    session.meeting_number,
-                    session.group_acronym,
-                    session_start,
-                    session_end,
-                )
+                try:
+                    messages = zulip.get_session_messages(
+                        session.meeting_number,
+                        session.group_acronym,
+                        session_start,
+                        session_end,
+                        missing_ok=False,
+                    )
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 404:
+                        raise
+                    if negative_cache:
+                        negative_cache.mark_absent(ZULIP_STREAM, stream_name, "HTTP 404")
+                    warnings.append(f"Zulip stream '{stream_name}' not found")
+                    return 0
 
                 if messages:
                     if self.options.chat_as_dialog:
@@ -5,31 +5,468 @@ API documentation: https://datatracker.ietf.org/api/
 """
 
 import logging
-from datetime import datetime
+import mimetypes
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import unquote, urljoin
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .http_cache import CachedResponse, CacheMissError, ResourceMemo, ResponseCache
 from .models import IETFMaterial, IETFMeeting, IETFPerson, IETFSession
+from .ratelimit import rate_limit_hooks
+from .retry import http_retry
+from .snapshot import MeetingSnapshot
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://datatracker.ietf.org"
 API_BASE = f"{BASE_URL}/api/v1"
+PAGE_SIZE = 100
+# Whole-meeting agenda (sessions, times, rooms, agenda and recording links)
+AGENDA_DATA_PATH = "/api/meeting/{number}/agenda-data"
+# Agenda items that are not group sessions
+AGENDA_SKIP_TYPES = {"break", "reg"}
+CHAIRS_TTL = 12 * 3600.0
+# Below this many groups, per-group materials and chair lookups are cheaper
+# than loading the whole meeting's presentations and the global chair roster
+BULK_PREFETCH_MIN_GROUPS = 20
 
 
-class DataTrackerClient:
-    """Client for the IETF Datatracker API."""
+class ChairRoster:
+    """Chairs per group acronym, each entry expiring after a TTL.
 
-    def __init__(self, timeout: float = 30.0):
+    Besides per-group entries, the roster remembers when a complete load of
+    every group's chairs happened; while that is fresh, a group without an
+    entry has no chairs and needs no lookup.
+    """
+
+    def __init__(self):
+        self._groups: dict[str, tuple[float, list[IETFPerson]]] = {}
+        self._complete_at: float | None = None
+        self._lock = threading.Lock()
+
+    def get(self, group_acronym: str, ttl: float) -> list[IETFPerson] | None:
+        """Return the cached chairs of a group, or None if unknown or stale."""
+        now = time.time()
+        with self._lock:
+            entry = self._groups.get(group_acronym)
+            if entry and now - entry[0] < ttl:
+                return list(entry[1])
+            if self._complete_at is not None and now - self._complete_at < ttl:
+                return []
+            return None
+
+    def complete(self, ttl: float) -> dict[str, list[IETFPerson]] | None:
+        """Return the whole roster if a complete load is younger than ``ttl``."""
+        with self._lock:
+            if self._complete_at is None or time.time() - self._complete_at >= ttl:
+                return None
+            return {acronym: list(chairs) for acronym, (_, chairs) in self._groups.items()}
+
+    def put(self, group_acronym: str, chairs: list[IETFPerson]) -> None:
+        """Cache the chairs of one group."""
+        with self._lock:
+            self._groups[group_acronym] = (time.time(), list(chairs))
+
+    def replace_all(self, roster: dict[str, list[IETFPerson]]) -> None:
+        """Replace the cache with a complete roster of every group."""
+        now = time.time()
+        with self._lock:
+            self._groups = {acronym: (now, list(chairs)) for acronym, chairs in roster.items()}
+            self._complete_at = now
+
+    def clear(self) -> None:
+        """Drop all cached chairs."""
+        with self._lock:
+            self._groups.clear()
+            self._complete_at = None
+
+
+# Dereferenced resource URIs, shared by every DataTrackerClient in the process
+_resource_memo = ResourceMemo(maxsize=8192)
+
+# Current group chairs (not meeting-specific), shared process-wide
+_chair_roster = ChairRoster()
+
+
+class _DataTrackerBase:
+    """Request-independent logic shared by the sync and async clients.
+
+    Subclasses provide ``cache`` and the transport; everything here only
+    interprets API responses and builds models.
+    """
+
+    cache: ResponseCache | None = None
+
+    def _lookup_cache(
+        self, url: str, params: dict | None
+    ) -> tuple[Any | None, CachedResponse | None]:
+        """Check the response cache before making a request.
+
+        Returns:
+            Tuple of (body, entry). ``body`` is set when the cached response
+            can be served without a request; otherwise ``entry`` is the stale
+            entry (if any) to revalidate.
+
+        Raises:
+            CacheMissError: In offline mode when nothing is cached
+        """
+        cached = self.cache.get(url, params)
+        if cached and (self.cache.offline or self.cache.is_fresh(cached)):
+            return cached.body, cached
+        if self.cache.offline:
+            raise CacheMissError(f"Not in offline cache: {url} {params or ''}")
+        return None, cached
+
+    def _update_cache(
+        self,
+        url: str,
+        params: dict | None,
+        response: httpx.Response,
+        cached: CachedResponse | None,
+    ) -> Any:
+        """Store a fresh or revalidated (304) response and return its body."""
+        if cached and response.status_code == 304:
+            logger.debug(f"Not modified: {url}")
+            return self.cache.put(
+                url,
+                params,
+                cached.body,
+                etag=response.headers.get("etag") or cached.etag,
+                last_modified=response.headers.get("last-modified") or cached.last_modified,
+            ).body
+
+        body = response.json()
+        self.cache.put(
+            url,
+            params,
+            body,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        return body
+
+    def _build_meeting(self, meeting_number: int, meeting: dict[str, Any]) -> IETFMeeting:
+        """Build an IETFMeeting from a Datatracker meeting resource."""
+        return IETFMeeting(
+            number=meeting_number,
+            city=meeting.get("city"),
+            country=meeting.get("country"),
+            start_date=self._parse_date(meeting.get("date")),
+            time_zone=meeting.get("time_zone"),
+        )
+
+    def _assignment_params(
+        self, meeting_number: int, meeting: dict[str, Any] | None
+    ) -> dict[str, Any]:
+        """Build the filter selecting the official schedule's assignments."""
+        # Only the official schedule counts; drafts share the meeting
+        schedule_id = self._uri_id(meeting.get("schedule")) if meeting else None
+        if schedule_id:
+            return {"schedule": schedule_id}
+        return {"schedule__meeting__number": meeting_number}
+
+    def _join_schedule(
+        self,
+        assignments: list[dict[str, Any]],
+        timeslots: list[dict[str, Any]],
+        rooms: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Join assignments, timeslots and rooms into a per-session schedule."""
+        timeslots_by_id = {self._uri_id(t.get("resource_uri")): t for t in timeslots}
+        rooms_by_id = {self._uri_id(r.get("resource_uri")): r.get("name") for r in rooms}
+
+        schedule: dict[str, dict[str, Any]] = {}
+        for assignment in assignments:
+            session_id = self._uri_id(assignment.get("session"))
+            if not session_id or session_id in schedule:
+                continue
+
+            timeslot = timeslots_by_id.get(self._uri_id(assignment.get("timeslot")))
+            if not timeslot:
+                continue
+
+            duration = timeslot.get("duration")
+            schedule[session_id] = {
+                "start_time": self._parse_datetime(timeslot.get("time")),
+                "duration_seconds": self._parse_duration(duration) if duration else None,
+                "room": rooms_by_id.get(self._uri_id(timeslot.get("location"))),
+            }
+
+        return schedule
+
+    def _build_session(
+        self,
+        meeting_number: int,
+        group_acronym: str,
+        session_data: dict[str, Any],
+        schedule: dict[str, dict[str, Any]],
+        group_name: str | None = None,
+    ) -> IETFSession:
+        """Build an IETFSession from a session resource and the meeting schedule."""
+        session_id = session_data.get("id") or str(session_data.get("pk", ""))
+        scheduled = schedule.get(str(session_id), {})
+        return IETFSession(
+            meeting_number=meeting_number,
+            group_acronym=group_acronym,
+            session_id=str(session_id) or f"{group_acronym}-{meeting_number}",
+            name=group_name or session_data.get("name"),
+            start_time=scheduled.get("start_time"),
+            duration_seconds=scheduled.get("duration_seconds"),
+            room=scheduled.get("room"),
+        )
+
+    def _build_material(
+        self, meeting_number: int, doc_data: dict[str, Any], order: int | None
+    ) -> IETFMaterial:
+        """Build an IETFMaterial from a Datatracker document resource."""
+        doc_name = doc_data.get("name", "")
+        doc_title = doc_data.get("title", doc_name)
+
+        # Determine material type from name
+        if "slides" in doc_name:
+            mat_type = "slides"
+            mimetype = "application/pdf"
+        elif "agenda" in doc_name:
+            mat_type = "agenda"
+            mimetype = "application/pdf"
+        elif "minutes" in doc_name:
+            mat_type = "minutes"
+            mimetype = "application/pdf"
+        elif "recording" in doc_name:
+            mat_type = "recording"
+            mimetype = "text/html"
+        elif "chatlog" in doc_name:
+            mat_type = "chatlog"
+            mimetype = "text/plain"
+        elif "bluesheets" in doc_name:
+            mat_type = "bluesheets"
+            mimetype = "application/pdf"
+        else:
+            mat_type = "document"
+            mimetype = "application/pdf"
+
+        # Build material URL
+        # Materials are at /meeting/{num}/materials/{doc-name}
+        url = f"{BASE_URL}/meeting/{meeting_number}/materials/{doc_name}"
+
+        # For recordings, try to get the external URL
+        external_url = doc_data.get("external_url")
+
+        return IETFMaterial(
+            type=mat_type,
+            title=doc_title,
+            url=external_url or url,
+            filename=f"{doc_name}.pdf" if mimetype == "application/pdf" else doc_name,
+            mimetype=mimetype,
+            order=order,
+        )
+
+    def _session_page_materials(
+        self, meeting_number: int, group_acronym: str
+    ) -> list[IETFMaterial]:
+        """Build the agenda page and collaborative notes links for a group."""
+        agenda_url = f"{BASE_URL}/meeting/{meeting_number}/agenda/{group_acronym}/"
+        notes_url = f"https://notes.ietf.org/notes-ietf-{meeting_number}-{group_acronym}"
+        return [
+            IETFMaterial(
+                type="agenda",
+                title=f"{group_acronym.upper()} Agenda",
+                url=agenda_url,
+                mimetype="text/html",
+            ),
+            IETFMaterial(
+                type="minutes",
+                title=f"{group_acronym.upper()} Notes",
+                url=notes_url,
+                mimetype="text/markdown",
+            ),
+        ]
+
+    def _build_agenda_session(
+        self, meeting_number: int, item: dict[str, Any]
+    ) -> IETFSession:
+        """Build an IETFSession from one agenda-data schedule item."""
+        group_acronym = item.get("groupAcronym") or item.get("acronym")
+        start_time = self._parse_datetime(item.get("startDateTime"))
+        duration = item.get("duration")
+        agenda = item.get("agenda") or {}
+        recordings = (item.get("links") or {}).get("recordings") or []
+        return IETFSession(
+            meeting_number=meeting_number,
+            group_acronym=group_acronym,
+            session_id=str(item.get("sessionId") or f"{group_acronym}-{meeting_number}"),
+            name=item.get("groupName") or item.get("name"),
+            start_time=start_time,
+            end_time=(
+                start_time + timedelta(seconds=duration)
+                if start_time and duration
+                else None
+            ),
+            duration_seconds=duration,
+            room=item.get("room"),
+            agenda_url=urljoin(BASE_URL, agenda["url"]) if agenda.get("url") else None,
+            recording_url=recordings[0].get("url") if recordings else None,
+        )
+
+    def _build_agenda_materials(
+        self, item: dict[str, Any]
+    ) -> list[IETFMaterial]:
+        """Build the agenda document and recording materials of an agenda-data item."""
+        group_acronym = (item.get("groupAcronym") or item.get("acronym") or "").upper()
+        materials = []
+
+        agenda_url = (item.get("agenda") or {}).get("url")
+        if agenda_url:
+            filename = agenda_url.rstrip("/").rsplit("/", 1)[-1]
+            materials.append(
+                IETFMaterial(
+                    type="agenda",
+                    title=f"{group_acronym} Agenda",
+                    url=urljoin(BASE_URL, agenda_url),
+                    filename=filename,
+                    mimetype=mimetypes.guess_type(filename)[0],
+                )
+            )
+
+        for recording in (item.get("links") or {}).get("recordings") or []:
+            if recording.get("url"):
+                materials.append(
+                    IETFMaterial(
+                        type="recording",
+                        title=recording.get("title") or recording.get("name", "Recording"),
+                        url=recording["url"],
+                        mimetype="text/html",
+                    )
+                )
+
+        return materials
+
+    def get_recording_url(self, meeting_number: int, group_acronym: str) -> str | None:
+        """Get the Meetecho recording URL for a session."""
+        # Meetecho recordings follow a predictable pattern
+        # https://meetings.conf.meetecho.com/ietf{num}/?session={session-id}
+        return f"https://meetings.conf.meetecho.com/ietf{meeting_number}/?group={group_acronym}"
+
+    def get_youtube_playlist_url(self, meeting_number: int) -> str:
+        """Get the YouTube playlist URL for an IETF meeting."""
+        return f"https://www.youtube.com/playlist?list=PLC86T-6ZTP5g-mLpb6ER0j63i8yD6dDNq"
+
+    @staticmethod
+    def _uri_id(uri: str | None) -> str | None:
+        """Extract the primary key from a resource URI like /api/v1/x/y/123/."""
+        if not uri:
+            return None
+        return unquote(uri.rstrip("/").rsplit("/", 1)[-1]) or None
+
+    def _parse_date(self, date_str: str | None) -> datetime | None:
+        """Parse a date string from the API."""
+        if not date_str:
+            return None
+        try:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except Exception:
+            return None
+
+    def _parse_datetime(self, dt_str: str | None) -> datetime | None:
+        """Parse a datetime string from the API."""
+        if not dt_str:
+            return None
+        try:
+            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+        except Exception:
+            return None
+
+    def _parse_duration(self, duration_str: str) -> int | None:
+        """Parse a duration string (HH:MM:SS) to seconds."""
+        try:
+            parts = duration_str.split(":")
+            if len(parts) == 3:
+                h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
+                return h * 3600 + m * 60 + s
+            elif len(parts) == 2:
+                m, s = int(parts[0]), int(parts[1])
+                return m * 60 + s
+        except Exception:
+            pass
+        return None
+
+
+class DataTrackerClient(_DataTrackerBase):
+    """Client for the IETF Datatracker API.
+
+    A single client is safe to share between threads: requests go through
+    one pooled ``httpx.Client``, and meeting-wide loads (schedule,
+    materials) happen once even when several threads ask at the same time.
+
+    Args:
+        timeout: HTTP timeout in seconds
+        cache: Optional on-disk response cache used by every API request
+        memo: In-process memo for resource URIs (defaults to the
+            process-wide memo shared by all clients)
+        page_concurrency: Maximum number of pages of one list query
+            fetched at once (1 follows ``meta.next`` serially)
+        snapshot: Answer every query from this meeting snapshot instead
+            of the network (see ``ietf2vcon snapshot``)
+        max_connections: Size of the HTTP connection pool; connections are
+            kept alive and reused by every thread sharing the client
+        chairs_ttl: Seconds cached group chairs are reused
+        agenda_data: Build sessions from the meeting's agenda-data document
+            (one request per meeting) instead of the session, assignment,
+            timeslot and room resources; the resource API is still used for
+            groups or fields the document lacks
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        cache: ResponseCache | None = None,
+        memo: ResourceMemo | None = None,
+        page_concurrency: int = 8,
+        snapshot: MeetingSnapshot | None = None,
+        max_connections: int = 20,
+        chairs_ttl: float = CHAIRS_TTL,
+        agenda_data: bool = False,
+    ):
+        self.cache = cache
+        self.snapshot = snapshot
+        if memo is None:
+            # Keep snapshot answers separate from live data fetched elsewhere
+            memo = ResourceMemo() if snapshot is not None else _resource_memo
+        self.memo = memo
+        self.chairs = ChairRoster() if snapshot is not None else _chair_roster
+        self.chairs_ttl = chairs_ttl
+        self.page_concurrency = page_concurrency
+        self.agenda_data = agenda_data
         self.client = httpx.Client(
             base_url=BASE_URL,
             timeout=timeout,
             headers={"Accept": "application/json"},
             follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=30.0,
+            ),
+            event_hooks=rate_limit_hooks(),
         )
+        # meeting number -> {session_id: schedule entry}
+        self._schedules: dict[int, dict[str, dict[str, Any]]] = {}
+        self._schedule_lock = threading.Lock()
+        # meeting number -> {group acronym: materials}
+        self._meeting_materials: dict[int, dict[str, list[IETFMaterial]]] = {}
+        self._materials_lock = threading.Lock()
+        # meeting number -> {group acronym: (sessions, materials)}, or None
+        # if the meeting has no usable agenda data
+        self._agendas: dict[
+            int, dict[str, tuple[list[IETFSession], list[IETFMaterial]]] | None
+        ] = {}
+        self._agenda_lock = threading.Lock()
 
     def close(self):
         """Close the HTTP client."""
@@ -41,62 +478,291 @@ class DataTrackerClient:
     def __exit__(self, *args):
         self.close()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     def _get(self, url: str, params: dict | None = None) -> dict[str, Any]:
-        """Make a GET request with retry logic."""
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        """Make a GET request, answering from the response cache if possible.
+
+        Fresh cache entries are returned without a request. Stale entries are
+        revalidated with a conditional GET and reused on 304 Not Modified.
+        With a snapshot attached, every request is answered from it.
+        """
+        if self.snapshot is not None:
+            return self.snapshot.query(url, params)
+
+        if self.cache is None:
+            return self._fetch(url, params).json()
+
+        body, cached = self._lookup_cache(url, params)
+        if body is not None:
+            return body
+
+        headers = self.cache.conditional_headers(cached) if cached else None
+        response = self._fetch(url, params, headers=headers)
+        return self._update_cache(url, params, response, cached)
+
+    def _get_resource(self, uri: str) -> dict[str, Any]:
+        """Dereference a resource URI such as /api/v1/group/group/2383/.
+
+        Resources are memoized process-wide, and concurrent requests for the
+        same URI from several threads share a single HTTP request.
+        """
+        path = uri.removeprefix(BASE_URL)
+        return self.memo.get_or_load(path, lambda: self._get(path))
+
+    def _get_resources(
+        self,
+        list_url: str,
+        uris: list[str],
+        key_field: str = "id",
+        chunk_size: int = 100,
+    ) -> dict[str, dict[str, Any]]:
+        """Dereference many resource URIs of one type in batched list queries.
+
+        URIs already in the memo are served from it; the rest are fetched with
+        ``{key_field}__in`` filters in chunks and added to the memo.
+
+        Args:
+            list_url: List endpoint for the resource type, e.g. /api/v1/group/group/
+            uris: Resource URIs to resolve
+            key_field: Field whose value is the last URI path segment
+            chunk_size: Maximum number of keys per query
+
+        Returns:
+            Dictionary mapping each resolved URI path to its resource
+        """
+        resources: dict[str, dict[str, Any]] = {}
+        missing: dict[str, str] = {}
+        for uri in dict.fromkeys(u.removeprefix(BASE_URL) for u in uris if u):
+            cached = self.memo.get(uri)
+            if cached is not None:
+                resources[uri] = cached
+            elif key := self._uri_id(uri):
+                missing[key] = uri
+
+        keys = list(missing)
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            for obj in self._iter_paginated(list_url, {f"{key_field}__in": ",".join(chunk)}):
+                uri = obj.get("resource_uri") or missing.get(str(obj.get(key_field)))
+                if not uri:
+                    continue
+                self.memo.put(uri, obj)
+                resources[uri] = obj
+
+        return resources
+
+    @http_retry()
+    def _fetch(
+        self, url: str, params: dict | None = None, headers: dict | None = None
+    ) -> httpx.Response:
+        """Make a GET request, retrying transient failures."""
+        response = self.client.get(url, params=params, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
 
     def _get_paginated(self, url: str, params: dict | None = None) -> list[dict[str, Any]]:
         """Get all results from a paginated API endpoint."""
-        results = []
-        params = params or {}
-        params["limit"] = 100
+        return list(self._iter_paginated(url, params))
+
+    def _iter_paginated(
+        self, url: str, params: dict | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield results from a paginated API endpoint as pages arrive.
+
+        The first page is fetched alone to learn ``meta.total_count``; the
+        remaining offsets are then requested concurrently (at most
+        ``page_concurrency`` at a time) and yielded in their original order.
+        Responses without a total are followed serially via ``meta.next``.
+        """
+        params = dict(params or {})
+        params["limit"] = PAGE_SIZE
+
+        data = self._get(url, params)
+        yield from data.get("objects", [])
+
+        meta = data.get("meta", {})
+        next_url = meta.get("next")
+        total = meta.get("total_count")
+
+        if not next_url:
+            return
 
-        while url:
-            data = self._get(url, params)
-            results.extend(data.get("objects", []))
+        if total is None or self.page_concurrency <= 1:
+            while next_url:
+                data = self._get(next_url)  # params are in the URL now
+                yield from data.get("objects", [])
+                next_url = data.get("meta", {}).get("next")
+            return
 
-            # Get next page URL
-            meta = data.get("meta", {})
-            next_url = meta.get("next")
-            if next_url:
-                url = next_url
-                params = None  # params are in the URL now
-            else:
-                break
+        page_size = meta.get("limit") or PAGE_SIZE
+        offsets = range(page_size, total, page_size)
+        if not offsets:
+            return
 
-        return results
+        executor = ThreadPoolExecutor(max_workers=min(self.page_concurrency, len(offsets)))
+        try:
+            futures = [
+                executor.submit(self._get, url, {**params, "offset": offset})
+                for offset in offsets
+            ]
+            for future in futures:
+                yield from future.result().get("objects", [])
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def get_meeting(self, meeting_number: int) -> IETFMeeting | None:
         """Get metadata for an IETF meeting by number."""
         try:
-            data = self._get(f"/api/v1/meeting/meeting/", {"number": meeting_number})
-            objects = data.get("objects", [])
-            if not objects:
+            meeting = self._get_meeting_data(meeting_number)
+            if not meeting:
                 return None
 
-            meeting = objects[0]
-            return IETFMeeting(
-                number=meeting_number,
-                city=meeting.get("city"),
-                country=meeting.get("country"),
-                start_date=self._parse_date(meeting.get("date")),
-                time_zone=meeting.get("time_zone"),
-            )
+            return self._build_meeting(meeting_number, meeting)
         except Exception as e:
             logger.error(f"Failed to get meeting {meeting_number}: {e}")
             return None
 
+    def _get_meeting_data(self, meeting_number: int) -> dict[str, Any] | None:
+        """Get the raw meeting resource for a meeting number."""
+        data = self._get("/api/v1/meeting/meeting/", {"number": meeting_number})
+        objects = data.get("objects", [])
+        return objects[0] if objects else None
+
+    def get_meeting_schedule(self, meeting_number: int) -> dict[str, dict[str, Any]]:
+        """Get the scheduled time and room of every session at a meeting.
+
+        Pulls all schedule assignments, timeslots and rooms for the meeting in
+        a few bulk paginated calls and joins them in memory. The result is
+        cached on the client, so later session lookups for the same meeting
+        make no further schedule requests.
+
+        Args:
+            meeting_number: IETF meeting number
+
+        Returns:
+            Dictionary mapping session ID to a dict with ``start_time``,
+            ``duration_seconds`` and ``room``
+        """
+        with self._schedule_lock:
+            if meeting_number in self._schedules:
+                return self._schedules[meeting_number]
+
+            schedule: dict[str, dict[str, Any]] = {}
+            try:
+                meeting = self._get_meeting_data(meeting_number)
+                assignments = self._get_paginated(
+                    "/api/v1/meeting/schedtimesessassignment/",
+                    self._assignment_params(meeting_number, meeting),
+                )
+                timeslots = self._get_paginated(
+                    "/api/v1/meeting/timeslot/", {"meeting__number": meeting_number}
+                )
+                rooms = self._get_paginated(
+                    "/api/v1/meeting/room/", {"meeting__number": meeting_number}
+                )
+                schedule = self._join_schedule(assignments, timeslots, rooms)
+                self._schedules[meeting_number] = schedule
+
+            except Exception as e:
+                logger.error(f"Failed to get schedule for meeting {meeting_number}: {e}")
+
+            return schedule
+
+    def get_agenda(
+        self, meeting_number: int
+    ) -> dict[str, tuple[list[IETFSession], list[IETFMaterial]]] | None:
+        """Get every group's sessions and links from the meeting's agenda-data.
+
+        The Datatracker publishes the whole agenda of a meeting (sessions,
+        groups, times, rooms, agenda documents and recordings) as a single
+        JSON document. It is fetched once per meeting and cached on the
+        client. Sessions without a time there are completed from the bulk
+        schedule (see :meth:`get_meeting_schedule`).
+
+        Args:
+            meeting_number: IETF meeting number
+
+        Returns:
+            Dictionary mapping group acronym to its (sessions, materials), or
+            None if the agenda data is unavailable
+        """
+        with self._agenda_lock:
+            if meeting_number in self._agendas:
+                return self._agendas[meeting_number]
+
+            agenda = None
+            try:
+                data = self._get(AGENDA_DATA_PATH.format(number=meeting_number))
+                agenda = self._split_agenda(meeting_number, data.get("schedule") or [])
+            except Exception as e:
+                logger.warning(
+                    f"Agenda data unavailable for meeting {meeting_number}, "
+                    f"using the resource API: {e}"
+                )
+
+            self._agendas[meeting_number] = agenda or None
+            return self._agendas[meeting_number]
+
+    def _split_agenda(
+        self, meeting_number: int, items: list[dict[str, Any]]
+    ) -> dict[str, tuple[list[IETFSession], list[IETFMaterial]]]:
+        """Group agenda-data items into per-group sessions and materials."""
+        agenda: dict[str, tuple[list[IETFSession], list[IETFMaterial]]] = {}
+        seen: set[tuple] = set()
+        for item in sorted(items, key=lambda i: i.get("startDateTime") or ""):
+            acronym = item.get("groupAcronym") or item.get("acronym")
+            if not acronym or item.get("type") in AGENDA_SKIP_TYPES:
+                continue
+            # The same session may be listed more than once; items without a
+            # session id are told apart by group, start time and room
+            session_id = item.get("sessionId")
+            key = (
+                ("id", str(session_id)) if session_id is not None
+                else ("slot", acronym, item.get("startDateTime"), item.get("room"))
+            )
+            if key in seen:
+                continue
+            seen.add(key)
+
+            sessions, materials = agenda.setdefault(acronym, ([], []))
+            sessions.append(self._build_agenda_session(meeting_number, item))
+            materials.extend(self._build_agenda_materials(item))
+
+        # Fall back to the resource API for sessions the agenda gives no time
+        incomplete = [
+            s for sessions, _ in agenda.values() for s in sessions
+            if s.start_time is None
+        ]
+        if incomplete:
+            schedule = self.get_meeting_schedule(meeting_number)
+            for session in incomplete:
+                scheduled = schedule.get(session.session_id, {})
+                session.start_time = session.start_time or scheduled.get("start_time")
+                session.duration_seconds = (
+                    session.duration_seconds or scheduled.get("duration_seconds")
+                )
+                session.room = session.room or scheduled.get("room")
+
+        return agenda
+
     def get_group_sessions(
         self, meeting_number: int, group_acronym: str
     ) -> list[IETFSession]:
         """Get sessions for a specific working group at a meeting.
 
         This method queries the API directly for the specific group,
-        avoiding the need to fetch all sessions.
+        avoiding the need to fetch all sessions. Start time, duration and
+        room are looked up in the meeting-wide schedule
+        (see :meth:`get_meeting_schedule`).
+
+        With ``agenda_data`` enabled, the group's sessions come from the
+        meeting's agenda document instead (see :meth:`get_agenda`).
         """
+        if self.agenda_data:
+            agenda = self.get_agenda(meeting_number)
+            if agenda is not None and group_acronym in agenda:
+                return list(agenda[group_acronym][0])
+
         sessions = []
         try:
             # Query sessions directly filtered by group and meeting
@@ -108,60 +774,21 @@ class DataTrackerClient:
                 },
             )
 
-            for session_data in data:
-                session_id = session_data.get("id") or str(session_data.get("pk", ""))
+            schedule = self.get_meeting_schedule(meeting_number) if data else {}
 
-                # Get group name
+            for session_data in data:
+                # Get group name (memoized, so fetched once for all sessions)
                 group_uri = session_data.get("group")
                 group_name = None
                 if group_uri:
                     try:
-                        group_data = self._get(group_uri)
-                        group_name = group_data.get("name")
+                        group_name = self._get_resource(group_uri).get("name")
                     except Exception:
                         pass
 
-                # Get scheduled time from assignment
-                start_time = None
-                duration = None
-                room = None
-
-                # Try to get schedule assignment for this session
-                try:
-                    assignments = self._get(
-                        "/api/v1/meeting/schedtimesessassignment/",
-                        {
-                            "session": session_data.get("id"),
-                            "schedule__meeting__number": meeting_number,
-                            "limit": 1,
-                        },
-                    )
-                    if assignments.get("objects"):
-                        assignment = assignments["objects"][0]
-                        timeslot_uri = assignment.get("timeslot")
-                        if timeslot_uri:
-                            timeslot = self._get(timeslot_uri)
-                            start_time = self._parse_datetime(timeslot.get("time"))
-                            duration = timeslot.get("duration")
-                            location_uri = timeslot.get("location")
-                            if location_uri:
-                                try:
-                                    location = self._get(location_uri)
-                                    room = location.get("name")
-                                except Exception:
-                                    pass
-                except Exception as e:
-                    logger.debug(f"Could not get schedule for session: {e}")
-
                 sessions.append(
-                    IETFSession(
-                        meeting_number=meeting_number,
-                        group_acronym=group_acronym,
-                        session_id=str(session_id) or f"{group_acronym}-{meeting_number}",
-                        name=group_name or session_data.get("name"),
-                        start_time=start_time,
-                        duration_seconds=self._parse_duration(duration) if duration else None,
-                        room=room,
+                    self._build_session(
+                        meeting_number, group_acronym, session_data, schedule, group_name
                     )
                 )
 
@@ -175,10 +802,19 @@ class DataTrackerClient:
 
         Note: This fetches sessions with minimal detail for listing purposes.
         For full session data, use get_group_sessions with a specific group.
+        Times and rooms are filled in from the bulk meeting schedule.
+
+        With ``agenda_data`` enabled, all sessions are built from the
+        meeting's agenda document in one request (see :meth:`get_agenda`).
 
         Args:
             meeting_number: IETF meeting number
         """
+        if self.agenda_data:
+            agenda = self.get_agenda(meeting_number)
+            if agenda is not None:
+                return [s for sessions, _ in agenda.values() for s in sessions]
+
         sessions = []
         try:
             # Get all sessions using pagination
@@ -189,33 +825,25 @@ class DataTrackerClient:
                 },
             )
 
-            for session_data in all_sessions:
-                session_id = session_data.get("id") or str(session_data.get("pk", ""))
+            schedule = self.get_meeting_schedule(meeting_number) if all_sessions else {}
 
-                # Get group info from the URI
-                group_uri = session_data.get("group")
-                group_acronym = "unknown"
-                group_name = None
+            # Resolve every group in a few batched queries instead of one each
+            groups = self._get_resources(
+                "/api/v1/group/group/",
+                [s.get("group") for s in all_sessions if s.get("group")],
+            )
 
-                if group_uri:
-                    # Extract acronym from URI path: /api/v1/group/group/xxx/
-                    # We'll fetch it to be accurate
-                    try:
-                        group_data = self._get(group_uri)
-                        group_acronym = group_data.get("acronym", "unknown")
-                        group_name = group_data.get("name")
-                    except Exception:
-                        pass
+            for session_data in all_sessions:
+                group_uri = session_data.get("group")
+                group_data = groups.get(group_uri, {}) if group_uri else {}
 
                 sessions.append(
-                    IETFSession(
-                        meeting_number=meeting_number,
-                        group_acronym=group_acronym,
-                        session_id=str(session_id),
-                        name=group_name or session_data.get("name"),
-                        start_time=None,  # Skip for listing
-                        duration_seconds=None,
-                        room=None,
+                    self._build_session(
+                        meeting_number,
+                        group_data.get("acronym", "unknown"),
+                        session_data,
+                        schedule,
+                        group_data.get("name"),
                     )
                 )
 
@@ -227,95 +855,250 @@ class DataTrackerClient:
     def get_session_materials(
         self, meeting_number: int, group_acronym: str
     ) -> list[IETFMaterial]:
-        """Get all materials (slides, agendas, etc.) for a session."""
+        """Get all materials (slides, agendas, etc.) for a session.
+
+        Documents are resolved in batched ``name__in`` queries. If
+        :meth:`get_meeting_materials` has already loaded the meeting, the
+        group's materials are served from that without further requests.
+        """
         materials = []
 
-        try:
-            # Get documents for the session
-            data = self._get_paginated(
-                f"/api/v1/meeting/sessionpresentation/",
-                {"session__meeting__number": meeting_number, "session__group__acronym": group_acronym},
+        meeting_materials = self._meeting_materials.get(meeting_number)
+        if meeting_materials is not None:
+            materials = list(meeting_materials.get(group_acronym, []))
+        else:
+            try:
+                # Get documents for the session
+                data = self._get_paginated(
+                    "/api/v1/meeting/sessionpresentation/",
+                    {
+                        "session__meeting__number": meeting_number,
+                        "session__group__acronym": group_acronym,
+                    },
+                )
+                materials = self._presentations_to_materials(meeting_number, data)
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to get materials for {group_acronym} at {meeting_number}: {e}"
+                )
+
+        if self.agenda_data:
+            materials += self._missing_agenda_materials(
+                meeting_number, group_acronym, materials
             )
 
-            for item in data:
-                doc_uri = item.get("document")
-                if not doc_uri:
-                    continue
+        return materials + self._session_page_materials(meeting_number, group_acronym)
+
+    def _missing_agenda_materials(
+        self, meeting_number: int, group_acronym: str, materials: list[IETFMaterial]
+    ) -> list[IETFMaterial]:
+        """Return agenda-data documents and recordings the API did not list."""
+        agenda = self.get_agenda(meeting_number)
+        if agenda is None or group_acronym not in agenda:
+            return []
+
+        have_agenda = any(m.type == "agenda" for m in materials)
+        urls = {m.url for m in materials}
+        return [
+            m for m in agenda[group_acronym][1]
+            if m.url not in urls and not (m.type == "agenda" and have_agenda)
+        ]
+
+    def get_meeting_materials(self, meeting_number: int) -> dict[str, list[IETFMaterial]]:
+        """Get the materials of every session at a meeting in bulk.
+
+        Fetches all session presentations for the meeting in one paginated
+        query, resolves their documents and sessions' groups in batches, and
+        splits the result by group. The result is cached on the client and
+        used by later :meth:`get_session_materials` calls.
+
+        Args:
+            meeting_number: IETF meeting number
+
+        Returns:
+            Dictionary mapping group acronym to the documents presented in
+            its sessions (without the agenda/notes page links)
+        """
+        with self._materials_lock:
+            if meeting_number in self._meeting_materials:
+                return self._meeting_materials[meeting_number]
+
+            by_group: dict[str, list[IETFMaterial]] = {}
+            try:
+                presentations = self._get_paginated(
+                    "/api/v1/meeting/sessionpresentation/",
+                    {"session__meeting__number": meeting_number},
+                )
+                sessions = self._get_paginated(
+                    "/api/v1/meeting/session/", {"meeting__number": meeting_number}
+                )
+                groups = self._get_resources(
+                    "/api/v1/group/group/",
+                    [s.get("group") for s in sessions if s.get("group")],
+                )
+                session_groups = {
+                    s.get("resource_uri"): groups.get(s.get("group"), {}).get("acronym")
+                    for s in sessions
+                }
+
+                by_session: dict[str, list[dict[str, Any]]] = {}
+                for item in presentations:
+                    by_session.setdefault(item.get("session"), []).append(item)
+
+                # Resolve all documents up front in one batched pass
+                self._get_resources(
+                    "/api/v1/doc/document/",
+                    [p.get("document") for p in presentations if p.get("document")],
+                    key_field="name",
+                )
+                for session_uri, items in by_session.items():
+                    acronym = session_groups.get(session_uri)
+                    if acronym:
+                        by_group.setdefault(acronym, []).extend(
+                            self._presentations_to_materials(meeting_number, items)
+                        )
 
-                doc_data = self._get(doc_uri)
-                doc_name = doc_data.get("name", "")
-                doc_title = doc_data.get("title", doc_name)
-
-                # Determine material type from name
-                if "slides" in doc_name:
-                    mat_type = "slides"
-                    mimetype = "application/pdf"
-                elif "agenda" in doc_name:
-                    mat_type = "agenda"
-                    mimetype = "application/pdf"
-                elif "minutes" in doc_name:
-                    mat_type = "minutes"
-                    mimetype = "application/pdf"
-                elif "recording" in doc_name:
-                    mat_type = "recording"
-                    mimetype = "text/html"
-                elif "chatlog" in doc_name:
-                    mat_type = "chatlog"
-                    mimetype = "text/plain"
-                elif "bluesheets" in doc_name:
-                    mat_type = "bluesheets"
-                    mimetype = "application/pdf"
-                else:
-                    mat_type = "document"
-                    mimetype = "application/pdf"
-
-                # Build material URL
-                # Materials are at /meeting/{num}/materials/{doc-name}
-                url = f"{BASE_URL}/meeting/{meeting_number}/materials/{doc_name}"
-
-                # For recordings, try to get the external URL
-                external_url = doc_data.get("external_url")
+                self._meeting_materials[meeting_number] = by_group
 
+            except Exception as e:
+                logger.error(f"Failed to get materials for meeting {meeting_number}: {e}")
+
+            return by_group
+
+    def _presentations_to_materials(
+        self, meeting_number: int, presentations: list[dict[str, Any]]
+    ) -> list[IETFMaterial]:
+        """Build materials from sessionpresentation rows, batching document lookups."""
+        documents = self._get_resources(
+            "/api/v1/doc/document/",
+            [p.get("document") for p in presentations if p.get("document")],
+            key_field="name",
+        )
+
+        materials = []
+        for item in presentations:
+            doc_data = documents.get(item.get("document"))
+            if doc_data:
                 materials.append(
-                    IETFMaterial(
-                        type=mat_type,
-                        title=doc_title,
-                        url=external_url or url,
-                        filename=f"{doc_name}.pdf" if mimetype == "application/pdf" else doc_name,
-                        mimetype=mimetype,
-                        order=item.get("order"),
-                    )
+                    self._build_material(meeting_number, doc_data, item.get("order"))
                 )
+        return materials
 
-        except Exception as e:
-            logger.error(f"Failed to get materials for {group_acronym} at {meeting_number}: {e}")
+    def get_changed_groups(self, meeting_number: int, since: datetime) -> set[str]:
+        """Find the groups whose sessions or materials changed since a time.
 
-        # Also add agenda URL
-        agenda_url = f"{BASE_URL}/meeting/{meeting_number}/agenda/{group_acronym}/"
-        materials.append(
-            IETFMaterial(
-                type="agenda",
-                title=f"{group_acronym.upper()} Agenda",
-                url=agenda_url,
-                mimetype="text/html",
-            )
+        Looks for sessions modified since ``since``, schedule assignments
+        modified since then (moved or rescheduled sessions), and session
+        presentations whose document was updated since then (new slides,
+        minutes, recordings). Each is one filtered paginated query; their
+        sessions and groups are then resolved in batches.
+
+        Args:
+            meeting_number: IETF meeting number
+            since: High-water mark of the previous refresh
+
+        Returns:
+            Acronyms of the groups to reconvert
+
+        Raises:
+            httpx.HTTPError: If the Datatracker cannot be queried
+        """
+        stamp = since.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+        sessions = self._get_paginated(
+            "/api/v1/meeting/session/",
+            {"meeting__number": meeting_number, "modified__gte": stamp},
+        )
+        assignments = self._get_paginated(
+            "/api/v1/meeting/schedtimesessassignment/",
+            {"schedule__meeting__number": meeting_number, "modified__gte": stamp},
+        )
+        presentations = self._get_paginated(
+            "/api/v1/meeting/sessionpresentation/",
+            {"session__meeting__number": meeting_number, "document__time__gte": stamp},
         )
 
-        # Add notes URL (collaborative notes)
-        notes_url = f"https://notes.ietf.org/notes-ietf-{meeting_number}-{group_acronym}"
-        materials.append(
-            IETFMaterial(
-                type="minutes",
-                title=f"{group_acronym.upper()} Notes",
-                url=notes_url,
-                mimetype="text/markdown",
-            )
+        group_uris = [s.get("group") for s in sessions if s.get("group")]
+        touched = self._get_resources(
+            "/api/v1/meeting/session/",
+            [item.get("session") for item in assignments + presentations],
         )
+        group_uris += [s.get("group") for s in touched.values() if s.get("group")]
 
-        return materials
+        groups = self._get_resources("/api/v1/group/group/", group_uris)
+        changed = {g["acronym"] for g in groups.values() if g.get("acronym")}
+        logger.info(
+            f"IETF {meeting_number}: {len(changed)} groups changed since {stamp}"
+        )
+        return changed
+
+    def prefetch_group_chairs(self, refresh: bool = False) -> dict[str, list[IETFPerson]]:
+        """Load the current chairs of every group in bulk.
+
+        All chair roles come from one paginated role query; their groups and
+        persons are then resolved in batched list queries, and email
+        addresses are read from the email resource URIs. The roster is cached
+        for ``chairs_ttl`` seconds and serves later :meth:`get_group_chairs`
+        calls without requests; while it is fresh, calling this again returns
+        it without querying.
+
+        Args:
+            refresh: Reload the roster even if the cached one is fresh
+
+        Returns:
+            Dictionary mapping group acronym to its chairs
+        """
+        if not refresh:
+            cached = self.chairs.complete(self.chairs_ttl)
+            if cached is not None:
+                logger.debug(f"Reusing chair roster of {len(cached)} groups")
+                return cached
+
+        roster: dict[str, list[IETFPerson]] = {}
+        try:
+            roles = self._get_paginated("/api/v1/group/role/", {"name__slug": "chair"})
+            groups = self._get_resources(
+                "/api/v1/group/group/", [r.get("group") for r in roles if r.get("group")]
+            )
+            persons = self._get_resources(
+                "/api/v1/person/person/", [r.get("person") for r in roles if r.get("person")]
+            )
+
+            for role in roles:
+                acronym = groups.get(role.get("group"), {}).get("acronym")
+                person = persons.get(role.get("person"))
+                if not acronym or not person:
+                    continue
+
+                name = person.get("name", "Unknown")
+                chairs = roster.setdefault(acronym, [])
+                # Avoid duplicates
+                if any(c.name == name for c in chairs):
+                    continue
+                chairs.append(
+                    IETFPerson(name=name, email=self._uri_id(role.get("email")), role="chair")
+                )
+
+            self.chairs.replace_all(roster)
+            logger.info(f"Loaded chairs for {len(roster)} groups")
+
+        except Exception as e:
+            logger.error(f"Failed to prefetch group chairs: {e}")
+
+        return roster
 
     def get_group_chairs(self, group_acronym: str) -> list[IETFPerson]:
-        """Get current chairs for a working group."""
+        """Get current chairs for a working group.
+
+        Served from the chair roster when it is fresh (see
+        :meth:`prefetch_group_chairs`); otherwise the group's roles are
+        queried and the result is cached.
+        """
+        cached = self.chairs.get(group_acronym, self.chairs_ttl)
+        if cached is not None:
+            return cached
+
         chairs = []
         seen_names = set()
 
@@ -336,7 +1119,7 @@ class DataTrackerClient:
                     continue
 
                 try:
-                    person_data = self._get(person_uri)
+                    person_data = self._get_resource(person_uri)
                     name = person_data.get("name", "Unknown")
 
                     # Avoid duplicates
@@ -348,7 +1131,7 @@ class DataTrackerClient:
                     email = None
                     if email_uri:
                         try:
-                            email_data = self._get(email_uri)
+                            email_data = self._get_resource(email_uri)
                             email = email_data.get("address")
                         except Exception:
                             pass
@@ -363,49 +1146,9 @@ class DataTrackerClient:
                 except Exception as e:
                     logger.debug(f"Could not fetch person data: {e}")
 
+            self.chairs.put(group_acronym, chairs)
+
         except Exception as e:
             logger.error(f"Failed to get chairs for {group_acronym}: {e}")
 
         return chairs
-
-    def get_recording_url(self, meeting_number: int, group_acronym: str) -> str | None:
-        """Get the Meetecho recording URL for a session."""
-        # Meetecho recordings follow a predictable pattern
-        # https://meetings.conf.meetecho.com/ietf{num}/?session={session-id}
-        return f"https://meetings.conf.meetecho.com/ietf{meeting_number}/?group={group_acronym}"
-
-    def get_youtube_playlist_url(self, meeting_number: int) -> str:
-        """Get the YouTube playlist URL for an IETF meeting."""
-        return f"https://www.youtube.com/playlist?list=PLC86T-6ZTP5g-mLpb6ER0j63i8yD6dDNq"
-
-    def _parse_date(self, date_str: str | None) -> datetime | None:
-        """Parse a date string from the API."""
-        if not date_str:
-            return None
-        try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except Exception:
-            return None
-
-    def _parse_datetime(self, dt_str: str | None) -> datetime | None:
-        """Parse a datetime string from the API."""
-        if not dt_str:
-            return None
-        try:
-            return datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
-        except Exception:
-            return None
-
-    def _parse_duration(self, duration_str: str) -> int | None:
-        """Parse a duration string (HH:MM:SS) to seconds."""
-        try:
-            parts = duration_str.split(":")
-            if len(parts) == 3:
-                h, m, s = int(parts[0]), int(parts[1]), int(parts[2])
-                return h * 3600 + m * 60 + s
-            elif len(parts) == 2:
-                m, s = int(parts[0]), int(parts[1])
-                return m * 60 + s
-        except Exception:
-            pass
-        return None
@@ -0,0 +1,136 @@
+"""Placing existing files into download directories without copying them.
+
+Mirror hits and blob store hits are already on disk, often on the same
+filesystem as the output directory. ``link_file`` puts such a file at its
+destination using the cheapest method that works: a reflink (copy-on-write
+clone), a hardlink, a symlink, and only then a real copy.
+
+Strategies:
+    auto      reflink, hardlink, symlink, then copy
+    reflink   reflink, then copy
+    hardlink  hardlink, then copy
+    symlink   symlink, then copy
+    copy      always copy
+
+Across filesystems only a copy can give an independent file, so it is used
+directly.
+
+``atomic_write_json`` writes the small JSON state and cache files the same
+way: to a temporary file next to the target, then renamed over it.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+LINK_STRATEGIES = {
+    "auto": ("reflink", "hardlink", "symlink", "copy"),
+    "reflink": ("reflink", "copy"),
+    "hardlink": ("hardlink", "copy"),
+    "symlink": ("symlink", "copy"),
+    "copy": ("copy",),
+}
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Clone ``src`` to ``dest`` sharing its data blocks (Btrfs, XFS, ...)."""
+    import fcntl
+
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    shutil.copystat(src, dest)
+
+
+def _hardlink(src: Path, dest: Path) -> None:
+    os.link(src, dest)
+
+
+def _symlink(src: Path, dest: Path) -> None:
+    os.symlink(src.resolve(), dest)
+
+
+def _copy(src: Path, dest: Path) -> None:
+    shutil.copy2(src, dest)
+
+
+_METHODS = {
+    "reflink": _reflink,
+    "hardlink": _hardlink,
+    "symlink": _symlink,
+    "copy": _copy,
+}
+
+
+def link_file(src: Path, dest: Path, strategy: str = "auto") -> str:
+    """Place ``src`` at ``dest``, replacing any existing file atomically.
+
+    Args:
+        src: Existing file
+        dest: Destination path (its directory must exist)
+        strategy: One of LINK_STRATEGIES
+
+    Returns:
+        The method that succeeded (reflink, hardlink, symlink or copy)
+
+    Raises:
+        ValueError: If the strategy is unknown
+        OSError: If even copying fails
+    """
+    if strategy not in LINK_STRATEGIES:
+        raise ValueError(
+            f"Unknown link strategy {strategy!r}; expected one of {sorted(LINK_STRATEGIES)}"
+        )
+
+    methods = LINK_STRATEGIES[strategy]
+    if os.stat(src).st_dev != os.stat(dest.parent).st_dev:
+        methods = ("copy",)
+
+    fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        for method in methods:
+            tmp.unlink(missing_ok=True)
+            try:
+                _METHODS[method](src, tmp)
+            except OSError as e:
+                if method == methods[-1]:
+                    raise
+                logger.debug(f"{method} {src} -> {dest} failed: {e}")
+                continue
+            os.replace(tmp, dest)
+            return method
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    raise AssertionError("unreachable")
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Write ``data`` as JSON to ``path``, replacing any existing file atomically.
+
+    Readers see either the old file or the complete new one, never a
+    partial write. The parent directory is created if needed.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable value
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
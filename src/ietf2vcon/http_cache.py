@@ -0,0 +1,219 @@
+"""HTTP response caching for the Datatracker API.
+
+Responses are stored as JSON files keyed by URL plus query parameters,
+together with the ``ETag`` and ``Last-Modified`` validators the server
+returned. Fresh entries are served without a request, stale entries are
+revalidated with a conditional GET, and in offline mode every lookup is
+answered from disk. Data for past meetings never changes, so re-running a
+conversion against a warm cache makes almost no network calls.
+
+Cache layout:
+    {cache_dir}/{key[:2]}/{key}.json
+
+``ResourceMemo`` is the in-process layer above it: a bounded LRU of
+dereferenced resource URIs shared by every client in the process, with
+single-flight loading so concurrent lookups of one URI make one request.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from .file_links import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 3600.0
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a response is not in the cache."""
+
+
+@dataclass
+class CachedResponse:
+    """A cached JSON response and its validators."""
+
+    body: Any
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """Disk-backed cache of JSON API responses.
+
+    Args:
+        cache_dir: Directory to store cached responses in
+        ttl: Seconds an entry is served without revalidation
+            (None means entries never go stale)
+        offline: If True, never hit the network; misses raise CacheMissError
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float | None = DEFAULT_TTL,
+        offline: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.offline = offline
+
+    @staticmethod
+    def key(url: str, params: dict | None = None) -> str:
+        """Compute the cache key for a URL and its query parameters."""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, url: str, params: dict | None = None) -> CachedResponse | None:
+        """Look up a cached response, fresh or stale."""
+        path = self._path(self.key(url, params))
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        return CachedResponse(
+            body=data.get("body"),
+            fetched_at=data.get("fetched_at", 0.0),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+
+    def put(
+        self,
+        url: str,
+        params: dict | None,
+        body: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedResponse:
+        """Store a response, replacing any previous entry atomically."""
+        entry = CachedResponse(
+            body=body,
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+        atomic_write_json(
+            self._path(self.key(url, params)),
+            {
+                "url": url,
+                "params": params,
+                "fetched_at": entry.fetched_at,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body": body,
+            },
+        )
+
+        return entry
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Return True if an entry can be served without revalidation."""
+        if self.ttl is None:
+            return True
+        return time.time() - entry.fetched_at < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: CachedResponse) -> dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for an entry."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+
+class ResourceMemo:
+    """Thread-safe bounded LRU memo with single-flight loading.
+
+    Concurrent ``get_or_load`` calls for the same key share one loader call;
+    waiters receive its result (or its exception). Failures are not cached.
+
+    Args:
+        maxsize: Maximum number of entries kept before evicting the least
+            recently used
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Any | None:
+        """Return a memoized value, or None if absent."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._store(key, value)
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the value for key, calling loader at most once concurrently."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all memoized entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,101 @@
+"""Incremental refresh state for repeated meeting conversions.
+
+During a live IETF week recordings and slides keep appearing, and
+``convert-all`` is re-run several times a day. Instead of re-resolving every
+group, an incremental run asks the Datatracker which sessions, schedule
+assignments and presented documents changed since the previous run's
+high-water mark (see ``DataTrackerClient.get_changed_groups``) and
+reconverts only those groups.
+
+State is one small JSON file per meeting:
+    {state_dir}/ietf{meeting}.json
+        {"high_water": "<ISO timestamp>", "pending": [group, ...]}
+
+``pending`` holds groups whose conversion failed, so they are retried on the
+next run even if nothing about them changed.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .file_links import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+# Step back from the recorded start time so changes made while the previous
+# run was resolving groups are not missed
+DEFAULT_OVERLAP = timedelta(minutes=5)
+
+
+@dataclass
+class RefreshState:
+    """Where the last incremental run of a meeting left off."""
+
+    meeting_number: int
+    high_water: datetime | None = None
+    pending: list[str] = field(default_factory=list)
+
+
+class RefreshStateStore:
+    """JSON files holding the refresh state of each meeting.
+
+    Args:
+        state_dir: Directory to keep the state files in
+        overlap: How far before a run's start the next high-water mark is set
+    """
+
+    def __init__(self, state_dir: Path, overlap: timedelta = DEFAULT_OVERLAP):
+        self.state_dir = state_dir
+        self.overlap = overlap
+
+    def _path(self, meeting_number: int) -> Path:
+        return self.state_dir / f"ietf{meeting_number}.json"
+
+    def load(self, meeting_number: int) -> RefreshState:
+        """Load a meeting's state (empty if it has never been refreshed)."""
+        path = self._path(meeting_number)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return RefreshState(meeting_number)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable refresh state {path}: {e}")
+            return RefreshState(meeting_number)
+
+        high_water = data.get("high_water")
+        return RefreshState(
+            meeting_number=meeting_number,
+            high_water=datetime.fromisoformat(high_water) if high_water else None,
+            pending=list(data.get("pending", [])),
+        )
+
+    def save(
+        self,
+        meeting_number: int,
+        started_at: datetime,
+        pending: list[str] | None = None,
+    ) -> RefreshState:
+        """Record a finished run, replacing the previous state atomically.
+
+        Args:
+            meeting_number: IETF meeting number
+            started_at: When the run started querying the Datatracker
+            pending: Groups that failed and must be retried next time
+
+        Returns:
+            The saved state
+        """
+        state = RefreshState(
+            meeting_number=meeting_number,
+            high_water=started_at.astimezone(timezone.utc) - self.overlap,
+            pending=sorted(set(pending or [])),
+        )
+        atomic_write_json(
+            self._path(meeting_number),
+            {"high_water": state.high_water.isoformat(), "pending": state.pending},
+        )
+
+        return state
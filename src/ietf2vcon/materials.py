@@ -4,32 +4,157 @@ Downloads slides, agendas, minutes, and other materials from the IETF Datatracke
 """
 
 import hashlib
+import json
 import logging
 import mimetypes
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import urlparse
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
+from .blob_store import BlobStore
+from .file_links import link_file
+from .mirror_manifest import ManifestEntry
 from .models import IETFMaterial
-from .rsync_mirror import find_local_file
+from .negative_cache import MATERIAL, NegativeCache
+from .ratelimit import rate_limit_hooks
+from .retry import http_retry
+from .rsync_mirror import find_local_entry
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 4
+CHUNK_SIZE = 1024 * 1024
+
+# One lock per partial download file, shared by every downloader in the
+# process, so concurrent downloads of the same URL never share a .part file
+_part_locks: dict[Path, threading.Lock] = {}
+_part_locks_lock = threading.Lock()
+
+
+def _part_lock(part: Path) -> threading.Lock:
+    """Return the lock guarding a partial download file."""
+    with _part_locks_lock:
+        return _part_locks.setdefault(part.resolve(), threading.Lock())
+
+
+@dataclass
+class DownloadedMaterial:
+    """A material saved to disk, with digests computed while writing it."""
+
+    path: Path
+    size: int
+    sha256: str
+    sha512: str
+
+
+class _Digests:
+    """Running size and SHA-256/SHA-512 digests of a byte stream."""
+
+    def __init__(self):
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+        self._sha512 = hashlib.sha512()
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        self._sha256.update(chunk)
+        self._sha512.update(chunk)
+
+    def result(self, path: Path) -> DownloadedMaterial:
+        return DownloadedMaterial(
+            path=path,
+            size=self.size,
+            sha256=self._sha256.hexdigest(),
+            sha512=self._sha512.hexdigest(),
+        )
+
+
+def _read_chunks(path: Path) -> Iterator[bytes]:
+    """Read a file in CHUNK_SIZE pieces."""
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _content_range_start(value: str | None) -> int | None:
+    """Return the first byte position of a Content-Range header (bytes 100-199/200)."""
+    try:
+        return int(value.split()[1].split("-")[0])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def hash_file(path: Path) -> DownloadedMaterial:
+    """Compute the SHA-256 and SHA-512 digests of a file in one streaming pass.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        The file with its size and digests
+    """
+    digests = _Digests()
+    for chunk in _read_chunks(path):
+        digests.update(chunk)
+    return digests.result(path)
+
 
 class MaterialsDownloader:
-    """Download and manage IETF meeting materials."""
+    """Download and manage IETF meeting materials.
+
+    Args:
+        download_dir: Directory downloaded files are saved in
+        timeout: HTTP timeout in seconds
+        mirror_dir: Local rsync mirror root checked before HTTP
+        negative_cache: Record of URLs known to return 404 (such as notes
+            pages that were never created); those are not requested again
+        max_workers: Materials downloaded at once by download_all_materials
+        per_host_limit: Maximum concurrent requests to any one host
+        blob_store: Content-addressed store checked before the mirror and
+            HTTP; hits are hardlinked into ``download_dir`` and new
+            downloads are added to it
+        link_strategy: How mirror hits are placed in ``download_dir``
+            (see ``file_links.LINK_STRATEGIES``; copies across filesystems)
+    """
 
     def __init__(
         self,
         download_dir: Path | None = None,
         timeout: float = 60.0,
         mirror_dir: Path | None = None,
+        negative_cache: NegativeCache | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+        blob_store: BlobStore | None = None,
+        link_strategy: str = "auto",
     ):
         self.download_dir = download_dir or Path("./materials")
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.mirror_dir = mirror_dir
-        self.client = httpx.Client(timeout=timeout, follow_redirects=True)
+        self.negative_cache = negative_cache
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.blob_store = blob_store
+        self.link_strategy = link_strategy
+        self._sha256: dict[str, str] = {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self.client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max(max_workers, per_host_limit),
+                max_keepalive_connections=max(max_workers, per_host_limit),
+            ),
+            event_hooks=rate_limit_hooks(),
+        )
 
     def close(self):
         """Close the HTTP client."""
@@ -41,97 +166,312 @@ class MaterialsDownloader:
     def __exit__(self, *args):
         self.close()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
-    def download_material(self, material: IETFMaterial) -> Path | None:
-        """Download a single material file.
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore bounding concurrent requests to a URL's host."""
+        host = urlparse(url).hostname or ""
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(
+                    self.per_host_limit
+                )
+            return slot
+
+    @http_retry()
+    def _fetch(self, url: str) -> httpx.Response:
+        """GET a material URL, retrying transient failures."""
+        # Held per attempt, so backoff sleeps do not occupy a slot
+        with self._host_slot(url):
+            response = self.client.get(url)
+        response.raise_for_status()
+        return response
+
+    def known_sha256(self, url: str) -> str | None:
+        """Return the SHA-256 of a material already downloaded or read from the mirror.
+
+        Lets callers that hold the content skip hashing it again.
+        """
+        return self._sha256.get(url)
+
+    def _known_missing(self, url: str) -> bool:
+        """Return True if the URL returned 404 recently enough to skip it."""
+        return bool(self.negative_cache and self.negative_cache.is_absent(MATERIAL, url))
+
+    def _record_missing(self, url: str, error: httpx.HTTPStatusError) -> None:
+        """Remember a URL that returned 404."""
+        if self.negative_cache and error.response.status_code == 404:
+            self.negative_cache.mark_absent(MATERIAL, url, reason="HTTP 404")
 
-        Checks the local rsync mirror first if one is configured, falling back
-        to HTTP from the Datatracker.
+    def download(self, material: IETFMaterial) -> DownloadedMaterial | None:
+        """Download a single material file, hashing it on the way to disk.
+
+        Checks the blob store and then the local rsync mirror if configured,
+        falling back to HTTP from the Datatracker. The body is streamed in chunks to a
+        temporary file that is renamed into place once complete, so large
+        recordings never sit in memory and a failed download leaves no
+        partial file behind. SHA-256 and SHA-512 digests are computed in the
+        same pass.
 
         Args:
             material: The material to download
 
         Returns:
-            Path to the downloaded file, or None if failed
+            The saved file and its digests, or None if failed
         """
+        result = self._from_blob_store(material.url)
+        if result is None:
+            result = self._download_uncached(material)
+            if result and self.blob_store:
+                self.blob_store.add(
+                    material.url, result.path, result.sha256, result.sha512, result.size
+                )
+        if result and material.url:
+            self._sha256[material.url] = result.sha256
+        return result
+
+    def _from_blob_store(self, url: str) -> DownloadedMaterial | None:
+        """Link a previously downloaded copy of a URL into the download directory."""
+        entry = self.blob_store.lookup(url) if self.blob_store and url else None
+        if entry is None:
+            return None
+
+        dest = self.download_dir / entry.filename
+        if not (dest.exists() and os.path.samefile(dest, entry.path)):
+            link_file(entry.path, dest, strategy="hardlink")
+        logger.info(f"Using stored copy: {dest}")
+        return DownloadedMaterial(
+            path=dest, size=entry.size, sha256=entry.sha256, sha512=entry.sha512
+        )
+
+    def _find_in_mirror(self, url: str | None) -> tuple[Path, ManifestEntry | None] | None:
+        """Look a material URL up in the local rsync mirror, with its manifest entry."""
+        if not self.mirror_dir or not url:
+            return None
+        doc_name = url.rstrip("/").split("/")[-1].split("?")[0]
+        # Extract meeting number from URL if present (e.g. /meeting/125/materials/...)
+        meeting_number = None
+        parts = url.split("/")
+        try:
+            idx = parts.index("meeting")
+            meeting_number = int(parts[idx + 1])
+        except (ValueError, IndexError):
+            pass
+        if not meeting_number:
+            return None
+        return find_local_entry(doc_name, meeting_number, self.mirror_dir)
+
+    def _download_uncached(self, material: IETFMaterial) -> DownloadedMaterial | None:
+        """Download a material from the rsync mirror or over HTTP."""
         # Check local rsync mirror first
-        if self.mirror_dir and material.url:
-            doc_name = material.url.rstrip("/").split("/")[-1].split("?")[0]
-            # Extract meeting number from URL if present (e.g. /meeting/125/materials/...)
-            meeting_number = None
-            parts = material.url.split("/")
-            try:
-                idx = parts.index("meeting")
-                meeting_number = int(parts[idx + 1])
-            except (ValueError, IndexError):
-                pass
-
-            if meeting_number:
-                local_path = find_local_file(doc_name, meeting_number, self.mirror_dir)
-                if local_path:
-                    logger.info("Using mirror: %s", local_path)
-                    # Copy to download_dir so callers get a consistent location
-                    dest = self.download_dir / local_path.name
-                    if not dest.exists():
-                        import shutil
-                        shutil.copy2(local_path, dest)
-                    return dest
+        found = self._find_in_mirror(material.url)
+        if found:
+            local_path, entry = found
+            logger.info("Using mirror: %s", local_path)
+            # Link into download_dir so callers get a consistent location
+            dest = self.download_dir / local_path.name
+            if not dest.exists():
+                method = link_file(local_path, dest, self.link_strategy)
+                logger.debug(f"Placed {dest} by {method}")
+            elif not os.path.samefile(dest, local_path):
+                entry = None
+            if entry is None:
+                return hash_file(dest)
+            return DownloadedMaterial(
+                path=dest, size=entry.size, sha256=entry.sha256, sha512=entry.sha512
+            )
+
+        if self._known_missing(material.url):
+            return None
 
         try:
             logger.info(f"Downloading: {material.title} from {material.url}")
 
-            response = self.client.get(material.url)
-            response.raise_for_status()
-
-            # Determine filename
-            filename = material.filename
-            if not filename:
-                # Try to get from Content-Disposition header
-                cd = response.headers.get("content-disposition", "")
-                if "filename=" in cd:
-                    filename = cd.split("filename=")[-1].strip('"')
-                else:
-                    # Generate from URL
-                    filename = material.url.split("/")[-1]
-                    if "?" in filename:
-                        filename = filename.split("?")[0]
-
-            # Ensure filename has extension
-            if not Path(filename).suffix:
-                content_type = response.headers.get("content-type", "")
-                ext = mimetypes.guess_extension(content_type.split(";")[0])
-                if ext:
-                    filename = f"{filename}{ext}"
-
-            # Save file
-            output_path = self.download_dir / filename
-            output_path.write_bytes(response.content)
-
-            logger.info(f"Downloaded: {output_path}")
-            return output_path
+            result = self._stream_to_file(material)
+
+            logger.info(f"Downloaded: {result.path}")
+            return result
 
         except httpx.HTTPStatusError as e:
             logger.warning(f"HTTP error downloading {material.url}: {e}")
+            self._record_missing(material.url, e)
         except Exception as e:
             logger.error(f"Failed to download {material.url}: {e}")
 
         return None
 
+    def download_material(self, material: IETFMaterial) -> Path | None:
+        """Download a single material file.
+
+        Args:
+            material: The material to download
+
+        Returns:
+            Path to the downloaded file, or None if failed
+        """
+        result = self.download(material)
+        return result.path if result else None
+
+    @http_retry()
+    def _stream_to_file(self, material: IETFMaterial) -> DownloadedMaterial:
+        """Stream a material into the download directory, retrying transient failures.
+
+        The body is written to a ``.part`` file that survives failures. The
+        next attempt (or run) asks for the remaining bytes with a Range
+        request, guarded by ``If-Range`` so a changed resource is sent in
+        full and the partial copy discarded. Concurrent downloads of the same
+        URL into the same directory take turns.
+        """
+        part, meta = self._part_paths(material.url)
+        with _part_lock(part), self._host_slot(material.url):
+            for resume in (True, False):
+                headers = self._resume_headers(material.url, part, meta) if resume else {}
+                with self.client.stream("GET", material.url, headers=headers) as response:
+                    if response.status_code == 416 and headers:
+                        # The partial copy no longer fits the resource
+                        self._discard_part(part, meta)
+                        continue
+                    response.raise_for_status()
+                    return self._receive(material, response, part, meta)
+
+        raise AssertionError("unreachable")
+
+    def _part_paths(self, url: str) -> tuple[Path, Path]:
+        """Return the partial download file for a URL and its validators file."""
+        key = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.download_dir / f".{key}.part", self.download_dir / f".{key}.part.json"
+
+    def _resume_headers(self, url: str, part: Path, meta: Path) -> dict[str, str]:
+        """Build Range/If-Range headers to continue a partial download, if possible."""
+        size = part.stat().st_size if part.exists() else 0
+        if not size:
+            return {}
+        try:
+            validators = json.loads(meta.read_text())
+        except Exception:
+            validators = {}
+
+        validator = validators.get("etag") or validators.get("last_modified")
+        if not validator or validators.get("url") != url:
+            # Without a validator a resumed body could belong to another version
+            self._discard_part(part, meta)
+            return {}
+        return {"Range": f"bytes={size}-", "If-Range": validator}
+
+    @staticmethod
+    def _discard_part(part: Path, meta: Path) -> None:
+        part.unlink(missing_ok=True)
+        meta.unlink(missing_ok=True)
+
+    def _receive(
+        self,
+        material: IETFMaterial,
+        response: httpx.Response,
+        part: Path,
+        meta: Path,
+    ) -> DownloadedMaterial:
+        """Write a 200 or 206 response into the part file and move it into place."""
+        digests = _Digests()
+        offset = part.stat().st_size if part.exists() else 0
+
+        if response.status_code == 206:
+            start = _content_range_start(response.headers.get("content-range"))
+            if start != offset:
+                self._discard_part(part, meta)
+                raise httpx.RemoteProtocolError(
+                    f"Unexpected Content-Range {response.headers.get('content-range')!r} "
+                    f"for a {offset}-byte partial download",
+                    request=response.request,
+                )
+            logger.info(f"Resuming {material.url} at byte {offset}")
+            for chunk in _read_chunks(part):
+                digests.update(chunk)
+            mode = "ab"
+        else:
+            # Full body: a fresh download, or the resource changed
+            self._discard_part(part, meta)
+            etag = response.headers.get("etag")
+            # Weak ETags cannot be used with If-Range
+            etag = etag if etag and not etag.startswith("W/") else None
+            last_modified = response.headers.get("last-modified")
+            if etag or last_modified:
+                meta.write_text(json.dumps({
+                    "url": material.url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                }))
+            mode = "wb"
+
+        try:
+            with open(part, mode) as f:
+                # Written as received, so an interruption loses nothing
+                for chunk in response.iter_bytes():
+                    f.write(chunk)
+                    digests.update(chunk)
+        except BaseException:
+            # Keep what arrived only if it can be resumed safely
+            if not meta.exists():
+                part.unlink(missing_ok=True)
+            raise
+
+        output_path = self.download_dir / self._filename(material, response)
+        os.replace(part, output_path)
+        meta.unlink(missing_ok=True)
+        return digests.result(output_path)
+
+    @staticmethod
+    def _filename(material: IETFMaterial, response: httpx.Response) -> str:
+        """Choose the local filename for a material from its metadata and response."""
+        filename = material.filename
+        if not filename:
+            # Try to get from Content-Disposition header
+            cd = response.headers.get("content-disposition", "")
+            if "filename=" in cd:
+                filename = cd.split("filename=")[-1].strip('"')
+            else:
+                # Generate from URL
+                filename = material.url.split("/")[-1]
+                if "?" in filename:
+                    filename = filename.split("?")[0]
+
+        # Ensure filename has extension
+        if not Path(filename).suffix:
+            content_type = response.headers.get("content-type", "")
+            ext = mimetypes.guess_extension(content_type.split(";")[0])
+            if ext:
+                filename = f"{filename}{ext}"
+
+        return filename
+
     def download_all_materials(
-        self, materials: list[IETFMaterial]
+        self,
+        materials: list[IETFMaterial],
+        max_workers: int | None = None,
     ) -> dict[str, Path]:
         """Download all materials for a session.
 
+        Materials are downloaded on a thread pool over the shared connection
+        pool, with at most ``per_host_limit`` requests to one host at a time.
+        Keys are assigned in the order of ``materials``, exactly as a serial
+        download would assign them.
+
         Args:
             materials: List of materials to download
+            max_workers: Concurrent downloads (defaults to the downloader's
+                ``max_workers``; 1 downloads serially)
 
         Returns:
             Dictionary mapping material type to downloaded file path
         """
         downloaded = {}
 
-        for material in materials:
-            path = self.download_material(material)
+        workers = min(max_workers or self.max_workers, len(materials))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                paths = list(executor.map(self.download_material, materials))
+        else:
+            paths = [self.download_material(m) for m in materials]
+
+        for material, path in zip(materials, paths):
             if path:
                 # Use type + order as key to handle multiple slides
                 key = material.type
@@ -144,20 +484,66 @@ class MaterialsDownloader:
     def get_material_content(self, material: IETFMaterial) -> bytes | None:
         """Get the content of a material without saving to disk.
 
+        With a blob store configured, the material is fetched through
+        :meth:`download` instead (and so also saved to ``download_dir``),
+        letting later runs reuse it. Otherwise a local mirror copy is read
+        directly, and its manifest digest becomes :meth:`known_sha256`.
+
         Args:
             material: The material to fetch
 
         Returns:
             Raw bytes content, or None if failed
         """
+        if self.blob_store:
+            result = self.download(material)
+            return result.path.read_bytes() if result else None
+
+        found = self._find_in_mirror(material.url)
+        if found:
+            local_path, entry = found
+            try:
+                content = local_path.read_bytes()
+            except OSError as e:
+                logger.warning(f"Could not read mirror file {local_path}: {e}")
+            else:
+                if entry and entry.size == len(content):
+                    self._sha256[material.url] = entry.sha256
+                return content
+
+        if self._known_missing(material.url):
+            return None
+
         try:
-            response = self.client.get(material.url)
-            response.raise_for_status()
-            return response.content
+            return self._fetch(material.url).content
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"HTTP error fetching {material.url}: {e}")
+            self._record_missing(material.url, e)
+            return None
         except Exception as e:
             logger.error(f"Failed to fetch {material.url}: {e}")
             return None
 
+    def get_all_material_contents(
+        self,
+        materials: list[IETFMaterial],
+        max_workers: int | None = None,
+    ) -> list[bytes | None]:
+        """Fetch the content of several materials concurrently.
+
+        Args:
+            materials: The materials to fetch
+            max_workers: Concurrent fetches (defaults to ``max_workers``)
+
+        Returns:
+            Contents in the order of ``materials`` (None where a fetch failed)
+        """
+        workers = min(max_workers or self.max_workers, len(materials))
+        if workers <= 1:
+            return [self.get_material_content(m) for m in materials]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.get_material_content, materials))
+
     def compute_hash(self, content: bytes, algorithm: str = "sha256") -> str:
         """Compute hash of content for integrity verification.
 
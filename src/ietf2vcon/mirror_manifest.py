@@ -0,0 +1,135 @@
+"""Per-meeting manifests of the local proceedings mirror.
+
+After ``ietf2vcon sync`` a manifest records every mirrored file of the
+meeting with its size, modification time and digests, so conversions can
+take a file's SHA-256 (and SHA-512) from the manifest instead of reading the
+file again. Re-syncing only re-hashes files whose size or mtime changed.
+
+The manifests live outside the rsync destination, so ``rsync --delete``
+leaves them alone:
+    {mirror}/manifests/{meeting}.json
+        {"meeting": 125, "files": {"slides/slides-125-...pdf":
+            {"size": ..., "mtime_ns": ..., "sha256": ..., "sha512": ...}}}
+
+An entry is only trusted while the file's size and mtime still match it.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .file_links import atomic_write_json
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ManifestEntry:
+    """A mirrored file as it was when last hashed."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    sha512: str
+
+
+@dataclass
+class Manifest:
+    """The files of one meeting's mirror, keyed by path relative to the meeting."""
+
+    meeting_number: int
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+
+    def entry_for(self, path: Path, meeting_dir: Path) -> ManifestEntry | None:
+        """Return the entry for a file if it is unchanged since it was hashed."""
+        try:
+            entry = self.files.get(path.relative_to(meeting_dir).as_posix())
+        except ValueError:
+            return None
+        if entry is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if st.st_size != entry.size or st.st_mtime_ns != entry.mtime_ns:
+            return None
+        return entry
+
+
+def manifest_path(meeting_number: int, local_dir: Path) -> Path:
+    """Return where a meeting's manifest is stored."""
+    return local_dir / "manifests" / f"{meeting_number}.json"
+
+
+def load_manifest(meeting_number: int, local_dir: Path) -> Manifest | None:
+    """Load a meeting's manifest, or None if there is none (or it is unreadable)."""
+    path = manifest_path(meeting_number, local_dir)
+    try:
+        data = json.loads(path.read_text())
+        files = {name: ManifestEntry(**entry) for name, entry in data["files"].items()}
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable mirror manifest {path}: {e}")
+        return None
+    return Manifest(meeting_number=meeting_number, files=files)
+
+
+def update_manifest(meeting_number: int, local_dir: Path) -> tuple[Manifest, int]:
+    """Rewrite a meeting's manifest after a sync.
+
+    Files whose size and mtime match the previous manifest keep their
+    digests; only new and changed files are read.
+
+    Args:
+        meeting_number: IETF meeting number
+        local_dir: Root directory of the local mirror
+
+    Returns:
+        The new manifest and the number of files that were hashed
+    """
+    # materials imports this module for ManifestEntry
+    from .materials import hash_file
+
+    meeting_dir = local_dir / "proceedings" / str(meeting_number)
+    previous = load_manifest(meeting_number, local_dir)
+    old_files = previous.files if previous else {}
+
+    manifest = Manifest(meeting_number=meeting_number)
+    hashed = 0
+    for root, _, names in os.walk(meeting_dir):
+        for name in names:
+            path = Path(root) / name
+            rel = path.relative_to(meeting_dir).as_posix()
+            try:
+                st = os.stat(path)
+                old = old_files.get(rel)
+                if old and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                    manifest.files[rel] = old
+                else:
+                    digests = hash_file(path)
+                    manifest.files[rel] = ManifestEntry(
+                        size=st.st_size,
+                        mtime_ns=st.st_mtime_ns,
+                        sha256=digests.sha256,
+                        sha512=digests.sha512,
+                    )
+                    hashed += 1
+            except OSError as e:
+                logger.warning(f"Skipping {path} in manifest: {e}")
+
+    atomic_write_json(
+        manifest_path(meeting_number, local_dir),
+        {
+            "meeting": meeting_number,
+            "files": {name: asdict(entry) for name, entry in sorted(manifest.files.items())},
+        },
+    )
+
+    logger.info(
+        "Manifest for IETF %d: %d files, %d hashed", meeting_number, len(manifest.files), hashed
+    )
+    return manifest, hashed
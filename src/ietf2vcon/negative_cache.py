@@ -0,0 +1,167 @@
+"""Persistent cache of resources known to be missing.
+
+Many sessions have no Zulip stream, no collaborative notes page and no
+YouTube captions. Without a record of that, every re-run probes all of
+them again. ``NegativeCache`` remembers each failed probe as
+``(kind, key) -> absent as of T`` in a small SQLite file so later runs can
+skip it until the entry expires (or a recheck is forced).
+
+Only definitive misses belong here (a 404, a lookup that ran and found
+nothing); transient errors should not be recorded. Absences that usually
+resolve themselves soon (YouTube generates captions hours after upload)
+expire sooner than the rest; see ``KIND_TTLS``.
+
+Schema:
+    absent(kind, key, checked_at, reason, PRIMARY KEY (kind, key))
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NEGATIVE_TTL = 7 * 24 * 3600.0
+
+# Probe kinds used by the converter and materials downloader
+ZULIP_STREAM = "zulip_stream"
+YOUTUBE_CAPTIONS = "youtube_captions"
+MATERIAL = "material"
+
+# Kinds trusted for less than the cache's TTL
+KIND_TTLS: dict[str, float] = {
+    YOUTUBE_CAPTIONS: 6 * 3600.0,
+}
+
+
+class NegativeCache:
+    """SQLite-backed record of probes that found nothing.
+
+    Safe to share between threads; several processes may also use the same
+    file.
+
+    Args:
+        path: SQLite file to store entries in
+        ttl: Seconds an absence is trusted before probing again
+            (None means entries never expire)
+        recheck: If True, ignore recorded absences (entries are still
+            written, so a forced recheck refreshes the cache)
+        kind_ttls: Shorter TTLs for some kinds; each caps ``ttl``
+            (default: ``KIND_TTLS``)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float | None = DEFAULT_NEGATIVE_TTL,
+        recheck: bool = False,
+        kind_ttls: dict[str, float] | None = None,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.kind_ttls = KIND_TTLS if kind_ttls is None else kind_ttls
+        self.recheck = recheck
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None, timeout=30.0
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS absent ("
+            "kind TEXT NOT NULL, key TEXT NOT NULL, checked_at REAL NOT NULL, "
+            "reason TEXT, PRIMARY KEY (kind, key))"
+        )
+
+    def is_absent(self, kind: str, key: str) -> bool:
+        """Return True if ``(kind, key)`` is known missing and not expired."""
+        if self.recheck:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT checked_at FROM absent WHERE kind = ? AND key = ?",
+                (kind, key),
+            ).fetchone()
+        if row is None:
+            return False
+        ttl = self.ttl_for(kind)
+        if ttl is not None and time.time() - row[0] > ttl:
+            return False
+        self.skipped += 1
+        logger.debug(f"Skipping {kind} probe for {key}: known missing")
+        return True
+
+    def ttl_for(self, kind: str) -> float | None:
+        """Return how long an absence of ``kind`` is trusted."""
+        kind_ttl = self.kind_ttls.get(kind)
+        if kind_ttl is None:
+            return self.ttl
+        return kind_ttl if self.ttl is None else min(kind_ttl, self.ttl)
+
+    def mark_absent(self, kind: str, key: str, reason: str | None = None) -> None:
+        """Record that a probe for ``(kind, key)`` found nothing just now."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO absent (kind, key, checked_at, reason) "
+                "VALUES (?, ?, ?, ?)",
+                (kind, key, time.time(), reason),
+            )
+
+    def mark_present(self, kind: str, key: str) -> None:
+        """Forget a recorded absence (the resource has appeared)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM absent WHERE kind = ? AND key = ?", (kind, key)
+            )
+
+    def clear(self, kind: str | None = None) -> int:
+        """Remove all entries, or those of one kind.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if kind is None:
+                cursor = self._conn.execute("DELETE FROM absent")
+            else:
+                cursor = self._conn.execute("DELETE FROM absent WHERE kind = ?", (kind,))
+        return cursor.rowcount
+
+    def prune(self) -> int:
+        """Drop expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        with self._lock:
+            for kind in self.kind_ttls:
+                cursor = self._conn.execute(
+                    "DELETE FROM absent WHERE kind = ? AND checked_at < ?",
+                    (kind, now - self.ttl_for(kind)),
+                )
+                removed += cursor.rowcount
+            if self.ttl is not None:
+                kinds = list(self.kind_ttls)
+                cursor = self._conn.execute(
+                    "DELETE FROM absent WHERE checked_at < ? AND kind NOT IN "
+                    f"({', '.join('?' * len(kinds))})",
+                    (now - self.ttl, *kinds),
+                )
+                removed += cursor.rowcount
+        return removed
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
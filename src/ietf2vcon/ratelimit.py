@@ -0,0 +1,173 @@
+"""Process-wide adaptive rate limiting per host.
+
+Every HTTP client in the package (Datatracker, Zulip, materials downloads)
+draws request tokens from one shared token bucket per host, installed as
+httpx event hooks. A ``429 Too Many Requests`` or ``503`` response pauses the
+host for its ``Retry-After`` period and halves the request rate, so all
+worker threads slow down together instead of each backing off on its own.
+Successful responses raise the rate again additively (AIMD) up to the
+configured ceiling.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 10.0  # requests per second
+
+# Ceiling rates for hosts that need a gentler default
+HOST_RATES: dict[str, float] = {
+    "zulip.ietf.org": 5.0,
+}
+
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """Thread-safe adaptive token bucket for a single host.
+
+    Args:
+        rate: Maximum (and initial) requests per second
+        burst: Bucket capacity (defaults to ``rate``)
+        min_rate: Floor the rate never drops below
+        increase: Requests per second added after each successful response
+        decrease: Factor the rate is multiplied by when throttled
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: float | None = None,
+        min_rate: float = 0.5,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while (delay := self._try_acquire()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        while (delay := self._try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def on_response(self, status_code: int, retry_after: float | None = None) -> None:
+        """Adapt the rate to a response from the host."""
+        with self._lock:
+            now = time.monotonic()
+            if status_code in THROTTLE_STATUSES or status_code >= 500:
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, now + retry_after)
+                    self._tokens = 0.0
+                # Halve at most once per second so a burst of concurrent
+                # errors from one episode counts once
+                if now - self._last_decrease >= 1.0:
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self._last_decrease = now
+                    logger.debug(f"Throttled ({status_code}); rate now {self.rate:.2f}/s")
+            elif status_code < 400 and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str) -> HostRateLimiter:
+    """Return the process-wide limiter for a host, creating it on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = HostRateLimiter(rate=HOST_RATES.get(host, DEFAULT_RATE))
+            _limiters[host] = limiter
+        return limiter
+
+
+def configure_host(host: str, rate: float, burst: float | None = None) -> HostRateLimiter:
+    """Replace the limiter for a host with one using the given rate."""
+    limiter = HostRateLimiter(rate=rate, burst=burst)
+    with _limiters_lock:
+        _limiters[host] = limiter
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all per-host limiter state."""
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def _record(response: httpx.Response) -> None:
+    get_rate_limiter(response.request.url.host).on_response(
+        response.status_code,
+        parse_retry_after(response.headers.get("Retry-After")),
+    )
+
+
+def rate_limit_hooks() -> dict[str, list[Any]]:
+    """Event hooks applying the shared per-host limiters to an httpx.Client."""
+
+    def on_request(request: httpx.Request) -> None:
+        get_rate_limiter(request.url.host).acquire()
+
+    return {"request": [on_request], "response": [_record]}
+
+
+def async_rate_limit_hooks() -> dict[str, list[Any]]:
+    """Event hooks applying the shared per-host limiters to an httpx.AsyncClient."""
+
+    async def on_request(request: httpx.Request) -> None:
+        await get_rate_limiter(request.url.host).acquire_async()
+
+    async def on_response(response: httpx.Response) -> None:
+        _record(response)
+
+    return {"request": [on_request], "response": [on_response]}
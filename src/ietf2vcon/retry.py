@@ -0,0 +1,142 @@
+"""Shared retry policy for HTTP requests.
+
+Only transient failures are retried: connection and other transport errors,
+5xx responses and ``429 Too Many Requests``. Any other 4xx (a missing agenda
+or notes document, say) fails immediately. Waits use full-jitter exponential
+backoff, or the server's ``Retry-After`` if that is longer.
+
+All clients draw from one process-wide :class:`RetryBudget`. It caps the
+total number of retries in a run, so a struggling server cannot stall a batch
+conversion, and it records how many seconds were spent in backoff.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from .ratelimit import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ATTEMPTS = 3
+DEFAULT_RETRY_BUDGET = 100
+
+
+class RetryBudget:
+    """Thread-safe per-run retry allowance with backoff accounting.
+
+    Args:
+        max_retries: Total retries allowed (None means unlimited)
+    """
+
+    def __init__(self, max_retries: int | None = DEFAULT_RETRY_BUDGET):
+        self.max_retries = max_retries
+        self.retries = 0
+        self.exhausted = 0
+        self.backoff_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if none are left."""
+        with self._lock:
+            if self.max_retries is not None and self.retries >= self.max_retries:
+                self.exhausted += 1
+                return False
+            self.retries += 1
+            return True
+
+    def record_backoff(self, seconds: float) -> None:
+        """Add time spent sleeping before a retry."""
+        with self._lock:
+            self.backoff_seconds += seconds
+
+    def reset(self, max_retries: int | None = DEFAULT_RETRY_BUDGET) -> None:
+        """Start a new run with a fresh allowance."""
+        with self._lock:
+            self.max_retries = max_retries
+            self.retries = 0
+            self.exhausted = 0
+            self.backoff_seconds = 0.0
+
+    def summary(self) -> str:
+        """Describe retries and backoff so far, for end-of-run reporting."""
+        limit = "unlimited" if self.max_retries is None else str(self.max_retries)
+        text = f"{self.retries}/{limit} retries, {self.backoff_seconds:.1f}s in backoff"
+        if self.exhausted:
+            text += f", {self.exhausted} failures not retried (budget exhausted)"
+        return text
+
+
+# Shared by every client in the process
+retry_budget = RetryBudget()
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return True for failures worth retrying (transport errors, 5xx, 429)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _wait(base: Callable[[RetryCallState], float]) -> Callable[[RetryCallState], float]:
+    """Jittered backoff, stretched to the server's Retry-After if longer."""
+
+    def wait(retry_state: RetryCallState) -> float:
+        seconds = base(retry_state)
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if isinstance(exc, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(exc.response.headers.get("Retry-After"))
+            if retry_after is not None:
+                seconds = max(seconds, retry_after)
+        return seconds
+
+    return wait
+
+
+def http_retry(
+    attempts: int = DEFAULT_ATTEMPTS,
+    budget: RetryBudget | None = None,
+    max_wait: float = 10.0,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator retrying an HTTP call (sync or async) on transient failures.
+
+    Args:
+        attempts: Maximum attempts per call, including the first
+        budget: Retry budget to draw from (defaults to the process-wide one)
+        max_wait: Upper bound for a single jittered backoff, in seconds
+
+    Returns:
+        A tenacity retry decorator; the final exception is re-raised as is
+    """
+
+    def budget_stop(retry_state: RetryCallState) -> bool:
+        return not (budget or retry_budget).try_spend()
+
+    def before_sleep(retry_state: RetryCallState) -> None:
+        seconds = retry_state.next_action.sleep if retry_state.next_action else 0.0
+        (budget or retry_budget).record_backoff(seconds)
+        logger.debug(
+            f"Retrying {getattr(retry_state.fn, '__qualname__', retry_state.fn)} "
+            f"in {seconds:.1f}s "
+            f"after {retry_state.outcome.exception()!r}"
+        )
+
+    return retry(
+        retry=retry_if_exception(is_transient),
+        # Attempts are checked first, so the budget is only spent on real retries
+        stop=stop_after_attempt(attempts) | budget_stop,
+        wait=_wait(wait_random_exponential(multiplier=0.5, max=max_wait)),
+        before_sleep=before_sleep,
+        reraise=True,
+    )
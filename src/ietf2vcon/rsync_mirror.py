@@ -13,9 +13,17 @@ Mirror layout (mirrors rsync.ietf.org::proceedings/{meeting}/):
 """
 
 import logging
+import os
+import re
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+from .mirror_manifest import Manifest, ManifestEntry, load_manifest, manifest_path, update_manifest
+
 logger = logging.getLogger(__name__)
 
 IETF_RSYNC = "rsync.ietf.org::proceedings"
@@ -23,44 +31,358 @@ IETF_RSYNC = "rsync.ietf.org::proceedings"
 # Subdirs that contain per-session materials (in priority order for lookup)
 MATERIAL_SUBDIRS = ["slides", "agenda", "minutes", "chatlog", "bluesheets", "procmaterials"]
 
+# Preferred extensions when a document exists in several formats
+EXTENSION_PRIORITY = {
+    ext: i for i, ext in enumerate([".pdf", ".txt", ".md", ".html", ".htm", ".pptx", ".docx"])
+}
 
-def sync_proceedings(meeting_number: int, local_dir: Path, dry_run: bool = False) -> bool:
-    """Rsync IETF meeting proceedings to a local directory.
+# Trailing two-digit revision of a document name (slides-125-6lo-intro-00)
+_REVISION = re.compile(r"^(?P<base>.+)-(?P<rev>\d{2})$")
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one meeting's proceedings."""
+
+    meeting_number: int
+    ok: bool
+    seconds: float = 0.0
+    bytes_received: int = 0
+    files_transferred: int = 0
+    files_hashed: int = 0
+    error: str | None = None
+
+
+def rsync_filters(
+    meeting_number: int,
+    material_types: list[str] | None = None,
+    groups: list[str] | None = None,
+) -> list[str]:
+    """Build rsync include/exclude rules selecting material types and groups.
+
+    Args:
+        meeting_number: IETF meeting number
+        material_types: Subdirectories to sync (e.g. slides, agenda, minutes);
+            all material subdirectories if only groups are given
+        groups: Working group acronyms whose files to sync (all if None)
+
+    Returns:
+        rsync arguments, empty when nothing is filtered
+    """
+    if not material_types and not groups:
+        return []
+
+    rules = []
+    for material_type in material_types or MATERIAL_SUBDIRS:
+        rules.append(f"--include=/{material_type}/")
+        if groups:
+            for group in groups:
+                prefix = f"/{material_type}/{material_type}-{meeting_number}-{group}"
+                rules += [f"--include={prefix}-*", f"--include={prefix}.*"]
+        else:
+            rules.append(f"--include=/{material_type}/**")
+    rules.append("--exclude=*")
+    return rules
+
+
+def _parse_stats(output: str) -> tuple[int, int]:
+    """Return (bytes received, files transferred) from rsync --stats output."""
+    numbers = {}
+    for line in output.splitlines():
+        label, _, value = line.partition(":")
+        digits = value.strip().split(" ")[0].replace(",", "")
+        if digits.isdigit():
+            numbers[label.strip()] = int(digits)
+    return (
+        numbers.get("Total bytes received", 0),
+        numbers.get(
+            "Number of regular files transferred", numbers.get("Number of files transferred", 0)
+        ),
+    )
+
+
+def sync_meeting(
+    meeting_number: int,
+    local_dir: Path,
+    dry_run: bool = False,
+    material_types: list[str] | None = None,
+    groups: list[str] | None = None,
+) -> SyncResult:
+    """Rsync one meeting's proceedings and measure the transfer.
 
     Args:
         meeting_number: IETF meeting number (e.g., 125)
         local_dir: Root directory for the local mirror
         dry_run: If True, pass --dry-run to rsync (no files written)
+        material_types: Only sync these subdirectories (see :func:`rsync_filters`)
+        groups: Only sync files of these working groups
 
     Returns:
-        True if rsync succeeded, False otherwise
+        SyncResult with bytes received, files transferred and elapsed time
+
+    After a successful (non dry-run) sync the meeting's manifest is updated,
+    hashing only new and changed files (see :mod:`ietf2vcon.mirror_manifest`).
     """
     source = f"{IETF_RSYNC}/{meeting_number}/"
     dest = local_dir / "proceedings" / str(meeting_number)
     dest.mkdir(parents=True, exist_ok=True)
 
-    cmd = ["rsync", "-av", "--delete"]
+    cmd = ["rsync", "-a", "--delete", "--stats"]
     if dry_run:
         cmd.append("--dry-run")
+    cmd += rsync_filters(meeting_number, material_types, groups)
     cmd += [source, str(dest) + "/"]
 
     logger.info("Syncing IETF %d proceedings: %s → %s", meeting_number, source, dest)
 
+    start = time.monotonic()
     try:
-        result = subprocess.run(cmd, capture_output=False, text=True)
-        if result.returncode == 0:
-            logger.info("Sync complete for IETF %d", meeting_number)
-            return True
-        else:
-            logger.error("rsync failed (exit %d) for IETF %d", result.returncode, meeting_number)
-            return False
+        result = subprocess.run(cmd, capture_output=True, text=True)
     except FileNotFoundError:
         logger.error("rsync not found. Install rsync and try again.")
-        return False
+        return SyncResult(meeting_number, ok=False, error="rsync not found")
     except Exception as e:
         logger.error("rsync error: %s", e)
+        return SyncResult(meeting_number, ok=False, error=str(e))
+    seconds = time.monotonic() - start
+
+    if result.returncode != 0:
+        logger.error("rsync failed (exit %d) for IETF %d", result.returncode, meeting_number)
+        stderr = result.stderr.strip()
+        error = stderr.splitlines()[-1] if stderr else f"rsync exit {result.returncode}"
+        return SyncResult(meeting_number, ok=False, seconds=seconds, error=error)
+
+    bytes_received, files = _parse_stats(result.stdout)
+    logger.info(
+        "Sync complete for IETF %d: %d files, %d bytes in %.1fs",
+        meeting_number, files, bytes_received, seconds,
+    )
+
+    hashed = 0
+    if not dry_run:
+        try:
+            _, hashed = update_manifest(meeting_number, local_dir)
+        except OSError as e:
+            logger.warning("Could not write manifest for IETF %d: %s", meeting_number, e)
+
+    return SyncResult(
+        meeting_number,
+        ok=True,
+        seconds=seconds,
+        bytes_received=bytes_received,
+        files_transferred=files,
+        files_hashed=hashed,
+    )
+
+
+def sync_meetings(
+    meeting_numbers: list[int],
+    local_dir: Path,
+    parallel: int = 4,
+    dry_run: bool = False,
+    material_types: list[str] | None = None,
+    groups: list[str] | None = None,
+) -> list[SyncResult]:
+    """Rsync several meetings, running up to ``parallel`` rsync processes at once.
+
+    Args:
+        meeting_numbers: IETF meeting numbers to sync
+        local_dir: Root directory for the local mirror
+        parallel: Maximum concurrent rsync processes
+        dry_run: If True, pass --dry-run to rsync
+        material_types: Only sync these subdirectories
+        groups: Only sync files of these working groups
+
+    Returns:
+        One SyncResult per meeting, in the order given
+    """
+    def sync_one(meeting_number: int) -> SyncResult:
+        return sync_meeting(meeting_number, local_dir, dry_run, material_types, groups)
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        return list(executor.map(sync_one, meeting_numbers))
+
+
+def sync_proceedings(meeting_number: int, local_dir: Path, dry_run: bool = False) -> bool:
+    """Rsync IETF meeting proceedings to a local directory.
+
+    Args:
+        meeting_number: IETF meeting number (e.g., 125)
+        local_dir: Root directory for the local mirror
+        dry_run: If True, pass --dry-run to rsync (no files written)
+
+    Returns:
+        True if rsync succeeded, False otherwise
+    """
+    return sync_meeting(meeting_number, local_dir, dry_run=dry_run).ok
+
+
+class _MeetingIndex:
+    """Files of one meeting's mirror, by subdirectory and document name."""
+
+    def __init__(
+        self,
+        mtimes: dict[str, int | None],
+        files: dict[str, dict[str, Path]],
+        manifest: Manifest | None = None,
+    ):
+        self.mtimes = mtimes
+        self.files = files
+        self.manifest = manifest
+        self.checked_at = time.monotonic()
+
+
+class MirrorIndex:
+    """In-memory index of the local proceedings mirror, one entry per meeting.
+
+    Each meeting is indexed with a single ``os.scandir`` pass over its
+    material subdirectories. Every file is reachable by its document name
+    with revision (``slides-125-6lo-intro-00``) and without it
+    (``slides-125-6lo-intro``, resolving to the latest revision). An index
+    is rebuilt when the modification time of the meeting directory or one
+    of its subdirectories changes; those are re-checked at most every
+    ``check_interval`` seconds, so lookups on network filesystems rarely
+    touch the disk. The meeting's manifest, if ``sync`` wrote one, is loaded
+    with the index and supplies the digests of mirrored files.
+
+    Args:
+        check_interval: Seconds between staleness checks of an index
+    """
+
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self.builds = 0
+        self._indexes: dict[Path, _MeetingIndex] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, doc_name: str, meeting_number: int, local_dir: Path) -> Path | None:
+        """Find a document in the mirror (see :func:`find_local_file`)."""
+        found = self.lookup_entry(doc_name, meeting_number, local_dir)
+        return found[0] if found else None
+
+    def lookup_entry(
+        self, doc_name: str, meeting_number: int, local_dir: Path
+    ) -> tuple[Path, ManifestEntry | None] | None:
+        """Find a document and its manifest entry (see :func:`find_local_entry`)."""
+        meeting_dir = local_dir / "proceedings" / str(meeting_number)
+        index = self._get(meeting_dir)
+        if index is None:
+            return None
+
+        for subdir in _search_dirs(doc_name):
+            path = index.files.get(subdir, {}).get(doc_name)
+            if path:
+                logger.debug("Mirror hit: %s", path)
+                entry = index.manifest.entry_for(path, meeting_dir) if index.manifest else None
+                return path, entry
+        return None
+
+    def clear(self) -> None:
+        """Drop every index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def _get(self, meeting_dir: Path) -> _MeetingIndex | None:
+        with self._lock:
+            index = self._indexes.get(meeting_dir)
+            if index and time.monotonic() - index.checked_at < self.check_interval:
+                return index
+            if index and not self._is_stale(index):
+                index.checked_at = time.monotonic()
+                return index
+
+            index = self._build(meeting_dir)
+            if index is None:
+                self._indexes.pop(meeting_dir, None)
+            else:
+                self._indexes[meeting_dir] = index
+            return index
+
+    @staticmethod
+    def _is_stale(index: _MeetingIndex) -> bool:
+        for path, mtime in index.mtimes.items():
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                return True
         return False
 
+    def _build(self, meeting_dir: Path) -> _MeetingIndex | None:
+        """Scan a meeting's material subdirectories once."""
+        try:
+            mtimes = {str(meeting_dir): os.stat(meeting_dir).st_mtime_ns}
+        except OSError:
+            return None
+
+        meeting_number = int(meeting_dir.name)
+        local_dir = meeting_dir.parent.parent
+        manifest_file = manifest_path(meeting_number, local_dir)
+        try:
+            mtimes[str(manifest_file)] = os.stat(manifest_file).st_mtime_ns
+        except OSError:
+            mtimes[str(manifest_file)] = None
+        manifest = load_manifest(meeting_number, local_dir)
+
+        files: dict[str, dict[str, Path]] = {}
+        for subdir in MATERIAL_SUBDIRS:
+            subdir_path = meeting_dir / subdir
+            ranked: dict[str, tuple[tuple, Path]] = {}
+            try:
+                with os.scandir(subdir_path) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            for name, rank in _index_keys(entry.name):
+                                if name not in ranked or rank < ranked[name][0]:
+                                    ranked[name] = (rank, Path(entry.path))
+                mtimes[str(subdir_path)] = os.stat(subdir_path).st_mtime_ns
+            except OSError:
+                continue
+            files[subdir] = {name: path for name, (_, path) in ranked.items()}
+
+        self.builds += 1
+        logger.debug(
+            "Indexed mirror %s: %d files",
+            meeting_dir, sum(len(f) for f in files.values()),
+        )
+        return _MeetingIndex(mtimes, files, manifest)
+
+
+def _index_keys(filename: str) -> list[tuple[str, tuple]]:
+    """Return the names a mirror file is found by, each with a preference rank.
+
+    Lower ranks win: an exact name beats a revision-less one, the latest
+    revision beats older ones, and extensions follow EXTENSION_PRIORITY.
+    """
+    stem, dot, ext = filename.rpartition(".")
+    if not dot:
+        stem, ext = filename, ""
+    ext_rank = EXTENSION_PRIORITY.get(f".{ext.lower()}", len(EXTENSION_PRIORITY))
+
+    keys = [(stem, (0, 0, ext_rank))]
+    match = _REVISION.match(stem)
+    if match:
+        keys.append((match["base"], (1, -int(match["rev"]), ext_rank)))
+    return keys
+
+
+def _search_dirs(doc_name: str) -> list[str]:
+    """Return the subdirectories to search for a document, based on its prefix."""
+    prefix = doc_name.split("-", 1)[0]
+    if prefix in ("slides", "agenda", "minutes", "chatlog", "bluesheets"):
+        return [prefix]
+    return MATERIAL_SUBDIRS
+
+
+# Shared by every MaterialsDownloader in the process
+_mirror_index = MirrorIndex()
+
+
+def get_mirror_index() -> MirrorIndex:
+    """Return the process-wide mirror index."""
+    return _mirror_index
+
 
 def find_local_file(doc_name: str, meeting_number: int, local_dir: Path) -> Path | None:
     """Find a document in the local proceedings mirror.
@@ -69,7 +391,9 @@ def find_local_file(doc_name: str, meeting_number: int, local_dir: Path) -> Path
         proceedings/{meeting}/{type}/{doc_name}.{ext}
 
     The Datatracker URL basename (doc_name) matches the rsync filename
-    without extension, e.g. ``slides-125-6lo-chairs-introduction-00``.
+    without extension, e.g. ``slides-125-6lo-chairs-introduction-00``; a
+    name without its revision suffix finds the latest revision. Lookups
+    are answered from the process-wide :class:`MirrorIndex`.
 
     Args:
         doc_name: Document name from Datatracker URL (no extension)
@@ -79,41 +403,27 @@ def find_local_file(doc_name: str, meeting_number: int, local_dir: Path) -> Path
     Returns:
         Path to the local file if found, None otherwise
     """
-    meeting_dir = local_dir / "proceedings" / str(meeting_number)
-    if not meeting_dir.exists():
-        return None
+    return _mirror_index.lookup(doc_name, meeting_number, local_dir)
+
+
+def find_local_entry(
+    doc_name: str, meeting_number: int, local_dir: Path
+) -> tuple[Path, ManifestEntry | None] | None:
+    """Find a document in the local mirror along with its manifest entry.
 
-    # Determine which subdir to check based on the doc_name prefix
-    if doc_name.startswith("slides-"):
-        search_dirs = ["slides"]
-    elif doc_name.startswith("agenda-"):
-        search_dirs = ["agenda"]
-    elif doc_name.startswith("minutes-"):
-        search_dirs = ["minutes"]
-    elif doc_name.startswith("chatlog-"):
-        search_dirs = ["chatlog"]
-    elif doc_name.startswith("bluesheets-"):
-        search_dirs = ["bluesheets"]
-    else:
-        search_dirs = MATERIAL_SUBDIRS
-
-    for subdir in search_dirs:
-        subdir_path = meeting_dir / subdir
-        if not subdir_path.exists():
-            continue
-        # Try exact match with common extensions
-        for ext in [".pdf", ".txt", ".md", ".html", ".htm", ".pptx", ".docx"]:
-            candidate = subdir_path / f"{doc_name}{ext}"
-            if candidate.exists():
-                logger.debug("Mirror hit: %s", candidate)
-                return candidate
-        # Try glob (handles cases where revision suffix differs)
-        matches = list(subdir_path.glob(f"{doc_name}.*"))
-        if matches:
-            logger.debug("Mirror hit (glob): %s", matches[0])
-            return matches[0]
-
-    return None
+    Like :func:`find_local_file`, but also returns the file's size and
+    digests from the meeting manifest. The entry is None when there is no
+    manifest or the file changed since it was written.
+
+    Args:
+        doc_name: Document name from Datatracker URL (no extension)
+        meeting_number: IETF meeting number
+        local_dir: Root directory of the local mirror
+
+    Returns:
+        (path, manifest entry or None), or None if the document is not mirrored
+    """
+    return _mirror_index.lookup_entry(doc_name, meeting_number, local_dir)
 
 
 def mirror_available(meeting_number: int, local_dir: Path) -> bool:
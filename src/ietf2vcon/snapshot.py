@@ -0,0 +1,356 @@
+"""Offline meeting snapshots of Datatracker data.
+
+``create_snapshot`` pulls every Datatracker resource a conversion needs for
+one meeting (meeting, sessions, schedule assignments, timeslots, rooms,
+groups, roles and their people, session presentations and documents) in
+bulk list queries and stores them in a single SQLite file.
+
+``MeetingSnapshot`` answers ``DataTrackerClient`` queries from that file.
+Tastypie filters such as ``session__group__acronym`` or ``id__in`` are
+evaluated locally by following resource URIs between stored objects, so
+conversions run without network access and always see the same data.
+
+Schema:
+    resources(uri PRIMARY KEY, collection, data)
+    info(key PRIMARY KEY, value)
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, unquote
+
+from .http_cache import CacheMissError
+
+if TYPE_CHECKING:
+    from .datatracker import DataTrackerClient
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that control paging/formatting rather than filtering
+_NON_FILTER_PARAMS = {"limit", "offset", "format", "order_by"}
+_OPERATORS = {"exact", "in", "gt", "gte", "lt", "lte"}
+
+
+def _collection(uri: str) -> str:
+    """Return the list endpoint of a resource URI.
+
+    ``/api/v1/group/group/10/`` -> ``/api/v1/group/group/``
+    """
+    return uri.rstrip("/").rsplit("/", 1)[0] + "/"
+
+
+def _uri_key(uri: str) -> str:
+    """Return the primary key at the end of a resource URI."""
+    return unquote(uri.rstrip("/").rsplit("/", 1)[-1])
+
+
+def _is_uri(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("/api/")
+
+
+def _compare(value: Any, op: str, expected: str) -> bool:
+    """Compare a resolved field value against a query parameter value."""
+    if value is None:
+        return False
+    if isinstance(value, list):
+        return any(_compare(v, op, expected) for v in value)
+
+    if isinstance(value, bool):
+        actual = str(value).lower()
+    elif _is_uri(value):
+        # Relations compare by primary key, as Tastypie does
+        actual = _uri_key(value)
+    else:
+        actual = str(value)
+
+    if op == "exact":
+        return actual == expected
+    if op == "in":
+        return actual in expected.split(",")
+
+    try:
+        left, right = float(actual), float(expected)
+    except ValueError:
+        left, right = actual, expected
+    return {
+        "gt": left > right,
+        "gte": left >= right,
+        "lt": left < right,
+        "lte": left <= right,
+    }[op]
+
+
+class MeetingSnapshot:
+    """SQLite store of Datatracker resources for one meeting.
+
+    Args:
+        path: Snapshot file
+        readonly: Open an existing snapshot for queries only; raises
+            FileNotFoundError if it does not exist
+    """
+
+    def __init__(self, path: Path, readonly: bool = True):
+        self.path = path
+        if readonly:
+            if not path.exists():
+                raise FileNotFoundError(f"Snapshot not found: {path}")
+            self._conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS resources (
+                    uri TEXT PRIMARY KEY,
+                    collection TEXT NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS resources_collection
+                    ON resources (collection);
+                CREATE TABLE IF NOT EXISTS info (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+        self._lock = threading.Lock()
+        # collection -> {uri: object}, loaded on first use
+        self._collections: dict[str, dict[str, dict[str, Any]]] = {}
+        self._known: set[str] | None = None
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def add(self, objects: Iterable[dict[str, Any]]) -> int:
+        """Store resources, replacing existing rows with the same URI.
+
+        Returns:
+            Number of resources written
+        """
+        rows = [
+            (obj["resource_uri"], _collection(obj["resource_uri"]), json.dumps(obj))
+            for obj in objects
+            if obj.get("resource_uri")
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO resources (uri, collection, data) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._collections.clear()
+            self._known = None
+        return len(rows)
+
+    def set_info(self, key: str, value: str) -> None:
+        """Record a piece of snapshot metadata."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def info(self) -> dict[str, str]:
+        """Return snapshot metadata (meeting number, creation time, ...)."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT key, value FROM info"))
+
+    def collections(self) -> set[str]:
+        """Return the list endpoints present in the snapshot."""
+        with self._lock:
+            if self._known is None:
+                self._known = {
+                    row[0]
+                    for row in self._conn.execute("SELECT DISTINCT collection FROM resources")
+                }
+            return self._known
+
+    def _load(self, collection: str) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            objects = self._collections.get(collection)
+            if objects is None:
+                objects = {
+                    uri: json.loads(data)
+                    for uri, data in self._conn.execute(
+                        "SELECT uri, data FROM resources WHERE collection = ? ORDER BY rowid",
+                        (collection,),
+                    )
+                }
+                self._collections[collection] = objects
+            return objects
+
+    def get(self, uri: str) -> dict[str, Any] | None:
+        """Return the stored resource for a URI, or None."""
+        return self._load(_collection(uri)).get(uri)
+
+    def query(self, url: str, params: dict | None = None) -> dict[str, Any]:
+        """Answer a Datatracker API request from the snapshot.
+
+        Args:
+            url: Resource URI or list endpoint path (may carry a query string)
+            params: Tastypie filter parameters for list endpoints
+
+        Returns:
+            The resource, or a single-page list response
+
+        Raises:
+            CacheMissError: If the resource or endpoint was not captured
+        """
+        path, _, query = url.partition("?")
+        params = {**dict(parse_qsl(query)), **(params or {})}
+
+        resource = self.get(path)
+        if resource is not None:
+            return resource
+
+        if path not in self.collections():
+            raise CacheMissError(f"{path} is not in snapshot {self.path}")
+
+        filters = {
+            k: str(v) for k, v in params.items() if k not in _NON_FILTER_PARAMS
+        }
+        objects = [
+            obj
+            for obj in self._load(path).values()
+            if all(self._matches(obj, k, v) for k, v in filters.items())
+        ]
+        return {
+            "meta": {
+                "limit": len(objects),
+                "next": None,
+                "offset": 0,
+                "total_count": len(objects),
+            },
+            "objects": objects,
+        }
+
+    def _matches(self, obj: dict[str, Any], lookup: str, expected: str) -> bool:
+        """Evaluate one Tastypie filter such as ``session__meeting__number``."""
+        parts = lookup.split("__")
+        op = parts.pop() if len(parts) > 1 and parts[-1] in _OPERATORS else "exact"
+
+        value: Any = obj
+        for i, part in enumerate(parts):
+            if _is_uri(value):
+                target = self.get(value)
+                if target is None:
+                    # Relation outside the snapshot: only its key is known
+                    return i == len(parts) - 1 and _compare(value, op, expected)
+                value = target
+            if not isinstance(value, dict):
+                return False
+            value = value.get(part)
+
+        return _compare(value, op, expected)
+
+
+def create_snapshot(
+    client: "DataTrackerClient",
+    meeting_number: int,
+    path: Path,
+) -> dict[str, int]:
+    """Fetch a meeting's Datatracker data in bulk and save it to a snapshot.
+
+    Args:
+        client: Datatracker client used for the bulk queries
+        meeting_number: IETF meeting number
+        path: Snapshot file to create (an existing file is updated)
+
+    Returns:
+        Dictionary mapping each list endpoint to the number of resources stored
+
+    Raises:
+        ValueError: If the meeting does not exist
+    """
+    counts: dict[str, int] = {}
+
+    meeting = client._get_meeting_data(meeting_number)
+    if not meeting:
+        raise ValueError(f"Meeting {meeting_number} not found")
+
+    with MeetingSnapshot(path, readonly=False) as snapshot:
+
+        def store(collection: str, objects: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            counts[collection] = counts.get(collection, 0) + snapshot.add(objects)
+            logger.info(f"Stored {len(objects)} {collection} resources")
+            return objects
+
+        store("/api/v1/meeting/meeting/", [meeting])
+        by_meeting = {"meeting__number": meeting_number}
+        sessions = store(
+            "/api/v1/meeting/session/",
+            client._get_paginated("/api/v1/meeting/session/", by_meeting),
+        )
+        store(
+            "/api/v1/meeting/schedtimesessassignment/",
+            client._get_paginated(
+                "/api/v1/meeting/schedtimesessassignment/",
+                client._assignment_params(meeting_number, meeting),
+            ),
+        )
+        store(
+            "/api/v1/meeting/timeslot/",
+            client._get_paginated("/api/v1/meeting/timeslot/", by_meeting),
+        )
+        store(
+            "/api/v1/meeting/room/",
+            client._get_paginated("/api/v1/meeting/room/", by_meeting),
+        )
+
+        groups = client._get_resources(
+            "/api/v1/group/group/", [s.get("group") for s in sessions if s.get("group")]
+        )
+        store("/api/v1/group/group/", list(groups.values()))
+
+        roles = []
+        group_ids = sorted({client._uri_id(uri) for uri in groups} - {None})
+        for i in range(0, len(group_ids), 100):
+            roles.extend(
+                client._get_paginated(
+                    "/api/v1/group/role/", {"group__in": ",".join(group_ids[i:i + 100])}
+                )
+            )
+        store("/api/v1/group/role/", roles)
+
+        persons = client._get_resources(
+            "/api/v1/person/person/", [r.get("person") for r in roles if r.get("person")]
+        )
+        store("/api/v1/person/person/", list(persons.values()))
+        emails = client._get_resources(
+            "/api/v1/person/email/",
+            [r.get("email") for r in roles if r.get("email")],
+            key_field="address",
+        )
+        store("/api/v1/person/email/", list(emails.values()))
+
+        presentations = store(
+            "/api/v1/meeting/sessionpresentation/",
+            client._get_paginated(
+                "/api/v1/meeting/sessionpresentation/",
+                {"session__meeting__number": meeting_number},
+            ),
+        )
+        documents = client._get_resources(
+            "/api/v1/doc/document/",
+            [p.get("document") for p in presentations if p.get("document")],
+            key_field="name",
+        )
+        store("/api/v1/doc/document/", list(documents.values()))
+
+        snapshot.set_info("meeting", str(meeting_number))
+        snapshot.set_info("created_at", datetime.now(timezone.utc).isoformat())
+
+    return counts
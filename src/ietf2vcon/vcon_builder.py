@@ -248,11 +248,16 @@ class VConBuilder:
         material: IETFMaterial,
         content: bytes | None = None,
         inline: bool = False,
+        content_hash: str | None = None,
     ) -> "VConBuilder":
-        """Add a meeting material as an attachment."""
+        """Add a meeting material as an attachment.
+
+        ``content_hash`` is the known SHA-256 of ``content`` (for instance
+        from the mirror manifest); it is computed when not given.
+        """
         if inline and content:
             encoded = base64.urlsafe_b64encode(content).decode("ascii")
-            hash_value = hashlib.sha256(content).hexdigest()
+            hash_value = content_hash or hashlib.sha256(content).hexdigest()
 
             self.vcon.add_attachment(
                 purpose=material.type,
@@ -282,12 +287,19 @@ class VConBuilder:
         inline: bool = False,
         downloader=None,
     ) -> "VConBuilder":
-        """Add multiple materials as attachments."""
-        for material in materials:
-            content = None
-            if inline and downloader:
-                content = downloader.get_material_content(material)
-            self.add_material_attachment(material, content=content, inline=inline)
+        """Add multiple materials as attachments.
+
+        With ``inline``, contents are fetched concurrently by the downloader
+        and attached in the original order.
+        """
+        contents: list[bytes | None] = [None] * len(materials)
+        if inline and downloader:
+            contents = downloader.get_all_material_contents(materials)
+        for material, content in zip(materials, contents):
+            content_hash = downloader.known_sha256(material.url) if content and downloader else None
+            self.add_material_attachment(
+                material, content=content, inline=inline, content_hash=content_hash
+            )
         return self
 
     def add_transcript(
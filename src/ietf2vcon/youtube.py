@@ -9,6 +9,12 @@ import re
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .ytdlp import InProcessYtDlp, YtDlpError, get_ytdlp
+
+if TYPE_CHECKING:
+    from .youtube_playlist import PlaylistIndex
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +22,10 @@ IETF_YOUTUBE_CHANNEL = "https://www.youtube.com/@ietf"
 IETF_YOUTUBE_PLAYLISTS = "https://www.youtube.com/user/ietf/playlists"
 
 
+class NoCaptionsError(Exception):
+    """yt-dlp ran successfully, but the video has no caption track in the language."""
+
+
 @dataclass
 class VideoMetadata:
     """Metadata for a YouTube video."""
@@ -30,28 +40,69 @@ class VideoMetadata:
 
 
 class YouTubeResolver:
-    """Resolve and fetch IETF meeting videos from YouTube."""
+    """Resolve and fetch IETF meeting videos from YouTube.
+
+    Args:
+        download_dir: Directory downloaded videos, audio and captions go to
+        playlist_index: Cached meeting playlists; session videos are looked
+            up there before falling back to a YouTube search
+        ytdlp: In-process yt-dlp backend (default: the shared one from
+            :func:`ietf2vcon.ytdlp.get_ytdlp`, if yt_dlp is importable)
+        use_subprocess: Always run the ``yt-dlp`` command instead
+
+    Every call runs in-process when possible and falls back to the
+    ``yt-dlp`` command if the module is missing or the API call breaks.
+    """
 
-    def __init__(self, download_dir: Path | None = None):
+    def __init__(
+        self,
+        download_dir: Path | None = None,
+        playlist_index: "PlaylistIndex | None" = None,
+        ytdlp: InProcessYtDlp | None = None,
+        use_subprocess: bool = False,
+    ):
         self.download_dir = download_dir or Path("./downloads")
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.playlist_index = playlist_index
+        self.ytdlp = None if use_subprocess else (ytdlp or get_ytdlp())
 
     def search_session_video(
         self,
         meeting_number: int,
         group_acronym: str,
         session_date: str | None = None,
+        playlist_url: str | None = None,
+        session_time: str | None = None,
     ) -> VideoMetadata | None:
         """Search for a session video on the IETF YouTube channel.
 
+        With a playlist index and the meeting's playlist URL, the video is
+        matched by group, date and start time in the indexed playlist.
+        YouTube is only searched if the playlist could not be listed or has
+        no matching video.
+
         Args:
             meeting_number: IETF meeting number (e.g., 124)
             group_acronym: Working group acronym (e.g., "vcon")
-            session_date: Optional date string to help match (YYYY-MM-DD)
+            session_date: Optional date string to help match (YYYY-MM-DD),
+                in the meeting's local time
+            playlist_url: The meeting's YouTube playlist
+            session_time: Optional local start time (HHMM) to pick between
+                a group's sessions
 
         Returns:
             VideoMetadata if found, None otherwise
         """
+        if self.playlist_index and playlist_url:
+            playlist = self.playlist_index.get(meeting_number, playlist_url)
+            if playlist is not None:
+                video = playlist.find(group_acronym, session_date, session_time)
+                if video is not None:
+                    return video
+                logger.info(
+                    f"No IETF {meeting_number} {group_acronym} video in the meeting playlist"
+                )
+
         # Build search query
         search_terms = [f"IETF {meeting_number}", group_acronym.upper()]
         if session_date:
@@ -60,6 +111,24 @@ class YouTubeResolver:
         search_query = " ".join(search_terms)
         logger.info(f"Searching YouTube for: {search_query}")
 
+        if self.ytdlp is not None:
+            try:
+                info = self.ytdlp.extract_info(
+                    f"ytsearch5:{search_query} site:youtube.com/ietf", flat=True
+                )
+                for entry in info.get("entries") or []:
+                    title = entry.get("title") or ""
+                    if entry.get("id") and self._title_matches_session(
+                        title, meeting_number, group_acronym
+                    ):
+                        return self._metadata_from_info(entry)
+                return None
+            except YtDlpError as e:
+                logger.warning(f"yt-dlp search failed: {e}")
+                return None
+            except Exception as e:
+                logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
         try:
             # Use yt-dlp to search
             result = subprocess.run(
@@ -126,6 +195,16 @@ class YouTubeResolver:
             if not video_id:
                 video_id = video_url
 
+            if self.ytdlp is not None:
+                try:
+                    info = self.ytdlp.extract_info(f"https://www.youtube.com/watch?v={video_id}")
+                    return self._metadata_from_info(info)
+                except YtDlpError as e:
+                    logger.warning(f"Failed to get video metadata: {e}")
+                    return None
+                except Exception as e:
+                    logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
             result = subprocess.run(
                 [
                     "yt-dlp",
@@ -185,6 +264,18 @@ class YouTubeResolver:
 
             output_template = str(self.download_dir / (output_filename or "%(title)s.%(ext)s"))
 
+            if self.ytdlp is not None:
+                try:
+                    return self.ytdlp.download(
+                        f"https://www.youtube.com/watch?v={video_id}",
+                        {"format": format_spec, "outtmpl": output_template},
+                    )
+                except YtDlpError as e:
+                    logger.error(f"Video download failed: {e}")
+                    return None
+                except Exception as e:
+                    logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
             result = subprocess.run(
                 [
                     "yt-dlp",
@@ -233,6 +324,28 @@ class YouTubeResolver:
                 self.download_dir / (output_filename or "%(title)s.%(ext)s")
             )
 
+            if self.ytdlp is not None:
+                try:
+                    return self.ytdlp.download(
+                        f"https://www.youtube.com/watch?v={video_id}",
+                        {
+                            "format": "bestaudio/best",
+                            "outtmpl": output_template,
+                            "postprocessors": [
+                                {
+                                    "key": "FFmpegExtractAudio",
+                                    "preferredcodec": "mp3",
+                                    "preferredquality": "0",
+                                }
+                            ],
+                        },
+                    )
+                except YtDlpError as e:
+                    logger.error(f"Audio download failed: {e}")
+                    return None
+                except Exception as e:
+                    logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
             result = subprocess.run(
                 [
                     "yt-dlp",
@@ -278,6 +391,7 @@ class YouTubeResolver:
         video_url: str,
         output_filename: str | None = None,
         lang: str = "en",
+        missing_ok: bool = True,
     ) -> Path | None:
         """Download captions/subtitles from a YouTube video.
 
@@ -285,9 +399,16 @@ class YouTubeResolver:
             video_url: YouTube video URL
             output_filename: Optional custom filename (without extension)
             lang: Language code for captions (default: en)
+            missing_ok: If False, raise NoCaptionsError when the video has
+                no captions, so callers can tell that apart from a failure
 
         Returns:
             Path to downloaded caption file (JSON format), or None if failed
+
+        Raises:
+            NoCaptionsError: If ``missing_ok`` is False and yt-dlp found no
+                caption track (timeouts, throttling and other errors still
+                return None)
         """
         try:
             video_id = self._extract_video_id(video_url) or video_url
@@ -299,6 +420,22 @@ class YouTubeResolver:
 
             output_template = str(captions_dir / output_base)
 
+            if self.ytdlp is not None:
+                try:
+                    return self._download_captions_in_process(
+                        video_id, captions_dir / f"{output_base}.{lang}.json3", lang
+                    )
+                except NoCaptionsError:
+                    if missing_ok:
+                        logger.warning(f"No {lang} captions for {video_id}")
+                        return None
+                    raise
+                except YtDlpError as e:
+                    logger.warning(f"Caption download failed: {e}")
+                    return None
+                except Exception as e:
+                    logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
             # Try to get auto-generated captions first, then manual
             result = subprocess.run(
                 [
@@ -336,9 +473,15 @@ class YouTubeResolver:
                 logger.info(f"Downloaded captions: {f}")
                 return f
 
+            # yt-dlp exits successfully when there are no subtitles to write
+            if not missing_ok:
+                raise NoCaptionsError(f"No {lang} captions for {video_id}")
             logger.warning("No caption file found after download")
             return None
 
+        except NoCaptionsError:
+            raise
+
         except subprocess.TimeoutExpired:
             logger.error("Caption download timed out")
         except Exception as e:
@@ -358,6 +501,20 @@ class YouTubeResolver:
         try:
             video_id = self._extract_video_id(video_url) or video_url
 
+            if self.ytdlp is not None:
+                try:
+                    info = self.ytdlp.extract_info(f"https://www.youtube.com/watch?v={video_id}")
+                    return [
+                        {"lang": lang, "auto": auto}
+                        for key, auto in (("subtitles", False), ("automatic_captions", True))
+                        for lang in info.get(key) or {}
+                        if len(lang) in (2, 5)
+                    ]
+                except YtDlpError:
+                    return []
+                except Exception as e:
+                    logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
             result = subprocess.run(
                 [
                     "yt-dlp",
@@ -399,6 +556,36 @@ class YouTubeResolver:
             logger.error(f"Failed to list captions: {e}")
             return []
 
+    def _download_captions_in_process(
+        self, video_id: str, caption_file: Path, lang: str
+    ) -> Path:
+        """Fetch a video's json3 captions (manual preferred) with the shared instance."""
+        info = self.ytdlp.extract_info(f"https://www.youtube.com/watch?v={video_id}")
+        tracks = (info.get("subtitles") or {}).get(lang) or (
+            info.get("automatic_captions") or {}
+        ).get(lang) or []
+        track = next((t for t in tracks if t.get("ext") == "json3" and t.get("url")), None)
+        if track is None:
+            raise NoCaptionsError(f"No {lang} json3 captions for {video_id}")
+
+        caption_file.write_bytes(self.ytdlp.fetch(track["url"]))
+        logger.info(f"Downloaded captions: {caption_file}")
+        return caption_file
+
+    @staticmethod
+    def _metadata_from_info(info: dict) -> VideoMetadata:
+        """Build VideoMetadata from a yt-dlp info dict (or flat playlist entry)."""
+        duration = info.get("duration")
+        return VideoMetadata(
+            video_id=info["id"],
+            title=info.get("title") or "",
+            url=f"https://www.youtube.com/watch?v={info['id']}",
+            duration_seconds=int(duration) if duration is not None else None,
+            upload_date=info.get("upload_date"),
+            description=info.get("description"),
+            thumbnail_url=info.get("thumbnail"),
+        )
+
     def _title_matches_session(
         self, title: str, meeting_number: int, group_acronym: str
     ) -> bool:
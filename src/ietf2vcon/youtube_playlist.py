@@ -0,0 +1,289 @@
+"""Cached index of an IETF meeting's YouTube playlist.
+
+Searching YouTube once per session (``ytsearch5:``) is slow, fuzzy and
+quickly throttled. The IETF publishes every session recording of a meeting
+in one playlist, with titles such as ``IETF121-VCON-20241107-0930``.
+``PlaylistIndex`` enumerates that playlist once with ``yt-dlp
+--flat-playlist``, keeps the listing on disk and answers each session's
+lookup from an in-memory ``(group, date) -> videos`` map.
+
+Cache layout:
+    {cache_dir}/ietf{meeting}.json
+        {"playlist_url": ..., "fetched_at": <epoch>, "videos": [VideoMetadata, ...]}
+"""
+
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+from .file_links import atomic_write_json
+from .youtube import VideoMetadata, YouTubeResolver
+from .ytdlp import InProcessYtDlp, YtDlpError, get_ytdlp
+
+logger = logging.getLogger(__name__)
+
+# New recordings keep appearing during the meeting week
+DEFAULT_PLAYLIST_TTL = 6 * 3600.0
+
+# IETF121-VCON-20241107-0930, "IETF 118 - HTTPBIS - 2023-11-06 13:00"
+_SESSION_TITLE = re.compile(
+    r"ietf\s*-?\s*(?P<meeting>\d+)\s*-\s*(?P<group>[a-z0-9][a-z0-9_-]*?)\s*-\s*"
+    r"(?P<date>\d{4}-?\d{2}-?\d{2})(?:\s*-?\s*(?P<time>\d{2}:?\d{2}))?",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class MeetingPlaylist:
+    """The videos of one meeting, indexed by group and session date."""
+
+    meeting_number: int
+    by_session: dict[tuple[str, str], list[VideoMetadata]] = field(default_factory=dict)
+    unparsed: list[VideoMetadata] = field(default_factory=list)
+    # video id -> session start (HHMM) from titles that carry one
+    start_times: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_videos(cls, meeting_number: int, videos: list[VideoMetadata]) -> "MeetingPlaylist":
+        """Index the videos whose titles name this meeting."""
+        playlist = cls(meeting_number)
+        timed = []
+        for video in videos:
+            match = _SESSION_TITLE.search(video.title)
+            if match is None:
+                if re.search(rf"ietf\W*{meeting_number}\b", video.title, re.IGNORECASE):
+                    playlist.unparsed.append(video)
+                continue
+            if int(match["meeting"]) != meeting_number:
+                continue
+            day = match["date"].replace("-", "")
+            key = (match["group"].lower(), f"{day[:4]}-{day[4:6]}-{day[6:]}")
+            start = (match["time"] or "").replace(":", "")
+            if start:
+                playlist.start_times[video.video_id] = start
+            timed.append((start, key, video))
+
+        for _, key, video in sorted(timed, key=lambda t: t[0]):
+            playlist.by_session.setdefault(key, []).append(video)
+        return playlist
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.by_session.values()) + len(self.unparsed)
+
+    def find(
+        self,
+        group_acronym: str,
+        session_date: str | None = None,
+        session_time: str | None = None,
+    ) -> VideoMetadata | None:
+        """Return the video of a group's session.
+
+        Titles carry the meeting's local date, so the day before and after
+        are considered too. Among those, a title with the session's start
+        time wins; otherwise the earliest video of the closest day.
+
+        Args:
+            group_acronym: Working group acronym
+            session_date: Local session date (YYYY-MM-DD); any date if None
+            session_time: Local session start (HHMM), if known
+
+        Returns:
+            The matching video, or None
+        """
+        group = group_acronym.lower()
+        if session_date:
+            day = date.fromisoformat(session_date)
+            window = [
+                video
+                for offset in (0, -1, 1)
+                for video in self.by_session.get(
+                    (group, (day + timedelta(days=offset)).isoformat()), []
+                )
+            ]
+            if session_time:
+                for video in window:
+                    if self.start_times.get(video.video_id) == session_time:
+                        return video
+            if window:
+                return window[0]
+        else:
+            for (g, _), videos in sorted(self.by_session.items()):
+                if g == group:
+                    return videos[0]
+
+        # Titles not in the usual format: fall back to a word match
+        pattern = re.compile(rf"\b{re.escape(group)}\b", re.IGNORECASE)
+        for video in self.unparsed:
+            if pattern.search(video.title):
+                return video
+        return None
+
+
+class PlaylistIndex:
+    """Per-meeting playlist listings, fetched once and cached on disk.
+
+    Safe to share between threads; each meeting is enumerated at most once
+    per process (a failed enumeration is not retried until the next run).
+
+    Args:
+        cache_dir: Directory for the cached listings
+        ttl: Seconds a cached listing is used before fetching it again
+            (None means forever)
+        ytdlp: In-process yt-dlp backend (default: the shared one, if
+            yt_dlp is importable)
+        use_subprocess: Always run the ``yt-dlp`` command instead
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: float | None = DEFAULT_PLAYLIST_TTL,
+        ytdlp: InProcessYtDlp | None = None,
+        use_subprocess: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.ytdlp = None if use_subprocess else (ytdlp or get_ytdlp())
+        self.fetches = 0
+        self._playlists: dict[int, MeetingPlaylist | None] = {}
+        self._lock = threading.Lock()
+
+    def get(self, meeting_number: int, playlist_url: str) -> MeetingPlaylist | None:
+        """Return a meeting's indexed playlist.
+
+        Args:
+            meeting_number: IETF meeting number
+            playlist_url: The meeting's YouTube playlist
+
+        Returns:
+            The index, or None if the playlist could not be listed or has
+            no videos of this meeting
+        """
+        with self._lock:
+            if meeting_number not in self._playlists:
+                self._playlists[meeting_number] = self._load(meeting_number, playlist_url)
+            return self._playlists[meeting_number]
+
+    def _cache_path(self, meeting_number: int) -> Path:
+        return self.cache_dir / f"ietf{meeting_number}.json"
+
+    def _load(self, meeting_number: int, playlist_url: str) -> MeetingPlaylist | None:
+        videos = self._read_cache(meeting_number, playlist_url)
+        if videos is None:
+            videos = self._fetch(playlist_url)
+            if videos is None:
+                return None
+            self._write_cache(meeting_number, playlist_url, videos)
+
+        playlist = MeetingPlaylist.from_videos(meeting_number, videos)
+        if not len(playlist):
+            logger.warning(f"Playlist {playlist_url} has no IETF {meeting_number} videos")
+            return None
+        logger.info(f"Indexed {len(playlist)} IETF {meeting_number} videos from {playlist_url}")
+        return playlist
+
+    def _read_cache(self, meeting_number: int, playlist_url: str) -> list[VideoMetadata] | None:
+        path = self._cache_path(meeting_number)
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable playlist cache {path}: {e}")
+            return None
+
+        if data.get("playlist_url") != playlist_url:
+            return None
+        if self.ttl is not None and time.time() - data.get("fetched_at", 0) > self.ttl:
+            return None
+        return [VideoMetadata(**video) for video in data.get("videos", [])]
+
+    def _write_cache(
+        self, meeting_number: int, playlist_url: str, videos: list[VideoMetadata]
+    ) -> None:
+        try:
+            atomic_write_json(
+                self._cache_path(meeting_number),
+                {
+                    "playlist_url": playlist_url,
+                    "fetched_at": time.time(),
+                    "videos": [asdict(video) for video in videos],
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache playlist {playlist_url}: {e}")
+
+    def _fetch(self, playlist_url: str) -> list[VideoMetadata] | None:
+        """List a playlist's videos without resolving each one."""
+        logger.info(f"Listing YouTube playlist: {playlist_url}")
+        self.fetches += 1
+        if self.ytdlp is not None:
+            try:
+                info = self.ytdlp.extract_info(playlist_url, flat=True)
+                return [
+                    YouTubeResolver._metadata_from_info(entry)
+                    for entry in info.get("entries") or []
+                    if entry.get("id")
+                ]
+            except YtDlpError as e:
+                logger.warning(f"yt-dlp playlist listing failed: {e}")
+                return None
+            except Exception as e:
+                logger.warning(f"In-process yt-dlp failed, running the command: {e}")
+
+        try:
+            result = subprocess.run(
+                [
+                    "yt-dlp",
+                    "--flat-playlist",
+                    "--print", "%(id)s\t%(duration)s\t%(upload_date)s\t%(title)s",
+                    playlist_url,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=300,
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Listing the YouTube playlist timed out")
+            return None
+        except FileNotFoundError:
+            logger.error("yt-dlp not found. Install with: pip install yt-dlp")
+            return None
+        except Exception as e:
+            logger.error(f"Listing the YouTube playlist failed: {e}")
+            return None
+
+        if result.returncode != 0:
+            logger.warning(f"yt-dlp playlist listing failed: {result.stderr}")
+            return None
+        return parse_flat_playlist(result.stdout)
+
+
+def parse_flat_playlist(output: str) -> list[VideoMetadata]:
+    """Parse ``id<TAB>duration<TAB>upload_date<TAB>title`` lines from yt-dlp."""
+    videos = []
+    for line in output.splitlines():
+        parts = line.split("\t", 3)
+        if len(parts) < 4 or not parts[0]:
+            continue
+        video_id, duration, upload_date, title = parts
+        try:
+            duration_seconds = int(float(duration))
+        except ValueError:
+            duration_seconds = None
+        videos.append(
+            VideoMetadata(
+                video_id=video_id,
+                title=title,
+                url=f"https://www.youtube.com/watch?v={video_id}",
+                duration_seconds=duration_seconds,
+                upload_date=upload_date if upload_date.isdigit() else None,
+            )
+        )
+    return videos
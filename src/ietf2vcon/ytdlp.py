@@ -0,0 +1,181 @@
+"""In-process yt-dlp execution.
+
+Running the ``yt-dlp`` command costs an interpreter start and the import of
+every extractor before any network work, on each call. ``InProcessYtDlp``
+drives ``yt_dlp.YoutubeDL`` directly instead: each thread keeps one
+long-lived instance for metadata and caption requests, and the info of
+recently seen videos is reused, so looking up a video's metadata, listing
+its captions and fetching them costs one extraction.
+
+Downloads need per-call options (output template, post-processors) and get
+a fresh ``YoutubeDL`` each time, which is cheap once the module is loaded.
+
+When ``yt_dlp`` cannot be imported, :func:`get_ytdlp` returns None and
+callers keep using the ``yt-dlp`` command.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Videos whose extracted info is kept for later calls
+INFO_CACHE_SIZE = 64
+
+_BASE_PARAMS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "skip_download": True,
+}
+
+
+class YtDlpError(Exception):
+    """yt-dlp could not extract or download a video (it is not a usage error)."""
+
+
+class InProcessYtDlp:
+    """Reusable ``yt_dlp.YoutubeDL`` instances, one per thread.
+
+    Args:
+        factory: ``YoutubeDL`` class to instantiate (default: yt_dlp's)
+        info_cache_size: Number of extracted videos kept for reuse
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[dict], Any] | None = None,
+        info_cache_size: int = INFO_CACHE_SIZE,
+    ):
+        if factory is None:
+            import yt_dlp
+
+            factory = yt_dlp.YoutubeDL
+        self.factory = factory
+        self.info_cache_size = info_cache_size
+        self.instances_created = 0
+        self._local = threading.local()
+        self._info: OrderedDict[str, dict] = OrderedDict()
+        self._info_lock = threading.Lock()
+
+    def _ydl(self, flat: bool) -> Any:
+        """Return this thread's long-lived instance (flat or full extraction)."""
+        attr = "flat" if flat else "full"
+        ydl = getattr(self._local, attr, None)
+        if ydl is None:
+            params = dict(_BASE_PARAMS)
+            if flat:
+                params["extract_flat"] = "in_playlist"
+            ydl = self._create(params)
+            setattr(self._local, attr, ydl)
+        return ydl
+
+    def _create(self, params: dict) -> Any:
+        self.instances_created += 1
+        return self.factory(params)
+
+    def extract_info(self, url: str, flat: bool = False) -> dict:
+        """Extract a video's, playlist's or search's info without downloading.
+
+        Single videos are cached by URL, so repeated calls are free.
+
+        Args:
+            url: Video, playlist or ``ytsearchN:`` URL
+            flat: List playlist/search entries without resolving each one
+
+        Returns:
+            The info dict
+
+        Raises:
+            YtDlpError: If extraction failed
+        """
+        if not flat:
+            with self._info_lock:
+                info = self._info.get(url)
+                if info is not None:
+                    self._info.move_to_end(url)
+                    return info
+
+        try:
+            info = self._ydl(flat).extract_info(url, download=False)
+        except Exception as e:
+            if _is_download_error(e):
+                raise YtDlpError(str(e)) from e
+            raise
+        if info is None:
+            raise YtDlpError(f"No info extracted for {url}")
+
+        if not flat:
+            with self._info_lock:
+                self._info[url] = info
+                while len(self._info) > self.info_cache_size:
+                    self._info.popitem(last=False)
+        return info
+
+    def fetch(self, url: str) -> bytes:
+        """GET a URL found in extracted info (e.g. a caption track).
+
+        Uses the instance's own opener, so cookies and headers match the
+        extraction.
+
+        Raises:
+            YtDlpError: If the request failed
+        """
+        try:
+            with self._ydl(False).urlopen(url) as response:
+                return response.read()
+        except Exception as e:
+            raise YtDlpError(f"Failed to fetch {url}: {e}") from e
+
+    def download(self, url: str, params: dict) -> Path | None:
+        """Download a video with call-specific options.
+
+        Args:
+            url: Video URL
+            params: ``YoutubeDL`` options (outtmpl, format, postprocessors, ...)
+
+        Returns:
+            Path of the final file (after post-processing), or None
+
+        Raises:
+            YtDlpError: If the download failed
+        """
+        options = {**_BASE_PARAMS, "skip_download": False, **params}
+        try:
+            with self._create(options) as ydl:
+                info = ydl.extract_info(url, download=True)
+        except Exception as e:
+            if _is_download_error(e):
+                raise YtDlpError(str(e)) from e
+            raise
+
+        downloads = (info or {}).get("requested_downloads") or []
+        path = downloads[-1].get("filepath") if downloads else None
+        return Path(path) if path else None
+
+
+def _is_download_error(error: Exception) -> bool:
+    """Return True for yt-dlp's errors about the video itself (unavailable, private, ...)."""
+    return type(error).__name__ in ("DownloadError", "ExtractorError")
+
+
+_ytdlp: InProcessYtDlp | None = None
+_ytdlp_checked = False
+_ytdlp_lock = threading.Lock()
+
+
+def get_ytdlp() -> InProcessYtDlp | None:
+    """Return the process-wide in-process backend, or None if yt_dlp is not importable."""
+    global _ytdlp, _ytdlp_checked
+    with _ytdlp_lock:
+        if not _ytdlp_checked:
+            _ytdlp_checked = True
+            try:
+                _ytdlp = InProcessYtDlp()
+            except ImportError:
+                logger.info("yt_dlp module not available; using the yt-dlp command")
+        return _ytdlp
@@ -9,9 +9,10 @@ from datetime import datetime
 from typing import Any
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .models import ChatMessage
+from .ratelimit import rate_limit_hooks
+from .retry import http_retry
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,7 @@ class ZulipClient:
                 base_url=self.base_url,
                 auth=auth,
                 timeout=30.0,
+                event_hooks=rate_limit_hooks(),
             )
         return self._client
 
@@ -71,7 +73,7 @@ class ZulipClient:
     def __exit__(self, *args):
         self.close()
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    @http_retry()
     def _get(self, endpoint: str, params: dict | None = None) -> dict[str, Any]:
         """Make an authenticated GET request."""
         response = self.client.get(f"/api/v1/{endpoint}", params=params)
@@ -152,6 +154,7 @@ class ZulipClient:
         group_acronym: str,
         session_start: datetime | None = None,
         session_end: datetime | None = None,
+        missing_ok: bool = True,
     ) -> list[ChatMessage]:
         """Get chat messages for an IETF session.
 
@@ -162,6 +165,8 @@ class ZulipClient:
             group_acronym: Working group acronym
             session_start: Session start time
             session_end: Session end time
+            missing_ok: If False, re-raise the 404 for a missing stream
+                instead of returning no messages
 
         Returns:
             List of ChatMessage objects from the session
@@ -173,7 +178,7 @@ class ZulipClient:
         try:
             messages = self.get_messages(stream_name, num_messages=5000)
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
+            if e.response.status_code == 404 and missing_ok:
                 logger.warning(f"Stream '{stream_name}' not found")
                 return []
             raise
@@ -0,0 +1,170 @@
+"""Unit tests for ietf2vcon.async_datatracker module."""
+
+import httpx
+import pytest
+
+from ietf2vcon.async_datatracker import AsyncDataTrackerClient
+from ietf2vcon.datatracker import _resource_memo
+
+
+@pytest.fixture(autouse=True)
+def clear_resource_memo():
+    """Isolate tests from resources memoized by earlier tests."""
+    _resource_memo.clear()
+    yield
+    _resource_memo.clear()
+
+
+def _page(objects: list[dict], total: int | None = None, next_url: str | None = None) -> dict:
+    """Build a Tastypie list response."""
+    return {
+        "meta": {
+            "limit": 100,
+            "next": next_url,
+            "total_count": len(objects) if total is None else total,
+        },
+        "objects": objects,
+    }
+
+
+class FakeDatatracker:
+    """MockTransport handler answering by path and recording requests."""
+
+    def __init__(self, routes: dict[str, dict]):
+        self.routes = routes
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = self.routes.get(request.url.path)
+        if callable(body):
+            body = body(request)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, json=body)
+
+    def count(self, path: str) -> int:
+        return sum(1 for r in self.requests if r.url.path == path)
+
+
+@pytest.fixture
+def datatracker():
+    """Routes for one vcon session at IETF 121."""
+    return FakeDatatracker(
+        {
+            "/api/v1/meeting/meeting/": _page(
+                [
+                    {
+                        "number": "121",
+                        "city": "Dublin",
+                        "country": "IE",
+                        "date": "2024-11-02",
+                        "days": 7,
+                        "time_zone": "Europe/Dublin",
+                        "schedule": "/api/v1/meeting/schedule/1/",
+                    }
+                ]
+            ),
+            "/api/v1/meeting/session/": _page(
+                [
+                    {
+                        "id": 33406,
+                        "group": "/api/v1/group/group/10/",
+                        "name": "",
+                        "meeting": "/api/v1/meeting/meeting/121/",
+                    }
+                ]
+            ),
+            "/api/v1/meeting/schedtimesessassignment/": _page(
+                [
+                    {
+                        "session": "/api/v1/meeting/session/33406/",
+                        "timeslot": "/api/v1/meeting/timeslot/7/",
+                    }
+                ]
+            ),
+            "/api/v1/meeting/timeslot/": _page(
+                [
+                    {
+                        "id": 7,
+                        "resource_uri": "/api/v1/meeting/timeslot/7/",
+                        "time": "2024-11-07T09:30:00Z",
+                        "duration": "02:00:00",
+                        "location": "/api/v1/meeting/room/3/",
+                    }
+                ]
+            ),
+            "/api/v1/meeting/room/": _page(
+                [{"id": 3, "name": "Liffey A", "resource_uri": "/api/v1/meeting/room/3/"}]
+            ),
+            "/api/v1/group/group/10/": {"acronym": "vcon", "name": "Virtualized Conversations"},
+        }
+    )
+
+
+class TestAsyncDataTrackerClient:
+    """Tests for AsyncDataTrackerClient."""
+
+    @pytest.mark.asyncio
+    async def test_get_meeting(self, datatracker):
+        """Test fetching meeting metadata."""
+        async with AsyncDataTrackerClient(
+            transport=httpx.MockTransport(datatracker)
+        ) as client:
+            meeting = await client.get_meeting(121)
+
+        assert meeting.number == 121
+        assert meeting.city == "Dublin"
+
+    @pytest.mark.asyncio
+    async def test_sessions_for_groups_share_schedule(self, datatracker):
+        """Concurrent group lookups load the meeting schedule once."""
+        async with AsyncDataTrackerClient(
+            transport=httpx.MockTransport(datatracker)
+        ) as client:
+            results = await client.get_sessions_for_groups(121, ["vcon", "vcon", "vcon"])
+
+        session = results["vcon"][0]
+        assert session.session_id == "33406"
+        assert session.room == "Liffey A"
+        assert session.duration_seconds == 7200
+        assert session.name == "Virtualized Conversations"
+        assert datatracker.count("/api/v1/meeting/schedtimesessassignment/") == 1
+        assert datatracker.count("/api/v1/group/group/10/") == 1
+
+    @pytest.mark.asyncio
+    async def test_paginated_fetches_remaining_pages_by_offset(self):
+        """Pages after the first are requested by offset and kept in order."""
+
+        def documents(request):
+            offset = int(request.url.params.get("offset", 0))
+            objects = [{"name": f"doc-{i}"} for i in range(offset, min(offset + 100, 250))]
+            return _page(objects, total=250, next_url="/api/v1/doc/document/?offset=x")
+
+        fake = FakeDatatracker({"/api/v1/doc/document/": documents})
+        async with AsyncDataTrackerClient(transport=httpx.MockTransport(fake)) as client:
+            results = await client._get_paginated("/api/v1/doc/document/")
+
+        assert [r["name"] for r in results] == [f"doc-{i}" for i in range(250)]
+        offsets = sorted(int(r.url.params.get("offset", 0)) for r in fake.requests)
+        assert offsets == [0, 100, 200]
+
+    @pytest.mark.asyncio
+    async def test_paginated_follows_next_without_total(self):
+        """Without total_count, pages are followed via meta.next."""
+
+        def documents(request):
+            offset = int(request.url.params.get("offset", 0))
+            objects = [{"name": f"doc-{i}"} for i in range(offset, min(offset + 100, 250))]
+            next_url = (
+                f"/api/v1/doc/document/?limit=100&offset={offset + 100}"
+                if offset + 100 < 250
+                else None
+            )
+            return {"meta": {"limit": 100, "next": next_url}, "objects": objects}
+
+        fake = FakeDatatracker({"/api/v1/doc/document/": documents})
+        async with AsyncDataTrackerClient(transport=httpx.MockTransport(fake)) as client:
+            results = await client._get_paginated("/api/v1/doc/document/")
+
+        assert [r["name"] for r in results] == [f"doc-{i}" for i in range(250)]
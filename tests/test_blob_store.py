@@ -0,0 +1,86 @@
+"""Unit tests for ietf2vcon.blob_store module."""
+
+import time
+
+import httpx
+
+from ietf2vcon.blob_store import BlobStore
+from ietf2vcon.materials import MaterialsDownloader
+from ietf2vcon.models import IETFMaterial
+
+NOTE_WELL = IETFMaterial(
+    type="slides",
+    title="Note Well",
+    url="https://datatracker.ietf.org/meeting/121/materials/slides-121-vcon-note-well",
+    filename="slides-121-vcon-note-well.pdf",
+)
+
+
+class TestBlobStore:
+    """Tests for the content-addressed store."""
+
+    def test_add_and_lookup(self, tmp_path):
+        source = tmp_path / "deck.pdf"
+        source.write_bytes(b"deck")
+
+        with BlobStore(tmp_path / "store") as store:
+            stored = store.add("https://example.org/deck", source, "ab" * 32, "cd" * 64, 4)
+            entry = store.lookup("https://example.org/deck")
+
+        assert entry == stored
+        assert entry.filename == "deck.pdf"
+        assert entry.path.read_bytes() == b"deck"
+        assert entry.path.stat().st_ino == source.stat().st_ino
+
+    def test_expired_or_missing_blob(self, tmp_path):
+        source = tmp_path / "deck.pdf"
+        source.write_bytes(b"deck")
+
+        with BlobStore(tmp_path / "store", ttl=60.0) as store:
+            entry = store.add("https://example.org/deck", source, "ab" * 32, "cd" * 64, 4)
+            store._conn.execute("UPDATE urls SET stored_at = ?", (time.time() - 120,))
+            assert store.lookup("https://example.org/deck") is None
+
+            store.ttl = None
+            entry.path.unlink()
+            assert store.lookup("https://example.org/deck") is None
+
+    def test_revisioned_urls_never_expire(self, tmp_path):
+        """Test only revision-less (latest revision) URLs are revalidated."""
+        source = tmp_path / "deck.pdf"
+        source.write_bytes(b"deck")
+        latest = "https://datatracker.ietf.org/meeting/121/materials/slides-121-vcon-intro"
+
+        with BlobStore(tmp_path / "store", ttl=60.0) as store:
+            store.add(latest, source, "ab" * 32, "cd" * 64, 4)
+            store.add(f"{latest}-01", source, "ab" * 32, "cd" * 64, 4)
+            store._conn.execute("UPDATE urls SET stored_at = ?", (time.time() - 120,))
+
+            assert store.lookup(latest) is None
+            assert store.lookup(f"{latest}-01") is not None
+
+
+class TestDownloaderBlobStore:
+    """Tests for MaterialsDownloader backed by a blob store."""
+
+    def test_second_run_links_without_http(self, tmp_path):
+        """Test a material downloaded into one directory is linked into another."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(200, content=b"note well")
+
+        with BlobStore(tmp_path / "store") as store:
+            results = []
+            for run in ("run1", "run2"):
+                with MaterialsDownloader(tmp_path / run, blob_store=store) as downloader:
+                    downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+                    results.append(downloader.download(NOTE_WELL))
+
+        first, second = results
+        assert len(requests) == 1
+        assert second.path == tmp_path / "run2" / "slides-121-vcon-note-well.pdf"
+        assert second.sha256 == first.sha256
+        assert second.path.stat().st_ino == first.path.stat().st_ino
+        assert store.hits == 1
@@ -1,6 +1,8 @@
 """Integration tests for ietf2vcon.converter module."""
 
 import json
+import sqlite3
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -120,6 +122,35 @@ class TestIETFSessionConverter:
         assert converter.options is not None
         assert converter.options.output_dir.exists()
 
+    def test_video_looked_up_by_local_date(self, converter, sample_ietf_session, mocker):
+        """Test the playlist is searched with the meeting's local date, not the UTC one."""
+        resolver = mocker.patch("ietf2vcon.converter.YouTubeResolver").return_value
+        resolver.search_session_video.return_value = None
+        session = sample_ietf_session.model_copy(
+            update={"start_time": datetime(2024, 11, 6, 23, 30, tzinfo=timezone.utc)}
+        )
+
+        converter._process_video(MagicMock(), session, [], [], time_zone="Australia/Brisbane")
+
+        args, kwargs = resolver.search_session_video.call_args
+        assert args[2] == "2024-11-07"
+        assert kwargs["session_time"] == "0930"
+
+    def test_close_releases_snapshot(self, tmp_path):
+        """Test leaving the converter closes the snapshot it opened."""
+        from ietf2vcon.snapshot import MeetingSnapshot
+
+        MeetingSnapshot(tmp_path / "ietf121.sqlite", readonly=False).close()
+        options = ConversionOptions(output_dir=tmp_path, snapshot_path=tmp_path / "ietf121.sqlite")
+
+        with IETFSessionConverter(options) as converter:
+            snapshot = converter._get_snapshot()
+            assert converter.get_negative_cache() is not None
+
+        assert converter._snapshot is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            snapshot._conn.execute("SELECT 1")
+
     def test_convert_session_minimal(
         self, converter, mock_datatracker, sample_ietf_meeting, sample_ietf_session
     ):
@@ -195,6 +226,31 @@ class TestIETFSessionConverter:
 
         assert "No sessions found" in result.errors[0]
 
+    def test_injected_datatracker_is_shared(
+        self, tmp_path, sample_ietf_meeting, sample_ietf_session
+    ):
+        """Test an injected client is reused across sessions and left open."""
+        datatracker = MagicMock()
+        datatracker.get_meeting.return_value = sample_ietf_meeting
+        datatracker.get_group_sessions.return_value = [sample_ietf_session]
+        datatracker.get_group_chairs.return_value = []
+        datatracker.get_session_materials.return_value = []
+        options = ConversionOptions(
+            output_dir=tmp_path,
+            include_video=False,
+            include_transcript=False,
+            include_chat=False,
+        )
+        converter = IETFSessionConverter(options, datatracker=datatracker)
+
+        with patch("ietf2vcon.converter.DataTrackerClient") as mock_client_cls:
+            converter.convert_session(121, "vcon")
+            converter.convert_session(121, "sipcore")
+
+        mock_client_cls.assert_not_called()
+        assert datatracker.get_group_sessions.call_count == 2
+        datatracker.close.assert_not_called()
+
     def test_save_vcon(self, converter, mock_datatracker, tmp_path):
         """Test saving vCon to file."""
         result = converter.convert_session(121, "vcon")
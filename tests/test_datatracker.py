@@ -1,14 +1,50 @@
 """Integration tests for ietf2vcon.datatracker module."""
 
 import json
+import threading
+import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ietf2vcon.datatracker import DataTrackerClient
+from ietf2vcon.datatracker import DataTrackerClient, _chair_roster, _resource_memo
+from ietf2vcon.http_cache import CacheMissError, ResourceMemo, ResponseCache
 from ietf2vcon.models import IETFMeeting, IETFSession
 
 
+@pytest.fixture(autouse=True)
+def clear_resource_memo():
+    """Keep the process-wide resource memo and chair roster from leaking between tests."""
+    _resource_memo.clear()
+    _chair_roster.clear()
+    yield
+    _resource_memo.clear()
+    _chair_roster.clear()
+
+
+def _page(objects: list[dict]) -> dict:
+    """Wrap objects in a single-page Tastypie list response."""
+    return {
+        "meta": {"limit": 100, "next": None, "offset": 0, "total_count": len(objects)},
+        "objects": objects,
+    }
+
+
+def _router(routes: dict[str, dict]):
+    """Build an httpx.Client.get side effect that answers by URL path."""
+
+    def get(url, params=None, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = routes[url]
+        response.raise_for_status = MagicMock()
+        return response
+
+    return get
+
+
 class TestDataTrackerClient:
     """Tests for DataTrackerClient."""
 
@@ -60,58 +96,66 @@ class TestDataTrackerClient:
         meeting = client.get_meeting(999)
         assert meeting is None
 
-    @pytest.mark.skip(reason="Complex mocking required for session enrichment")
     def test_get_group_sessions_success(
-        self, mock_client, datatracker_sessions_response
+        self, mock_client, datatracker_meeting_response, datatracker_sessions_response
     ):
-        """Test getting group sessions."""
+        """Test getting group sessions joined with the meeting schedule."""
         client, mock_http = mock_client
 
-        # Mock group lookup
-        mock_group_response = MagicMock()
-        mock_group_response.json.return_value = {"id": 2383, "acronym": "vcon"}
-        mock_group_response.raise_for_status = MagicMock()
-
-        # Mock sessions lookup
-        mock_sessions_response = MagicMock()
-        mock_sessions_response.json.return_value = datatracker_sessions_response
-        mock_sessions_response.raise_for_status = MagicMock()
-
-        # Mock schedule assignment
-        mock_schedule_response = MagicMock()
-        mock_schedule_response.json.return_value = {
-            "meta": {"total_count": 1},
-            "objects": [{"timeslot": "/api/v1/meeting/timeslot/18330/"}],
-        }
-        mock_schedule_response.raise_for_status = MagicMock()
-
-        # Mock timeslot
-        mock_timeslot_response = MagicMock()
-        mock_timeslot_response.json.return_value = {
-            "time": "2024-11-07T15:30:00",
-            "duration": "01:00:00",
-            "location": "/api/v1/meeting/room/1011/",
-        }
-        mock_timeslot_response.raise_for_status = MagicMock()
-
-        # Mock room
-        mock_room_response = MagicMock()
-        mock_room_response.json.return_value = {"name": "Liffey Hall 2"}
-        mock_room_response.raise_for_status = MagicMock()
-
-        mock_http.get.side_effect = [
-            mock_group_response,
-            mock_sessions_response,
-            mock_schedule_response,
-            mock_timeslot_response,
-            mock_room_response,
-        ]
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/session/": datatracker_sessions_response,
+            "/api/v1/meeting/meeting/": datatracker_meeting_response,
+            "/api/v1/group/group/2383/": {"id": 2383, "acronym": "vcon", "name": "vCon"},
+            "/api/v1/meeting/schedtimesessassignment/": _page([
+                {
+                    "session": "/api/v1/meeting/session/33406/",
+                    "timeslot": "/api/v1/meeting/timeslot/18330/",
+                },
+            ]),
+            "/api/v1/meeting/timeslot/": _page([
+                {
+                    "resource_uri": "/api/v1/meeting/timeslot/18330/",
+                    "time": "2024-11-07T15:30:00",
+                    "duration": "01:00:00",
+                    "location": "/api/v1/meeting/room/1011/",
+                },
+            ]),
+            "/api/v1/meeting/room/": _page([
+                {"resource_uri": "/api/v1/meeting/room/1011/", "name": "Liffey Hall 2"},
+            ]),
+        })
 
         sessions = client.get_group_sessions(121, "vcon")
 
         assert len(sessions) == 1
         assert sessions[0].group_acronym == "vcon"
         assert sessions[0].session_id == "33406"
+        assert sessions[0].start_time.hour == 15
+        assert sessions[0].duration_seconds == 3600
+        assert sessions[0].room == "Liffey Hall 2"
+
+    def test_meeting_schedule_loaded_once(
+        self, mock_client, datatracker_meeting_response, datatracker_sessions_response
+    ):
+        """Test the schedule is fetched once per meeting, not per session."""
+        client, mock_http = mock_client
+
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/session/": datatracker_sessions_response,
+            "/api/v1/meeting/meeting/": datatracker_meeting_response,
+            "/api/v1/group/group/2383/": {"id": 2383, "name": "vCon"},
+            "/api/v1/meeting/schedtimesessassignment/": _page([]),
+            "/api/v1/meeting/timeslot/": _page([]),
+            "/api/v1/meeting/room/": _page([]),
+        })
+
+        client.get_group_sessions(121, "vcon")
+        client.get_group_sessions(121, "vcon")
+
+        urls = [c.args[0] for c in mock_http.get.call_args_list]
+        assert urls.count("/api/v1/meeting/schedtimesessassignment/") == 1
+        assert urls.count("/api/v1/meeting/timeslot/") == 1
+        assert urls.count("/api/v1/meeting/room/") == 1
 
     def test_get_group_sessions_no_sessions(self, mock_client):
         """Test getting sessions when none exist."""
@@ -133,6 +177,252 @@ class TestDataTrackerClient:
         sessions = client.get_group_sessions(121, "nonexistent")
         assert sessions == []
 
+    def test_meeting_schedule_loaded_once_across_threads(
+        self, mock_client, datatracker_meeting_response
+    ):
+        """Test threads sharing a client trigger a single schedule load."""
+        client, mock_http = mock_client
+        router = _router({
+            "/api/v1/meeting/meeting/": datatracker_meeting_response,
+            "/api/v1/meeting/schedtimesessassignment/": _page([]),
+            "/api/v1/meeting/timeslot/": _page([]),
+            "/api/v1/meeting/room/": _page([]),
+        })
+
+        def slow_get(url, params=None, **kwargs):
+            time.sleep(0.01)
+            return router(url, params, **kwargs)
+
+        mock_http.get.side_effect = slow_get
+
+        threads = [
+            threading.Thread(target=client.get_meeting_schedule, args=(121,))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        urls = [c.args[0] for c in mock_http.get.call_args_list]
+        assert urls.count("/api/v1/meeting/schedtimesessassignment/") == 1
+
+    def test_get_meeting_sessions_batches_groups(self, mock_client):
+        """Test session listing resolves all groups in one batched query."""
+        client, mock_http = mock_client
+
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/session/": _page([
+                {"id": 1, "group": "/api/v1/group/group/10/"},
+                {"id": 2, "group": "/api/v1/group/group/20/"},
+                {"id": 3, "group": "/api/v1/group/group/10/"},
+            ]),
+            "/api/v1/meeting/meeting/": _page([]),
+            "/api/v1/meeting/schedtimesessassignment/": _page([]),
+            "/api/v1/meeting/timeslot/": _page([]),
+            "/api/v1/meeting/room/": _page([]),
+            "/api/v1/group/group/": _page([
+                {"id": 10, "resource_uri": "/api/v1/group/group/10/", "acronym": "vcon"},
+                {"id": 20, "resource_uri": "/api/v1/group/group/20/", "acronym": "httpbis"},
+            ]),
+        })
+
+        sessions = client.get_meeting_sessions(121)
+
+        assert [s.group_acronym for s in sessions] == ["vcon", "httpbis", "vcon"]
+        group_calls = [
+            c for c in mock_http.get.call_args_list if c.args[0] == "/api/v1/group/group/"
+        ]
+        assert len(group_calls) == 1
+        assert group_calls[0].kwargs["params"]["id__in"] == "10,20"
+
+
+class TestDataTrackerResponseCache:
+    """Tests for the on-disk Datatracker response cache."""
+
+    @pytest.fixture
+    def cached_client(self, tmp_path):
+        """Create a DataTrackerClient with a response cache and mocked HTTP."""
+        with patch("ietf2vcon.datatracker.httpx.Client") as mock_httpx:
+            mock_instance = MagicMock()
+            mock_httpx.return_value = mock_instance
+            cache = ResponseCache(tmp_path / "cache", ttl=3600)
+            yield DataTrackerClient(cache=cache), mock_instance, cache
+
+    def test_fresh_entry_skips_request(self, cached_client, datatracker_meeting_response):
+        """Test a fresh cached response is served without an HTTP request."""
+        client, mock_http, cache = cached_client
+        mock_http.get.side_effect = _router(
+            {"/api/v1/meeting/meeting/": datatracker_meeting_response}
+        )
+
+        assert client.get_meeting(121).city == "Dublin"
+        assert client.get_meeting(121).city == "Dublin"
+        assert mock_http.get.call_count == 1
+
+    def test_stale_entry_revalidated(self, cached_client, datatracker_meeting_response):
+        """Test a stale entry is revalidated and reused on 304."""
+        client, mock_http, cache = cached_client
+        cache.ttl = 0
+        cache.put(
+            "/api/v1/meeting/meeting/",
+            {"number": 121},
+            datatracker_meeting_response,
+            etag='"abc"',
+        )
+
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        mock_http.get.return_value = not_modified
+
+        meeting = client.get_meeting(121)
+
+        assert meeting.city == "Dublin"
+        headers = mock_http.get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"abc"'
+
+    def test_offline_miss_raises(self, cached_client):
+        """Test offline mode never touches the network."""
+        client, mock_http, cache = cached_client
+        cache.offline = True
+
+        with pytest.raises(CacheMissError):
+            client._get("/api/v1/meeting/meeting/", {"number": 999})
+        mock_http.get.assert_not_called()
+
+
+class TestResourceMemo:
+    """Tests for the process-wide resource memo."""
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        memo = ResourceMemo(maxsize=2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        memo.get("a")
+        memo.put("c", 3)
+
+        assert "a" in memo
+        assert "b" not in memo
+        assert len(memo) == 2
+
+    def test_single_flight(self):
+        """Test concurrent loads of one key call the loader once."""
+        memo = ResourceMemo()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"acronym": "vcon"}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(memo.get_or_load("g", loader)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert results == [{"acronym": "vcon"}] * 8
+
+    def test_failures_not_cached(self):
+        """Test a failed load is retried on the next lookup."""
+        memo = ResourceMemo()
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            memo.get_or_load("g", failing)
+        assert memo.get_or_load("g", lambda: 42) == 42
+
+    def test_shared_across_clients(self):
+        """Test resource URIs resolved by one client are reused by another."""
+        with patch("ietf2vcon.datatracker.httpx.Client") as mock_httpx:
+            mock_http = MagicMock()
+            mock_httpx.return_value = mock_http
+            mock_http.get.side_effect = _router(
+                {"/api/v1/group/group/2383/": {"id": 2383, "acronym": "vcon"}}
+            )
+
+            first = DataTrackerClient()
+            second = DataTrackerClient()
+            first._get_resource("/api/v1/group/group/2383/")
+            group = second._get_resource("https://datatracker.ietf.org/api/v1/group/group/2383/")
+
+        assert group["acronym"] == "vcon"
+        assert mock_http.get.call_count == 1
+
+
+class TestDataTrackerPagination:
+    """Tests for paginated list queries."""
+
+    @pytest.fixture
+    def mock_http(self):
+        """Patch httpx.Client for a DataTrackerClient."""
+        with patch("ietf2vcon.datatracker.httpx.Client") as mock_httpx:
+            yield mock_httpx.return_value
+
+    @staticmethod
+    def _pages(total: int, with_total: bool = True):
+        """Serve numbered objects by offset, like a Tastypie list endpoint."""
+
+        def get(url, params=None, **kwargs):
+            if params is None:  # following meta.next
+                params = dict(p.split("=") for p in url.split("?")[1].split("&"))
+            offset = int(params.get("offset", 0))
+            end = min(offset + 100, total)
+            meta = {"limit": 100, "offset": offset}
+            meta["next"] = f"/api/v1/doc/document/?limit=100&offset={end}" if end < total else None
+            if with_total:
+                meta["total_count"] = total
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "meta": meta,
+                "objects": [{"id": i} for i in range(offset, end)],
+            }
+            return response
+
+        return get
+
+    def test_remaining_pages_fetched_by_offset_in_order(self, mock_http):
+        """Test pages after the first are requested by offset and kept in order."""
+        mock_http.get.side_effect = self._pages(250)
+        client = DataTrackerClient(page_concurrency=4)
+
+        results = client._get_paginated("/api/v1/doc/document/", {"type": "slides"})
+
+        assert [r["id"] for r in results] == list(range(250))
+        offsets = sorted(c.kwargs["params"].get("offset", 0) for c in mock_http.get.call_args_list)
+        assert offsets == [0, 100, 200]
+        assert all(c.kwargs["params"]["type"] == "slides" for c in mock_http.get.call_args_list)
+
+    def test_iter_paginated_yields_first_page_before_others(self, mock_http):
+        """Test the generator yields objects before fetching every page."""
+        mock_http.get.side_effect = self._pages(250)
+        client = DataTrackerClient(page_concurrency=1)
+
+        pages = client._iter_paginated("/api/v1/doc/document/")
+        assert next(pages) == {"id": 0}
+        assert mock_http.get.call_count == 1
+        assert len(list(pages)) == 249
+
+    def test_follows_next_without_total_count(self, mock_http):
+        """Test responses without total_count are followed serially."""
+        mock_http.get.side_effect = self._pages(150, with_total=False)
+        client = DataTrackerClient()
+
+        results = client._get_paginated("/api/v1/doc/document/")
+
+        assert [r["id"] for r in results] == list(range(150))
+        assert mock_http.get.call_count == 2
+
 
 class TestDataTrackerMaterials:
     """Tests for fetching materials from DataTracker."""
@@ -147,54 +437,83 @@ class TestDataTrackerMaterials:
             client._client = mock_instance
             yield client, mock_instance
 
-    @pytest.mark.skip(reason="Complex mocking required for materials enrichment")
+    @pytest.fixture
+    def slides_document(self):
+        """Sample slides document resource."""
+        return {
+            "name": "slides-121-vcon-chair-slides",
+            "resource_uri": "/api/v1/doc/document/slides-121-vcon-chair-slides/",
+            "title": "Chair Slides",
+            "type": "/api/v1/name/doctypename/slides/",
+        }
+
     def test_get_session_materials(
         self,
         mock_client,
         datatracker_materials_response,
         datatracker_document_agenda_response,
         datatracker_document_recording_response,
+        slides_document,
     ):
-        """Test getting session materials."""
+        """Test getting session materials with one batched document query."""
         client, mock_http = mock_client
 
-        # Mock materials presentation
-        mock_materials_response = MagicMock()
-        mock_materials_response.json.return_value = datatracker_materials_response
-        mock_materials_response.raise_for_status = MagicMock()
-
-        # Mock document lookups
-        mock_agenda_response = MagicMock()
-        mock_agenda_response.json.return_value = datatracker_document_agenda_response
-        mock_agenda_response.raise_for_status = MagicMock()
-
-        mock_slides_response = MagicMock()
-        mock_slides_response.json.return_value = {
-            "name": "slides-121-vcon-chair-slides",
-            "title": "Chair Slides",
-            "type": "/api/v1/name/doctypename/slides/",
-            "external_url": "https://datatracker.ietf.org/meeting/121/materials/slides-121-vcon-chair-slides-00.pdf",
-        }
-        mock_slides_response.raise_for_status = MagicMock()
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/sessionpresentation/": datatracker_materials_response,
+            "/api/v1/doc/document/": _page([
+                datatracker_document_agenda_response,
+                slides_document,
+                datatracker_document_recording_response,
+            ]),
+        })
 
-        mock_recording_response = MagicMock()
-        mock_recording_response.json.return_value = datatracker_document_recording_response
-        mock_recording_response.raise_for_status = MagicMock()
+        materials = client.get_session_materials(121, "vcon")
 
-        mock_http.get.side_effect = [
-            mock_materials_response,
-            mock_agenda_response,
-            mock_slides_response,
-            mock_recording_response,
+        # Three documents plus the agenda page and notes links
+        assert len(materials) == 5
+        types = [m.type for m in materials]
+        assert types[:3] == ["agenda", "slides", "recording"]
+        doc_calls = [
+            c for c in mock_http.get.call_args_list if c.args[0] == "/api/v1/doc/document/"
         ]
+        assert len(doc_calls) == 1
+        assert doc_calls[0].kwargs["params"]["name__in"] == (
+            "agenda-121-vcon,slides-121-vcon-chair-slides,recording-121-vcon-1"
+        )
 
+    def test_get_meeting_materials_split_by_group(
+        self,
+        mock_client,
+        datatracker_materials_response,
+        datatracker_sessions_response,
+        datatracker_document_agenda_response,
+        datatracker_document_recording_response,
+        slides_document,
+    ):
+        """Test meeting-wide materials are split by group and reused."""
+        client, mock_http = mock_client
+
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/sessionpresentation/": datatracker_materials_response,
+            "/api/v1/meeting/session/": datatracker_sessions_response,
+            "/api/v1/group/group/": _page([
+                {"id": 2383, "resource_uri": "/api/v1/group/group/2383/", "acronym": "vcon"},
+            ]),
+            "/api/v1/doc/document/": _page([
+                datatracker_document_agenda_response,
+                slides_document,
+                datatracker_document_recording_response,
+            ]),
+        })
+
+        by_group = client.get_meeting_materials(121)
+        calls_after_bulk = mock_http.get.call_count
         materials = client.get_session_materials(121, "vcon")
 
-        assert len(materials) == 3
-        types = [m.type for m in materials]
-        assert "agenda" in types
-        assert "slides" in types
-        assert "recording" in types
+        assert list(by_group) == ["vcon"]
+        assert len(by_group["vcon"]) == 3
+        assert len(materials) == 5
+        assert mock_http.get.call_count == calls_after_bulk
 
     @pytest.mark.skip(reason="Complex mocking required")
     def test_material_type_detection(
@@ -227,6 +546,146 @@ class TestDataTrackerMaterials:
         assert materials[0].type == "recording"
         assert "youtube.com" in materials[0].url
 
+    def test_changed_groups(self, mock_client):
+        """Test changed sessions, assignments and documents map to their groups."""
+        client, mock_http = mock_client
+        groups = {
+            f"/api/v1/group/group/{pk}/": {
+                "acronym": acronym,
+                "resource_uri": f"/api/v1/group/group/{pk}/",
+            }
+            for pk, acronym in [(1, "vcon"), (2, "httpbis")]
+        }
+
+        def get(url, params=None, **kwargs):
+            params = params or {}
+            if url == "/api/v1/meeting/session/" and "modified__gte" in params:
+                objects = [{"id": 1, "group": "/api/v1/group/group/1/"}]
+            elif url == "/api/v1/meeting/session/":
+                objects = [{
+                    "id": 2,
+                    "resource_uri": "/api/v1/meeting/session/2/",
+                    "group": "/api/v1/group/group/2/",
+                }]
+            elif url == "/api/v1/meeting/sessionpresentation/":
+                assert params["document__time__gte"] == "2024-11-04T12:00:00+00:00"
+                objects = [{"session": "/api/v1/meeting/session/2/"}]
+            elif url == "/api/v1/group/group/":
+                objects = list(groups.values())
+            else:
+                objects = []
+            return _router({url: _page(objects)})(url, params)
+
+        mock_http.get.side_effect = get
+
+        since = datetime(2024, 11, 4, 12, 0, tzinfo=timezone.utc)
+        assert client.get_changed_groups(121, since) == {"vcon", "httpbis"}
+
+
+class TestDataTrackerAgendaData:
+    """Tests for building sessions from the agenda-data document."""
+
+    @pytest.fixture
+    def agenda_data(self):
+        """Sample agenda-data document with one group session and a break."""
+        return {
+            "meeting": {"number": "121"},
+            "schedule": [
+                {
+                    "id": 1,
+                    "sessionId": 33000,
+                    "room": "Liffey A",
+                    "acronym": "vcon",
+                    "duration": 3600,
+                    "startDateTime": "2024-11-04T09:30:00+00:00",
+                    "type": "regular",
+                    "groupAcronym": "vcon",
+                    "groupName": "Virtualized Conversations",
+                    "agenda": {"url": "/meeting/121/materials/agenda-121-vcon-01.md"},
+                    "links": {
+                        "recordings": [
+                            {
+                                "name": "recording-121-vcon-1",
+                                "title": "Video recording for VCON",
+                                "url": "https://www.youtube.com/watch?v=abc123",
+                            }
+                        ]
+                    },
+                },
+                {
+                    "id": 2,
+                    "sessionId": 33001,
+                    "acronym": "secretariat",
+                    "groupAcronym": "secretariat",
+                    "startDateTime": "2024-11-04T11:30:00+00:00",
+                    "type": "break",
+                },
+            ],
+        }
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create an agenda-data DataTrackerClient with mocked HTTP client."""
+        with patch("ietf2vcon.datatracker.httpx.Client") as mock_httpx:
+            mock_instance = MagicMock()
+            mock_httpx.return_value = mock_instance
+            yield DataTrackerClient(agenda_data=True), mock_instance
+
+    def test_sessions_from_one_document(self, mock_client, agenda_data):
+        """Test every group's sessions come from a single agenda-data request."""
+        client, mock_http = mock_client
+        mock_http.get.side_effect = _router({"/api/meeting/121/agenda-data": agenda_data})
+
+        sessions = client.get_meeting_sessions(121)
+        vcon = client.get_group_sessions(121, "vcon")
+
+        assert [s.group_acronym for s in sessions] == ["vcon"]
+        assert vcon[0].session_id == "33000"
+        assert vcon[0].room == "Liffey A"
+        assert vcon[0].duration_seconds == 3600
+        assert vcon[0].name == "Virtualized Conversations"
+        assert vcon[0].recording_url == "https://www.youtube.com/watch?v=abc123"
+        assert mock_http.get.call_count == 1
+
+    def test_items_without_session_id_kept(self, mock_client, agenda_data):
+        """Test sessions lacking a sessionId are not deduplicated away."""
+        client, mock_http = mock_client
+        vcon = agenda_data["schedule"][0]
+        del vcon["sessionId"]
+        agenda_data["schedule"] += [
+            dict(vcon),  # listed twice
+            {**vcon, "startDateTime": "2024-11-06T13:00:00+00:00"},
+            {**vcon, "groupAcronym": "httpbis", "acronym": "httpbis"},
+        ]
+        mock_http.get.side_effect = _router({"/api/meeting/121/agenda-data": agenda_data})
+
+        assert len(client.get_group_sessions(121, "vcon")) == 2
+        assert len(client.get_group_sessions(121, "httpbis")) == 1
+
+    def test_agenda_materials_fill_gaps(self, mock_client, agenda_data):
+        """Test agenda-data recordings are added when the API lists none."""
+        client, mock_http = mock_client
+        mock_http.get.side_effect = _router({
+            "/api/meeting/121/agenda-data": agenda_data,
+            "/api/v1/meeting/sessionpresentation/": _page([]),
+        })
+
+        materials = client.get_session_materials(121, "vcon")
+
+        assert [m.type for m in materials[:2]] == ["agenda", "recording"]
+        assert materials[0].url.endswith("/agenda-121-vcon-01.md")
+        assert materials[1].url == "https://www.youtube.com/watch?v=abc123"
+
+    def test_falls_back_to_resource_api(self, mock_client):
+        """Test the resource API is used when agenda-data is unavailable."""
+        client, mock_http = mock_client
+        mock_http.get.side_effect = _router({
+            "/api/v1/meeting/session/": _page([]),
+        })
+
+        assert client.get_group_sessions(121, "vcon") == []
+        assert client.get_agenda(121) is None
+
 
 class TestDataTrackerChairs:
     """Tests for fetching working group chairs."""
@@ -297,6 +756,79 @@ class TestDataTrackerChairs:
         assert chairs[0].role == "chair"
         assert chairs[1].name == "Chris Wendt"
 
+    def test_prefetch_group_chairs(self, mock_client):
+        """Test one bulk roster load serves every group's chairs."""
+        client, mock_http = mock_client
+
+        mock_http.get.side_effect = _router({
+            "/api/v1/group/role/": _page([
+                {
+                    "group": "/api/v1/group/group/2383/",
+                    "person": "/api/v1/person/person/106987/",
+                    "email": "/api/v1/person/email/br@brianrosen.net/",
+                },
+                {
+                    "group": "/api/v1/group/group/2383/",
+                    "person": "/api/v1/person/person/120587/",
+                    "email": "/api/v1/person/email/chris@appliedbits.com/",
+                },
+                {
+                    "group": "/api/v1/group/group/1027/",
+                    "person": "/api/v1/person/person/106987/",
+                    "email": None,
+                },
+            ]),
+            "/api/v1/group/group/": _page([
+                {"id": 2383, "resource_uri": "/api/v1/group/group/2383/", "acronym": "vcon"},
+                {"id": 1027, "resource_uri": "/api/v1/group/group/1027/", "acronym": "sipcore"},
+            ]),
+            "/api/v1/person/person/": _page([
+                {
+                    "id": 106987,
+                    "resource_uri": "/api/v1/person/person/106987/",
+                    "name": "Brian Rosen",
+                },
+                {
+                    "id": 120587,
+                    "resource_uri": "/api/v1/person/person/120587/",
+                    "name": "Chris Wendt",
+                },
+            ]),
+        })
+
+        roster = client.prefetch_group_chairs()
+        calls = mock_http.get.call_count
+
+        assert [c.name for c in roster["vcon"]] == ["Brian Rosen", "Chris Wendt"]
+        chairs = client.get_group_chairs("vcon")
+        assert [(c.name, c.email) for c in chairs] == [
+            ("Brian Rosen", "br@brianrosen.net"),
+            ("Chris Wendt", "chris@appliedbits.com"),
+        ]
+        assert client.get_group_chairs("sipcore")[0].email is None
+        # Groups missing from a fresh roster have no chairs
+        assert client.get_group_chairs("nochairs") == []
+        assert mock_http.get.call_count == calls
+
+        # A fresh roster is reused (e.g. by the next meeting of a backfill)
+        assert client.prefetch_group_chairs().keys() == roster.keys()
+        assert mock_http.get.call_count == calls
+        client.prefetch_group_chairs(refresh=True)
+        assert mock_http.get.call_count > calls
+
+    def test_group_chairs_cached_until_ttl(self, mock_client):
+        """Test per-group chair lookups are cached and expire."""
+        client, mock_http = mock_client
+        mock_http.get.side_effect = _router({"/api/v1/group/role/": _page([])})
+
+        client.get_group_chairs("vcon")
+        client.get_group_chairs("vcon")
+        assert mock_http.get.call_count == 1
+
+        client.chairs_ttl = 0
+        client.get_group_chairs("vcon")
+        assert mock_http.get.call_count == 2
+
 
 class TestDataTrackerIntegration:
     """Integration tests requiring network access."""
@@ -0,0 +1,82 @@
+"""Unit tests for ietf2vcon.file_links module."""
+
+import json
+
+import pytest
+
+from ietf2vcon.file_links import atomic_write_json, link_file
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "mirror" / "slides-125-vcon-chairs-00.pdf"
+    path.parent.mkdir()
+    path.write_bytes(b"%PDF")
+    (tmp_path / "out").mkdir()
+    return path
+
+
+class TestLinkFile:
+    """Tests for placing existing files without copying."""
+
+    def test_auto_avoids_copy(self, source, tmp_path):
+        dest = tmp_path / "out" / source.name
+        method = link_file(source, dest)
+
+        assert method in ("reflink", "hardlink")
+        assert dest.read_bytes() == b"%PDF"
+        assert not list(dest.parent.glob(".*.tmp"))
+
+    def test_explicit_strategies(self, source, tmp_path):
+        out = tmp_path / "out"
+
+        assert link_file(source, out / "hard.pdf", "hardlink") == "hardlink"
+        assert (out / "hard.pdf").stat().st_ino == source.stat().st_ino
+
+        assert link_file(source, out / "sym.pdf", "symlink") == "symlink"
+        assert (out / "sym.pdf").is_symlink()
+
+        assert link_file(source, out / "copy.pdf", "copy") == "copy"
+        assert (out / "copy.pdf").stat().st_ino != source.stat().st_ino
+
+    def test_replaces_existing_file(self, source, tmp_path):
+        dest = tmp_path / "out" / source.name
+        dest.write_bytes(b"stale")
+
+        link_file(source, dest, "hardlink")
+        assert dest.read_bytes() == b"%PDF"
+
+    def test_falls_back_to_copy(self, source, tmp_path, monkeypatch):
+        """Test a failing link method falls through to a copy."""
+        monkeypatch.setattr("ietf2vcon.file_links.os.link", _raise_exdev)
+        assert link_file(source, tmp_path / "out" / "x.pdf", "hardlink") == "copy"
+
+    def test_unknown_strategy(self, source, tmp_path):
+        with pytest.raises(ValueError):
+            link_file(source, tmp_path / "out" / "x.pdf", "teleport")
+
+
+def _raise_exdev(*args):
+    raise OSError(18, "Invalid cross-device link")
+
+
+class TestAtomicWriteJson:
+    """Tests for replacing JSON files atomically."""
+
+    def test_replaces_file(self, tmp_path):
+        path = tmp_path / "state" / "ietf121.json"
+        atomic_write_json(path, {"pending": ["vcon"]})
+        atomic_write_json(path, {"pending": []})
+
+        assert json.loads(path.read_text()) == {"pending": []}
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        path = tmp_path / "ietf121.json"
+        atomic_write_json(path, {"pending": ["vcon"]})
+
+        with pytest.raises(TypeError):
+            atomic_write_json(path, {"pending": {object()}})
+
+        assert json.loads(path.read_text()) == {"pending": ["vcon"]}
+        assert list(tmp_path.iterdir()) == [path]
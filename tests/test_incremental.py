@@ -0,0 +1,30 @@
+"""Unit tests for ietf2vcon.incremental module."""
+
+from datetime import datetime, timedelta, timezone
+
+from ietf2vcon.incremental import RefreshStateStore
+
+
+class TestRefreshStateStore:
+    """Tests for per-meeting refresh state."""
+
+    def test_never_refreshed(self, tmp_path):
+        state = RefreshStateStore(tmp_path).load(121)
+        assert state.high_water is None
+        assert state.pending == []
+
+    def test_save_and_load(self, tmp_path):
+        """Test the high-water mark steps back by the overlap and failures are kept."""
+        store = RefreshStateStore(tmp_path, overlap=timedelta(minutes=5))
+        started = datetime(2024, 11, 4, 12, 0, tzinfo=timezone.utc)
+
+        store.save(121, started, pending=["vcon", "httpbis", "vcon"])
+        state = store.load(121)
+
+        assert state.high_water == datetime(2024, 11, 4, 11, 55, tzinfo=timezone.utc)
+        assert state.pending == ["httpbis", "vcon"]
+        assert store.load(122).high_water is None
+
+    def test_unreadable_state_is_ignored(self, tmp_path):
+        (tmp_path / "ietf121.json").write_text("{not json")
+        assert RefreshStateStore(tmp_path).load(121).high_water is None
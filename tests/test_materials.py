@@ -0,0 +1,251 @@
+"""Unit tests for ietf2vcon.materials module."""
+
+import hashlib
+import threading
+import time
+
+import httpx
+
+from ietf2vcon import materials
+from ietf2vcon.materials import MaterialsDownloader, hash_file
+from ietf2vcon.mirror_manifest import update_manifest
+from ietf2vcon.models import IETFMaterial
+
+
+def _slides(count: int, host: str = "datatracker.ietf.org") -> list[IETFMaterial]:
+    return [
+        IETFMaterial(
+            type="slides",
+            title=f"Deck {i}",
+            url=f"https://{host}/meeting/121/materials/slides-121-vcon-deck-{i}",
+            filename=f"slides-121-vcon-deck-{i}.pdf",
+            order=i,
+        )
+        for i in range(count)
+    ]
+
+
+class ConcurrencyProbe:
+    """MockTransport handler that records the peak number of requests in flight."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return httpx.Response(200, content=request.url.path.encode())
+
+
+class TestDownloadAllMaterials:
+    """Tests for concurrent material downloads."""
+
+    def test_concurrent_with_stable_keys(self, tmp_path):
+        """Test downloads overlap, stay under the per-host limit and keep their keys."""
+        probe = ConcurrencyProbe()
+        materials = _slides(8)
+        materials.append(
+            IETFMaterial(
+                type="agenda",
+                title="Agenda",
+                url="https://datatracker.ietf.org/meeting/121/materials/agenda-121-vcon",
+                filename="agenda-121-vcon.md",
+            )
+        )
+
+        with MaterialsDownloader(tmp_path, max_workers=8, per_host_limit=3) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(probe))
+            downloaded = downloader.download_all_materials(materials)
+
+        assert list(downloaded) == [f"slides_{i}" for i in range(8)] + ["agenda"]
+        assert downloaded["slides_5"].read_bytes().endswith(b"deck-5")
+        assert 1 < probe.peak <= 3
+
+    def test_serial_when_one_worker(self, tmp_path):
+        probe = ConcurrencyProbe(delay=0.01)
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(probe))
+            downloaded = downloader.download_all_materials(_slides(3), max_workers=1)
+
+        assert len(downloaded) == 3
+        assert probe.peak == 1
+
+    def test_contents_in_order(self, tmp_path):
+        probe = ConcurrencyProbe(delay=0.01)
+        materials = _slides(4)
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(probe))
+            contents = downloader.get_all_material_contents(materials)
+
+        assert [c.decode().rsplit("-", 1)[-1] for c in contents] == ["0", "1", "2", "3"]
+
+
+class TestStreamingDownload:
+    """Tests for streamed downloads with digests computed in the same pass."""
+
+    def test_digests_returned_with_path(self, tmp_path):
+        body = b"%PDF-1.7 " + b"x" * (3 * 1024 * 1024)
+
+        def handler(request):
+            return httpx.Response(200, content=body)
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+            result = downloader.download(_slides(1)[0])
+
+        assert result.path.read_bytes() == body
+        assert result.size == len(body)
+        assert result.sha256 == hashlib.sha256(body).hexdigest()
+        assert result.sha512 == hashlib.sha512(body).hexdigest()
+        assert hash_file(result.path) == result
+
+    def test_failed_stream_leaves_no_file(self, tmp_path):
+        """Test an interrupted body leaves neither the target nor a temp file."""
+
+        class BrokenStream(httpx.SyncByteStream):
+            def __iter__(self):
+                yield b"partial"
+                raise httpx.ReadError("connection reset")
+
+        def handler(request):
+            return httpx.Response(200, stream=BrokenStream())
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+            assert downloader.download_material(_slides(1)[0]) is None
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class RangeServer:
+    """MockTransport handler serving one body with an ETag and Range support.
+
+    The first ``fail_first`` responses are cut off after ``cut`` bytes.
+    """
+
+    def __init__(self, body: bytes, etag: str = '"v1"', cut: int = 0, fail_first: int = 0):
+        self.body = body
+        self.etag = etag
+        self.cut = cut
+        self.fail_first = fail_first
+        self.ranges: list[str | None] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        range_header = request.headers.get("range")
+        self.ranges.append(range_header)
+        headers = {"etag": self.etag}
+
+        body, status = self.body, 200
+        if range_header and request.headers.get("if-range") == self.etag:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            body, status = self.body[start:], 206
+            headers["content-range"] = f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+
+        if self.fail_first:
+            self.fail_first -= 1
+            cut = self.cut
+
+            class CutStream(httpx.SyncByteStream):
+                def __iter__(self):
+                    yield body[:cut]
+                    raise httpx.ReadError("connection reset")
+
+            return httpx.Response(status, headers=headers, stream=CutStream())
+        return httpx.Response(status, headers=headers, content=body)
+
+
+class TestResumeDownload:
+    """Tests for resuming partial downloads with Range requests."""
+
+    def test_resumes_after_interruption(self, tmp_path):
+        body = bytes(range(256)) * 1000
+        server = RangeServer(body, cut=100_000, fail_first=1)
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(server))
+            result = downloader.download(_slides(1)[0])
+
+        assert server.ranges == [None, "bytes=100000-"]
+        assert result.path.read_bytes() == body
+        assert result.sha256 == hashlib.sha256(body).hexdigest()
+        assert not list(tmp_path.glob(".*.part*"))
+
+    def test_same_url_downloads_take_turns(self, tmp_path):
+        """Test concurrent downloads of one URL never share the partial file."""
+        probe = ConcurrencyProbe()
+        deck = _slides(1)[0]
+
+        with MaterialsDownloader(tmp_path, max_workers=4) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(probe))
+            paths = downloader.download_all_materials([deck] * 4)
+
+        assert probe.peak == 1
+        assert paths["slides_0"].read_bytes() == b"/meeting/121/materials/slides-121-vcon-deck-0"
+
+    def test_changed_resource_downloaded_in_full(self, tmp_path):
+        """Test a partial copy of an older version is replaced, not appended to."""
+        old = RangeServer(b"a" * 5000, etag='"v1"', cut=2000, fail_first=5)
+        new = RangeServer(b"b" * 6000, etag='"v2"')
+        material = _slides(1)[0]
+
+        with MaterialsDownloader(tmp_path) as downloader:
+            downloader.client = httpx.Client(transport=httpx.MockTransport(old))
+            assert downloader.download(material) is None
+            assert list(tmp_path.glob(".*.part"))
+
+            downloader.client = httpx.Client(transport=httpx.MockTransport(new))
+            result = downloader.download(material)
+
+        # The resume was attempted, but If-Range no longer matched
+        assert len(new.ranges) == 1 and new.ranges[0].startswith("bytes=")
+        assert result.path.read_bytes() == b"b" * 6000
+
+
+class TestMirrorHits:
+    """Tests for serving materials from the rsync mirror."""
+
+    def test_mirror_hit_is_linked(self, tmp_path):
+        slides = tmp_path / "mirror" / "proceedings" / "121" / "slides"
+        slides.mkdir(parents=True)
+        source = slides / "slides-121-vcon-deck-0.pdf"
+        source.write_bytes(b"%PDF mirror")
+
+        with MaterialsDownloader(
+            tmp_path / "out", mirror_dir=tmp_path / "mirror", link_strategy="hardlink"
+        ) as downloader:
+            downloader.client = httpx.Client(
+                transport=httpx.MockTransport(lambda r: httpx.Response(500))
+            )
+            result = downloader.download(_slides(1)[0])
+
+        assert result.path == tmp_path / "out" / source.name
+        assert result.path.stat().st_ino == source.stat().st_ino
+        assert result.sha256 == hashlib.sha256(b"%PDF mirror").hexdigest()
+
+    def test_manifest_digests_used(self, tmp_path, monkeypatch):
+        """Test mirror hits take their digests from the manifest without re-reading."""
+        slides = tmp_path / "mirror" / "proceedings" / "121" / "slides"
+        slides.mkdir(parents=True)
+        (slides / "slides-121-vcon-deck-0.pdf").write_bytes(b"%PDF mirror")
+        update_manifest(121, tmp_path / "mirror")
+
+        def no_hashing(path):
+            raise AssertionError(f"{path} was hashed again")
+
+        monkeypatch.setattr(materials, "hash_file", no_hashing)
+        deck = _slides(1)[0]
+        with MaterialsDownloader(tmp_path / "out", mirror_dir=tmp_path / "mirror") as downloader:
+            result = downloader.download(deck)
+            assert downloader.get_material_content(deck) == b"%PDF mirror"
+            assert downloader.known_sha256(deck.url) == result.sha256
+
+        assert result.sha256 == hashlib.sha256(b"%PDF mirror").hexdigest()
@@ -0,0 +1,116 @@
+"""Unit tests for ietf2vcon.negative_cache module."""
+
+import time
+from unittest.mock import patch
+
+import httpx
+
+from ietf2vcon.converter import ConversionOptions, IETFSessionConverter
+from ietf2vcon.materials import MaterialsDownloader
+from ietf2vcon.models import IETFMaterial, IETFSession
+from ietf2vcon.negative_cache import MATERIAL, YOUTUBE_CAPTIONS, ZULIP_STREAM, NegativeCache
+from ietf2vcon.youtube import NoCaptionsError
+
+
+class TestNegativeCache:
+    """Tests for the known-missing probe cache."""
+
+    def test_mark_and_check(self, tmp_path):
+        """Test absences persist across instances and are keyed by kind."""
+        with NegativeCache(tmp_path / "missing.sqlite") as cache:
+            assert not cache.is_absent(ZULIP_STREAM, "vcon")
+            cache.mark_absent(ZULIP_STREAM, "vcon", reason="HTTP 404")
+
+        with NegativeCache(tmp_path / "missing.sqlite") as cache:
+            assert cache.is_absent(ZULIP_STREAM, "vcon")
+            assert not cache.is_absent(MATERIAL, "vcon")
+            assert cache.skipped == 1
+
+    def test_expiry(self, tmp_path):
+        """Test entries older than the TTL are probed again and pruned."""
+        with NegativeCache(tmp_path / "missing.sqlite", ttl=60.0) as cache:
+            cache.mark_absent(ZULIP_STREAM, "vcon")
+            cache._conn.execute("UPDATE absent SET checked_at = ?", (time.time() - 120,))
+
+            assert not cache.is_absent(ZULIP_STREAM, "vcon")
+            assert cache.prune() == 1
+
+    def test_captions_expire_sooner(self, tmp_path):
+        """Test a caption absence is probed again within hours, a Zulip 404 is not."""
+        with NegativeCache(tmp_path / "missing.sqlite") as cache:
+            cache.mark_absent(YOUTUBE_CAPTIONS, "https://youtu.be/x")
+            cache.mark_absent(ZULIP_STREAM, "vcon")
+            cache._conn.execute("UPDATE absent SET checked_at = ?", (time.time() - 7200 * 4,))
+
+            assert not cache.is_absent(YOUTUBE_CAPTIONS, "https://youtu.be/x")
+            assert cache.is_absent(ZULIP_STREAM, "vcon")
+            assert cache.prune() == 1
+            assert cache.ttl_for(YOUTUBE_CAPTIONS) < cache.ttl_for(ZULIP_STREAM)
+
+    def test_recheck_ignores_entries(self, tmp_path):
+        """Test a forced recheck probes again and a success clears the entry."""
+        path = tmp_path / "missing.sqlite"
+        with NegativeCache(path) as cache:
+            cache.mark_absent(ZULIP_STREAM, "vcon")
+
+        with NegativeCache(path, recheck=True) as cache:
+            assert not cache.is_absent(ZULIP_STREAM, "vcon")
+            cache.mark_present(ZULIP_STREAM, "vcon")
+
+        with NegativeCache(path) as cache:
+            assert not cache.is_absent(ZULIP_STREAM, "vcon")
+
+
+class TestMaterialsNegativeCache:
+    """Tests for skipping material URLs that returned 404."""
+
+    def test_missing_notes_page_not_refetched(self, tmp_path):
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(404)
+
+        notes = IETFMaterial(
+            type="minutes",
+            title="VCON Notes",
+            url="https://notes.ietf.org/notes-ietf-121-vcon",
+        )
+
+        with NegativeCache(tmp_path / "missing.sqlite") as cache:
+            for _ in range(2):
+                with MaterialsDownloader(
+                    download_dir=tmp_path / "materials", negative_cache=cache
+                ) as downloader:
+                    downloader.client = httpx.Client(transport=httpx.MockTransport(handler))
+                    assert downloader.get_material_content(notes) is None
+                    assert downloader.download_material(notes) is None
+
+            assert len(requests) == 1
+            assert cache.is_absent(MATERIAL, notes.url)
+
+
+class TestCaptionsNegativeCache:
+    """Tests for recording only definitive caption misses."""
+
+    VIDEO = "https://www.youtube.com/watch?v=DfNKgMvbn1o"
+
+    def _try_captions(self, tmp_path, outcome):
+        converter = IETFSessionConverter(ConversionOptions(output_dir=tmp_path))
+        session = IETFSession(meeting_number=121, group_acronym="vcon", session_id="vcon-121")
+        with patch("ietf2vcon.converter.YouTubeResolver") as resolver:
+            if isinstance(outcome, Exception):
+                resolver.return_value.download_captions.side_effect = outcome
+            else:
+                resolver.return_value.download_captions.return_value = outcome
+            assert converter._try_youtube_captions(session, self.VIDEO) is None
+        return converter.get_negative_cache()
+
+    def test_no_caption_track_recorded(self, tmp_path):
+        cache = self._try_captions(tmp_path, NoCaptionsError("no en captions"))
+        assert cache.is_absent(YOUTUBE_CAPTIONS, self.VIDEO)
+
+    def test_failed_download_not_recorded(self, tmp_path):
+        """Test a timeout or throttled request (None) is retried next run."""
+        cache = self._try_captions(tmp_path, None)
+        assert not cache.is_absent(YOUTUBE_CAPTIONS, self.VIDEO)
@@ -0,0 +1,115 @@
+"""Unit tests for ietf2vcon.ratelimit module."""
+
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from ietf2vcon.ratelimit import (
+    HostRateLimiter,
+    get_rate_limiter,
+    parse_retry_after,
+    rate_limit_hooks,
+    reset_rate_limiters,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    """Give each test its own process-wide limiter state."""
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self):
+        value = parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+        assert 25 <= value <= 31
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestHostRateLimiter:
+    """Tests for the adaptive token bucket."""
+
+    def test_burst_then_paced(self):
+        """Test requests beyond the burst wait for tokens to refill."""
+        limiter = HostRateLimiter(rate=20.0, burst=2)
+
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Two from the bucket, two more at 20/s
+        assert 0.08 <= elapsed < 0.5
+
+    def test_retry_after_blocks_host(self):
+        """Test a 429 with Retry-After pauses every caller."""
+        limiter = HostRateLimiter(rate=100.0)
+        limiter.on_response(429, retry_after=0.2)
+
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.15
+
+    def test_aimd(self):
+        """Test throttling halves the rate once per episode and successes restore it."""
+        limiter = HostRateLimiter(rate=8.0, increase=1.0)
+
+        limiter.on_response(429)
+        limiter.on_response(429)  # same episode, not compounded
+        assert limiter.rate == 4.0
+
+        for _ in range(10):
+            limiter.on_response(200)
+        assert limiter.rate == 8.0
+
+    def test_rate_floor(self):
+        """Test the rate never drops below min_rate."""
+        limiter = HostRateLimiter(rate=1.0, min_rate=0.5)
+        limiter._last_decrease = -10.0
+        limiter.on_response(503)
+        limiter._last_decrease = -10.0
+        limiter.on_response(503)
+        assert limiter.rate == 0.5
+
+
+class TestRateLimitHooks:
+    """Tests for the httpx event hooks."""
+
+    def test_clients_share_host_limiter(self):
+        """Test a throttled response slows every client talking to that host."""
+
+        def handler(request):
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+
+        throttled = httpx.Client(
+            transport=httpx.MockTransport(handler), event_hooks=rate_limit_hooks()
+        )
+        other = httpx.Client(
+            transport=httpx.MockTransport(lambda r: httpx.Response(200)),
+            event_hooks=rate_limit_hooks(),
+        )
+
+        throttled.get("https://datatracker.example/api/")
+        limiter = get_rate_limiter("datatracker.example")
+        assert limiter.rate < limiter.max_rate
+
+        start = time.monotonic()
+        other.get("https://datatracker.example/api/")
+        assert time.monotonic() - start >= 0.15
+
+        # Other hosts are unaffected
+        start = time.monotonic()
+        other.get("https://zulip.example/api/")
+        assert time.monotonic() - start < 0.1
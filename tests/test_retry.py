@@ -0,0 +1,99 @@
+"""Unit tests for ietf2vcon.retry module."""
+
+import httpx
+import pytest
+
+from ietf2vcon.retry import RetryBudget, http_retry, is_transient
+
+
+def _status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://datatracker.ietf.org/api/v1/")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+class Flaky:
+    """Callable that raises the given errors in turn, then returns "ok"."""
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestIsTransient:
+    """Tests for transient failure classification."""
+
+    def test_transient(self):
+        assert is_transient(_status_error(503))
+        assert is_transient(_status_error(429))
+        assert is_transient(httpx.ConnectError("refused"))
+
+    def test_not_transient(self):
+        assert not is_transient(_status_error(404))
+        assert not is_transient(_status_error(403))
+        assert not is_transient(ValueError("bad json"))
+
+
+class TestHttpRetry:
+    """Tests for the http_retry decorator."""
+
+    def test_retries_transient_then_succeeds(self):
+        """Test a 5xx is retried and backoff time is recorded."""
+        budget = RetryBudget()
+        fn = Flaky(_status_error(502), httpx.ConnectError("refused"))
+
+        assert http_retry(budget=budget, max_wait=0.01)(fn)() == "ok"
+        assert fn.calls == 3
+        assert budget.retries == 2
+        assert budget.backoff_seconds >= 0
+
+    def test_client_error_fails_fast(self):
+        """Test a 404 is raised immediately without retries."""
+        budget = RetryBudget()
+        fn = Flaky(_status_error(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            http_retry(budget=budget, max_wait=0.01)(fn)()
+        assert fn.calls == 1
+        assert budget.retries == 0
+
+    def test_retry_after_extends_wait(self):
+        """Test the server's Retry-After is honored when longer than the backoff."""
+        budget = RetryBudget()
+        fn = Flaky(_status_error(429, {"Retry-After": "0.2"}))
+
+        http_retry(budget=budget, max_wait=0.01)(fn)()
+        assert budget.backoff_seconds >= 0.2
+
+    def test_budget_exhausted_stops_retrying(self):
+        """Test no retries happen once the run's budget is spent."""
+        budget = RetryBudget(max_retries=1)
+        first = Flaky(_status_error(503))
+        second = Flaky(_status_error(503))
+
+        http_retry(budget=budget, max_wait=0.01)(first)()
+        with pytest.raises(httpx.HTTPStatusError):
+            http_retry(budget=budget, max_wait=0.01)(second)()
+
+        assert second.calls == 1
+        assert budget.exhausted == 1
+        assert "budget exhausted" in budget.summary()
+
+    @pytest.mark.asyncio
+    async def test_async_functions(self):
+        """Test coroutines are retried too."""
+        budget = RetryBudget()
+        fn = Flaky(_status_error(500))
+
+        @http_retry(budget=budget, max_wait=0.01)
+        async def call():
+            return fn()
+
+        assert await call() == "ok"
+        assert fn.calls == 2
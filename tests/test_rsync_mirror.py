@@ -0,0 +1,179 @@
+"""Unit tests for ietf2vcon.rsync_mirror module."""
+
+import hashlib
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from ietf2vcon import rsync_mirror
+from ietf2vcon.mirror_manifest import load_manifest, update_manifest
+from ietf2vcon.rsync_mirror import (
+    MirrorIndex,
+    find_local_entry,
+    find_local_file,
+    get_mirror_index,
+    rsync_filters,
+    sync_meetings,
+)
+
+RSYNC_STATS = """
+Number of files: 412 (reg: 398, dir: 14)
+Number of created files: 12 (reg: 12)
+Number of regular files transferred: 12
+Total file size: 98,765,432 bytes
+Total bytes sent: 1,234
+Total bytes received: 4,567,890
+"""
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """A small proceedings mirror for IETF 125."""
+    meeting = tmp_path / "proceedings" / "125"
+    (meeting / "slides").mkdir(parents=True)
+    (meeting / "agenda").mkdir()
+    for name in [
+        "slides-125-6lo-intro-00.pdf",
+        "slides-125-6lo-intro-01.pptx",
+        "slides-125-6lo-intro-01.pdf",
+        "slides-125-vcon-chairs.pdf",
+    ]:
+        (meeting / "slides" / name).write_bytes(b"x")
+    (meeting / "agenda" / "agenda-125-vcon-00.md").write_text("# Agenda")
+    return tmp_path
+
+
+class TestMirrorIndex:
+    """Tests for indexed mirror lookups."""
+
+    def test_lookup_by_name(self, mirror):
+        index = MirrorIndex()
+        slides = mirror / "proceedings" / "125" / "slides"
+
+        exact = index.lookup("slides-125-6lo-intro-00", 125, mirror)
+        assert exact == slides / "slides-125-6lo-intro-00.pdf"
+        unversioned = index.lookup("slides-125-vcon-chairs", 125, mirror)
+        assert unversioned == slides / "slides-125-vcon-chairs.pdf"
+        assert index.lookup("agenda-125-vcon", 125, mirror).name == "agenda-125-vcon-00.md"
+        assert index.lookup("slides-125-nope", 125, mirror) is None
+        assert index.lookup("slides-125-vcon-chairs", 126, mirror) is None
+        assert index.builds == 1
+
+    def test_without_revision_finds_latest(self, mirror):
+        """Test a revision-less name resolves to the newest revision, preferring PDF."""
+        path = MirrorIndex().lookup("slides-125-6lo-intro", 125, mirror)
+        assert path.name == "slides-125-6lo-intro-01.pdf"
+
+    def test_rebuilt_when_directory_changes(self, mirror):
+        index = MirrorIndex(check_interval=0)
+        slides = mirror / "proceedings" / "125" / "slides"
+        assert index.lookup("slides-125-6lo-intro-02", 125, mirror) is None
+
+        (slides / "slides-125-6lo-intro-02.pdf").write_bytes(b"x")
+        # Ensure the directory mtime differs even on coarse-grained filesystems
+        stat = os.stat(slides)
+        os.utime(slides, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert index.lookup("slides-125-6lo-intro-02", 125, mirror).exists()
+        assert index.builds == 2
+
+    def test_find_local_file_uses_shared_index(self, mirror):
+        get_mirror_index().clear()
+        assert find_local_file("slides-125-vcon-chairs", 125, mirror)
+        assert find_local_file("agenda-125-vcon-00", 125, mirror)
+        assert get_mirror_index()._indexes
+
+
+class TestManifest:
+    """Tests for per-meeting mirror manifests."""
+
+    def test_only_changed_files_rehashed(self, mirror):
+        """Test a second update reuses digests of unchanged files."""
+        manifest, hashed = update_manifest(125, mirror)
+        assert hashed == 5
+        assert manifest.files["agenda/agenda-125-vcon-00.md"].sha256 == (
+            hashlib.sha256(b"# Agenda").hexdigest()
+        )
+
+        agenda = mirror / "proceedings" / "125" / "agenda" / "agenda-125-vcon-00.md"
+        agenda.write_text("# Agenda v2")
+        _, hashed = update_manifest(125, mirror)
+        assert hashed == 1
+        assert load_manifest(125, mirror).files["agenda/agenda-125-vcon-00.md"].sha256 == (
+            hashlib.sha256(b"# Agenda v2").hexdigest()
+        )
+
+    def test_lookup_returns_manifest_entry(self, mirror):
+        """Test entries are returned only while the file is unchanged."""
+        update_manifest(125, mirror)
+        index = MirrorIndex(check_interval=0)
+
+        path, entry = index.lookup_entry("agenda-125-vcon", 125, mirror)
+        assert entry.sha256 == hashlib.sha256(b"# Agenda").hexdigest()
+
+        path.write_text("# Edited locally")
+        os.utime(path, ns=(1, 1))
+        assert index.lookup_entry("agenda-125-vcon", 125, mirror)[1] is None
+
+    def test_without_manifest(self, mirror):
+        get_mirror_index().clear()
+        path, entry = find_local_entry("slides-125-vcon-chairs", 125, mirror)
+        assert path.name == "slides-125-vcon-chairs.pdf"
+        assert entry is None
+
+
+class TestSync:
+    """Tests for multi-meeting rsync runs."""
+
+    def test_filters(self):
+        """Test include rules for material types and groups."""
+        assert rsync_filters(125) == []
+        assert rsync_filters(125, ["slides"]) == [
+            "--include=/slides/",
+            "--include=/slides/**",
+            "--exclude=*",
+        ]
+
+        rules = rsync_filters(125, ["minutes"], ["vcon"])
+        assert "--include=/minutes/minutes-125-vcon-*" in rules
+        assert "--include=/minutes/minutes-125-vcon.*" in rules
+        assert rules[-1] == "--exclude=*"
+        assert not any(r.startswith("--include=/slides/") for r in rules)
+
+    def test_sync_meetings_bounded_and_measured(self, tmp_path, monkeypatch):
+        """Test meetings run concurrently up to the limit and report stats."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            nonlocal active, peak
+            with lock:
+                commands.append(cmd)
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            if "rsync.ietf.org::proceedings/120/" in cmd:
+                return subprocess.CompletedProcess(cmd, 23, "", "rsync error: some files\n")
+            return subprocess.CompletedProcess(cmd, 0, RSYNC_STATS, "")
+
+        monkeypatch.setattr(rsync_mirror.subprocess, "run", fake_run)
+
+        results = sync_meetings(
+            [118, 119, 120, 121], tmp_path, parallel=2, material_types=["slides"]
+        )
+
+        assert [r.meeting_number for r in results] == [118, 119, 120, 121]
+        assert peak == 2
+        assert all("--include=/slides/" in cmd for cmd in commands)
+        assert results[0].ok
+        assert results[0].bytes_received == 4567890
+        assert results[0].files_transferred == 12
+        assert not results[2].ok
+        assert results[2].error == "rsync error: some files"
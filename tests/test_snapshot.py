@@ -0,0 +1,214 @@
+"""Unit tests for ietf2vcon.snapshot module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ietf2vcon.datatracker import DataTrackerClient
+from ietf2vcon.http_cache import CacheMissError
+from ietf2vcon.snapshot import MeetingSnapshot, create_snapshot
+
+
+def _page(objects: list[dict]) -> dict:
+    """Wrap objects in a single-page Tastypie list response."""
+    return {
+        "meta": {"limit": 100, "next": None, "offset": 0, "total_count": len(objects)},
+        "objects": objects,
+    }
+
+
+@pytest.fixture
+def meeting_resources(
+    datatracker_meeting_response,
+    datatracker_sessions_response,
+    datatracker_materials_response,
+    datatracker_document_agenda_response,
+    datatracker_document_recording_response,
+):
+    """Datatracker resources for the IETF 121 vcon session, keyed by list endpoint."""
+    return {
+        "/api/v1/meeting/meeting/": datatracker_meeting_response["objects"],
+        "/api/v1/meeting/session/": datatracker_sessions_response["objects"],
+        "/api/v1/meeting/schedtimesessassignment/": [
+            {
+                "resource_uri": "/api/v1/meeting/schedtimesessassignment/1/",
+                "schedule": "/api/v1/meeting/schedule/2793/",
+                "session": "/api/v1/meeting/session/33406/",
+                "timeslot": "/api/v1/meeting/timeslot/18330/",
+            }
+        ],
+        "/api/v1/meeting/timeslot/": [
+            {
+                "resource_uri": "/api/v1/meeting/timeslot/18330/",
+                "meeting": "/api/v1/meeting/meeting/2793/",
+                "time": "2024-11-07T15:30:00Z",
+                "duration": "01:00:00",
+                "location": "/api/v1/meeting/room/42/",
+            }
+        ],
+        "/api/v1/meeting/room/": [
+            {
+                "resource_uri": "/api/v1/meeting/room/42/",
+                "meeting": "/api/v1/meeting/meeting/2793/",
+                "name": "Liffey A",
+            }
+        ],
+        "/api/v1/group/group/": [
+            {
+                "id": 2383,
+                "resource_uri": "/api/v1/group/group/2383/",
+                "acronym": "vcon",
+                "name": "Virtualized Conversations",
+            }
+        ],
+        "/api/v1/group/role/": [
+            {
+                "id": 1,
+                "resource_uri": "/api/v1/group/role/1/",
+                "group": "/api/v1/group/group/2383/",
+                "name": "/api/v1/name/rolename/chair/",
+                "person": "/api/v1/person/person/105/",
+                "email": "/api/v1/person/email/br@brianrosen.net/",
+            },
+            {
+                "id": 2,
+                "resource_uri": "/api/v1/group/role/2/",
+                "group": "/api/v1/group/group/2383/",
+                "name": "/api/v1/name/rolename/ad/",
+                "person": "/api/v1/person/person/106/",
+                "email": None,
+            },
+        ],
+        "/api/v1/person/person/": [
+            {"id": 105, "resource_uri": "/api/v1/person/person/105/", "name": "Brian Rosen"},
+            {"id": 106, "resource_uri": "/api/v1/person/person/106/", "name": "Area Director"},
+        ],
+        "/api/v1/person/email/": [
+            {
+                "address": "br@brianrosen.net",
+                "resource_uri": "/api/v1/person/email/br@brianrosen.net/",
+            }
+        ],
+        "/api/v1/meeting/sessionpresentation/": datatracker_materials_response["objects"],
+        "/api/v1/doc/document/": [
+            datatracker_document_agenda_response,
+            {
+                "name": "slides-121-vcon-chair-slides",
+                "resource_uri": "/api/v1/doc/document/slides-121-vcon-chair-slides/",
+                "title": "Chair Slides",
+                "type": "/api/v1/name/doctypename/slides/",
+            },
+            datatracker_document_recording_response,
+        ],
+    }
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, meeting_resources):
+    """A snapshot file holding the meeting resources."""
+    path = tmp_path / "ietf121.sqlite"
+    with MeetingSnapshot(path, readonly=False) as snapshot:
+        for objects in meeting_resources.values():
+            snapshot.add(objects)
+    return path
+
+
+@pytest.fixture
+def mock_http():
+    """Patch httpx.Client so any network access is visible."""
+    with patch("ietf2vcon.datatracker.httpx.Client") as mock_httpx:
+        yield mock_httpx.return_value
+
+
+class TestMeetingSnapshot:
+    """Tests for MeetingSnapshot queries."""
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test opening a snapshot that does not exist."""
+        with pytest.raises(FileNotFoundError):
+            MeetingSnapshot(tmp_path / "missing.sqlite")
+
+    def test_query_follows_relations(self, snapshot_path):
+        """Test filters that traverse resource URIs between collections."""
+        with MeetingSnapshot(snapshot_path) as snapshot:
+            data = snapshot.query(
+                "/api/v1/meeting/sessionpresentation/",
+                {"session__meeting__number": 121, "session__group__acronym": "vcon"},
+            )
+            assert data["meta"]["total_count"] == 3
+
+            data = snapshot.query(
+                "/api/v1/meeting/sessionpresentation/",
+                {"session__meeting__number": 121, "session__group__acronym": "quic"},
+            )
+            assert data["objects"] == []
+
+    def test_query_in_and_uncaptured_relations(self, snapshot_path):
+        """Test __in lookups and relations compared by primary key."""
+        with MeetingSnapshot(snapshot_path) as snapshot:
+            docs = snapshot.query(
+                "/api/v1/doc/document/",
+                {"name__in": "agenda-121-vcon,recording-121-vcon-1"},
+            )
+            roles = snapshot.query(
+                "/api/v1/group/role/",
+                {"group__acronym": "vcon", "name__slug": "chair"},
+            )
+            assignments = snapshot.query(
+                "/api/v1/meeting/schedtimesessassignment/", {"schedule": "2793"}
+            )
+
+        assert [d["name"] for d in docs["objects"]] == [
+            "agenda-121-vcon",
+            "recording-121-vcon-1",
+        ]
+        assert [r["id"] for r in roles["objects"]] == [1]
+        assert len(assignments["objects"]) == 1
+
+    def test_uncaptured_endpoint_raises(self, snapshot_path):
+        """Test queries outside the snapshot raise CacheMissError."""
+        with MeetingSnapshot(snapshot_path) as snapshot:
+            with pytest.raises(CacheMissError):
+                snapshot.query("/api/v1/doc/state/")
+            with pytest.raises(CacheMissError):
+                snapshot.query("/api/v1/group/group/9999/")
+
+
+class TestSnapshotClient:
+    """Tests for DataTrackerClient in snapshot mode."""
+
+    def test_client_answers_from_snapshot(self, snapshot_path, mock_http):
+        """Test a full session lookup makes no HTTP requests."""
+        with MeetingSnapshot(snapshot_path) as snapshot:
+            client = DataTrackerClient(snapshot=snapshot)
+
+            meeting = client.get_meeting(121)
+            sessions = client.get_group_sessions(121, "vcon")
+            materials = client.get_session_materials(121, "vcon")
+            chairs = client.get_group_chairs("vcon")
+
+        assert meeting.city == "Dublin"
+        assert sessions[0].room == "Liffey A"
+        assert sessions[0].duration_seconds == 3600
+        assert [m.type for m in materials[:3]] == ["agenda", "slides", "recording"]
+        assert [(c.name, c.email) for c in chairs] == [("Brian Rosen", "br@brianrosen.net")]
+        mock_http.get.assert_not_called()
+
+    def test_create_snapshot(self, tmp_path, meeting_resources, mock_http):
+        """Test create_snapshot stores every collection a conversion needs."""
+
+        def get(url, params=None, **kwargs):
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = _page(meeting_resources[url])
+            return response
+
+        mock_http.get.side_effect = get
+        path = tmp_path / "ietf121.sqlite"
+
+        counts = create_snapshot(DataTrackerClient(), 121, path)
+
+        assert counts == {url: len(objects) for url, objects in meeting_resources.items()}
+        with MeetingSnapshot(path) as snapshot:
+            assert snapshot.info()["meeting"] == "121"
+            assert snapshot.get("/api/v1/group/group/2383/")["acronym"] == "vcon"
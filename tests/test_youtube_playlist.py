@@ -0,0 +1,119 @@
+"""Unit tests for ietf2vcon.youtube_playlist module."""
+
+import subprocess
+
+import pytest
+
+from ietf2vcon import youtube_playlist
+from ietf2vcon.youtube import YouTubeResolver
+from ietf2vcon.youtube_playlist import MeetingPlaylist, PlaylistIndex, parse_flat_playlist
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLietf121"
+
+FLAT_PLAYLIST = "\n".join(
+    [
+        "vid_vcon_01\t5400\tNA\tIETF121-VCON-20241107-0930",
+        "vid_http_01\t7200.0\tNA\tIETF121-HTTPBIS-20241105-1300",
+        "vid_http_02\t3600\tNA\tIETF121-HTTPBIS-20241105-0930",
+        "vid_old_001\t3600\tNA\tIETF120-VCON-20240725-1300",
+        "vid_plenary\tNA\t20241106\tIETF 121 Plenary",
+    ]
+)
+
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch):
+    """Answer yt-dlp playlist listings with FLAT_PLAYLIST, counting calls."""
+    calls = []
+
+    def run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, FLAT_PLAYLIST, "")
+
+    monkeypatch.setattr(youtube_playlist.subprocess, "run", run)
+    monkeypatch.setattr(youtube_playlist, "get_ytdlp", lambda: None)
+    return calls
+
+
+class TestMeetingPlaylist:
+    """Tests for the (group, date) index of a meeting's videos."""
+
+    def test_parse_flat_playlist(self):
+        videos = parse_flat_playlist(FLAT_PLAYLIST)
+        assert len(videos) == 5
+        assert videos[1].duration_seconds == 7200
+        assert videos[4].duration_seconds is None
+        assert videos[0].upload_date is None
+        assert videos[0].url == "https://www.youtube.com/watch?v=vid_vcon_01"
+
+    def test_find_by_group_and_date(self):
+        playlist = MeetingPlaylist.from_videos(121, parse_flat_playlist(FLAT_PLAYLIST))
+
+        assert playlist.find("vcon", "2024-11-07").video_id == "vid_vcon_01"
+        assert playlist.find("VCON").video_id == "vid_vcon_01"
+        # Two sessions on one day: the earlier one comes first
+        assert playlist.find("httpbis", "2024-11-05").video_id == "vid_http_02"
+        assert playlist.find("vcon", "2024-11-10") is None
+        assert playlist.find("plenary").video_id == "vid_plenary"
+        # Other meetings' videos are not indexed
+        assert len(playlist) == 4
+
+    def test_find_neighbouring_day_and_start_time(self):
+        """Test a date off by one still matches, and the start time picks the session."""
+        playlist = MeetingPlaylist.from_videos(121, parse_flat_playlist(FLAT_PLAYLIST))
+
+        assert playlist.find("vcon", "2024-11-06").video_id == "vid_vcon_01"
+        assert playlist.find("vcon", "2024-11-08", "0930").video_id == "vid_vcon_01"
+        assert playlist.find("httpbis", "2024-11-05", "1300").video_id == "vid_http_01"
+        assert playlist.find("httpbis", "2024-11-06", "0930").video_id == "vid_http_02"
+        assert playlist.find("vcon", "2024-11-09") is None
+
+
+class TestPlaylistIndex:
+    """Tests for listing and caching meeting playlists."""
+
+    def test_listed_once_and_cached(self, tmp_path, fake_yt_dlp):
+        """Test the playlist is listed once per process and reused from disk."""
+        index = PlaylistIndex(tmp_path)
+        assert index.get(121, PLAYLIST_URL).find("vcon").video_id == "vid_vcon_01"
+        assert index.get(121, PLAYLIST_URL) is index.get(121, PLAYLIST_URL)
+        assert "--flat-playlist" in fake_yt_dlp[0]
+
+        assert PlaylistIndex(tmp_path).get(121, PLAYLIST_URL) is not None
+        assert len(fake_yt_dlp) == 1
+
+    def test_expired_cache_refetched(self, tmp_path, fake_yt_dlp):
+        PlaylistIndex(tmp_path).get(121, PLAYLIST_URL)
+        PlaylistIndex(tmp_path, ttl=0).get(121, PLAYLIST_URL)
+        assert len(fake_yt_dlp) == 2
+
+    def test_playlist_without_meeting_videos(self, tmp_path, fake_yt_dlp):
+        assert PlaylistIndex(tmp_path).get(119, PLAYLIST_URL) is None
+
+
+class TestResolverUsesPlaylist:
+    """Tests for session lookups answered from the playlist index."""
+
+    def test_no_search_per_session(self, tmp_path, fake_yt_dlp):
+        resolver = YouTubeResolver(tmp_path / "videos", playlist_index=PlaylistIndex(tmp_path))
+
+        for group, date in [("vcon", "2024-11-07"), ("httpbis", "2024-11-05"), ("vcon", None)]:
+            resolver.search_session_video(121, group, date, playlist_url=PLAYLIST_URL)
+
+        assert len(fake_yt_dlp) == 1
+        video = resolver.search_session_video(
+            121, "vcon", "2024-11-07", playlist_url=PLAYLIST_URL
+        )
+        assert video.video_id == "vid_vcon_01"
+
+    def test_search_when_not_in_playlist(self, tmp_path, fake_yt_dlp):
+        """Test a session missing from the playlist is searched for on YouTube."""
+        resolver = YouTubeResolver(
+            tmp_path / "videos", playlist_index=PlaylistIndex(tmp_path), use_subprocess=True
+        )
+
+        assert resolver.search_session_video(
+            121, "quic", "2024-11-07", playlist_url=PLAYLIST_URL
+        ) is None
+        assert len(fake_yt_dlp) == 2
+        assert fake_yt_dlp[1][-1].startswith("ytsearch5:IETF 121 QUIC 2024-11-07")
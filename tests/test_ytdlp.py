@@ -0,0 +1,134 @@
+"""Unit tests for ietf2vcon.ytdlp module."""
+
+import io
+import subprocess
+
+import pytest
+
+from ietf2vcon import youtube
+from ietf2vcon.youtube import NoCaptionsError, YouTubeResolver
+from ietf2vcon.ytdlp import InProcessYtDlp
+
+VIDEO_URL = "https://www.youtube.com/watch?v=DfNKgMvbn1o"
+
+VIDEO_INFO = {
+    "id": "DfNKgMvbn1o",
+    "title": "IETF121-VCON-20241107-0930",
+    "duration": 5400.0,
+    "upload_date": "20241107",
+    "subtitles": {},
+    "automatic_captions": {
+        "en": [
+            {"ext": "vtt", "url": "https://captions.example/en.vtt"},
+            {"ext": "json3", "url": "https://captions.example/en.json3"},
+        ],
+        "de": [{"ext": "json3", "url": "https://captions.example/de.json3"}],
+    },
+}
+
+
+class DownloadError(Exception):
+    """Stands in for yt_dlp.utils.DownloadError (matched by name)."""
+
+
+class FakeYoutubeDL:
+    """Records how the YoutubeDL API is used."""
+
+    instances: list["FakeYoutubeDL"] = []
+
+    def __init__(self, params):
+        self.params = params
+        self.extracted = []
+        FakeYoutubeDL.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def extract_info(self, url, download=False):
+        self.extracted.append(url)
+        if url.startswith("ytsearch"):
+            return {"entries": [{"id": "x1", "title": "Unrelated"}, dict(VIDEO_INFO)]}
+        if "missing" in url:
+            raise DownloadError("Video unavailable")
+        if download:
+            return {"requested_downloads": [{"filepath": "/tmp/audio.mp3"}]}
+        return VIDEO_INFO
+
+    def urlopen(self, url):
+        return io.BytesIO(b'{"events": []}')
+
+
+def _resolver(tmp_path):
+    FakeYoutubeDL.instances = []
+    return YouTubeResolver(tmp_path, ytdlp=InProcessYtDlp(factory=FakeYoutubeDL))
+
+
+class TestInProcessYtDlp:
+    """Tests for the resolver running yt-dlp in-process."""
+
+    def test_metadata_and_captions_share_one_extraction(self, tmp_path):
+        resolver = _resolver(tmp_path)
+
+        metadata = resolver.get_video_metadata(VIDEO_URL)
+        captions = resolver.get_available_captions(VIDEO_URL)
+        path = resolver.download_captions(VIDEO_URL)
+
+        assert metadata.title == "IETF121-VCON-20241107-0930"
+        assert metadata.duration_seconds == 5400
+        assert {"lang": "en", "auto": True} in captions
+        assert path == tmp_path / "captions" / "DfNKgMvbn1o.en.json3"
+        assert path.read_bytes() == b'{"events": []}'
+
+        assert len(FakeYoutubeDL.instances) == 1
+        assert FakeYoutubeDL.instances[0].extracted == [VIDEO_URL]
+
+    def test_missing_captions_distinguished(self, tmp_path):
+        resolver = _resolver(tmp_path)
+
+        assert resolver.download_captions(VIDEO_URL, lang="fr") is None
+        with pytest.raises(NoCaptionsError):
+            resolver.download_captions(VIDEO_URL, lang="fr", missing_ok=False)
+
+    def test_search_uses_flat_extraction(self, tmp_path):
+        resolver = _resolver(tmp_path)
+
+        video = resolver.search_session_video(121, "vcon", "2024-11-07")
+
+        assert video.video_id == "DfNKgMvbn1o"
+        assert FakeYoutubeDL.instances[0].params["extract_flat"] == "in_playlist"
+
+    def test_download_returns_final_path(self, tmp_path):
+        resolver = _resolver(tmp_path)
+
+        path = resolver.download_audio(VIDEO_URL)
+
+        assert str(path) == "/tmp/audio.mp3"
+        params = FakeYoutubeDL.instances[-1].params
+        assert params["postprocessors"][0]["key"] == "FFmpegExtractAudio"
+        assert not params["skip_download"]
+
+    def test_unavailable_video(self, tmp_path, monkeypatch):
+        """Test yt-dlp errors about the video do not start the command."""
+        monkeypatch.setattr(youtube.subprocess, "run", None)
+        resolver = _resolver(tmp_path)
+
+        assert resolver.get_video_metadata("https://www.youtube.com/watch?v=missing0000") is None
+
+    def test_api_breakage_falls_back_to_command(self, tmp_path, monkeypatch):
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "abc\nTitle\n60\n20241107\n\n\n", "")
+
+        def broken(params):
+            raise TypeError("unexpected keyword")
+
+        monkeypatch.setattr(youtube.subprocess, "run", run)
+        resolver = YouTubeResolver(tmp_path, ytdlp=InProcessYtDlp(factory=broken))
+
+        assert resolver.get_video_metadata(VIDEO_URL).title == "Title"
+        assert calls[0][0] == "yt-dlp"